@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Decompressed cache for FreeLaw .csv.bz2 bulk files
+The first complete read of an archive leaves a plain copy in a sibling
+.cache/ directory; later opens read that copy instead of re-running bz2
+Only archives up to CACHE_MAX_BYTES are cached unless the caller opts in,
+since a full dump decompresses to many times its size
+"""
+
+import bz2
+import io
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import IO, Optional, Union
+
+try:
+    import indexed_bzip2
+except ImportError:
+    # indexed_bzip2 is optional; fall back to an lbzip2/pbzip2 pipe or bz2
+    indexed_bzip2 = None
+
+try:
+    import zstandard
+except ImportError:
+    # zstandard is optional; zstd mirrors are then read through the zstd CLI
+    zstandard = None
+
+# Largest archive (compressed size) cached without an explicit cache=True
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Window used by recompress_to_zstd.py (--long=27); readers must allow it
+ZSTD_WINDOW_LOG = 27
+
+
+def exists_nonempty(file_path: Union[str, Path]) -> bool:
+    """Check with a single stat that a download exists and is not empty"""
+    try:
+        return os.stat(file_path).st_size > 0
+    except OSError:
+        return False
+
+
+class _PipeReader(io.RawIOBase):
+    """Raw reader over a decompressor's stdout that reaps the process on close"""
+
+    def __init__(self, process: subprocess.Popen):
+        self._process = process
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = self._process.stdout.readinto(buffer)
+        if not count and self._process.wait() != 0:
+            raise OSError(f"decompressor exited with status {self._process.returncode}")
+        return count
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._process.stdout.close()
+            if self._process.poll() is None:
+                self._process.kill()
+            self._process.wait()
+        finally:
+            super().close()
+
+
+def open_bz2(file_path: Union[str, Path]) -> IO[bytes]:
+    """
+    Open a .bz2 file for binary reading, decompressing blocks in parallel when possible
+    Uses indexed_bzip2 if installed, else an lbzip2 or pbzip2 pipe, else bz2
+    """
+    if indexed_bzip2 is not None:
+        return indexed_bzip2.IndexedBzip2File(str(file_path), parallelization=os.cpu_count())
+
+    for tool in ('lbzip2', 'pbzip2'):
+        executable = shutil.which(tool)
+        if executable:
+            process = subprocess.Popen([executable, '-dc', str(file_path)],
+                                       stdout=subprocess.PIPE, stdin=subprocess.DEVNULL)
+            return io.BufferedReader(_PipeReader(process), buffer_size=1 << 20)
+
+    return bz2.open(file_path, 'rb')
+
+
+def zstd_path_for(file_path: Union[str, Path]) -> Path:
+    """Path of the zstd mirror of a .csv.bz2 file (x.csv.bz2 -> x.csv.zst)"""
+    return Path(file_path).with_suffix('.zst')
+
+
+def _open_zstd_mirror(file_path: Path) -> Optional[IO[bytes]]:
+    """Open the zstd mirror of file_path if it is at least as new, else None"""
+    mirror_path = zstd_path_for(file_path)
+    try:
+        if os.stat(mirror_path).st_mtime_ns < os.stat(file_path).st_mtime_ns:
+            return None
+    except OSError:
+        return None
+
+    if zstandard is not None:
+        decompressor = zstandard.ZstdDecompressor(max_window_size=1 << ZSTD_WINDOW_LOG)
+        return io.BufferedReader(decompressor.stream_reader(open(mirror_path, 'rb'),
+                                                           read_across_frames=True),
+                                 buffer_size=1 << 20)
+
+    executable = shutil.which('zstd')
+    if executable:
+        process = subprocess.Popen([executable, '-dcq', f'--long={ZSTD_WINDOW_LOG}', str(mirror_path)],
+                                   stdout=subprocess.PIPE, stdin=subprocess.DEVNULL)
+        return io.BufferedReader(_PipeReader(process), buffer_size=1 << 20)
+
+    return None
+
+
+def open_archive(file_path: Union[str, Path]) -> IO[bytes]:
+    """
+    Open a .csv.bz2 file for binary reading, preferring a fresh .csv.zst mirror
+    zstd decodes several times faster than bz2; without a mirror this is open_bz2
+    """
+    mirror = _open_zstd_mirror(Path(file_path))
+    if mirror is not None:
+        return mirror
+    return open_bz2(file_path)
+
+
+def cache_path_for(file_path: Union[str, Path]) -> Path:
+    """Path of the decompressed copy of a .bz2 file"""
+    file_path = Path(file_path)
+    return file_path.parent / ".cache" / file_path.stem
+
+
+class _CachingReader(io.RawIOBase):
+    """
+    Raw reader over a bz2 stream that copies everything it reads to a partial
+    cache file, promoting it to the real cache path once the stream is exhausted
+    Closing before the end discards the partial copy, so a limited read never
+    pays to decompress more than it asked for. Caching is best-effort: if the
+    copy cannot be written, it is dropped and reading carries on uncached
+    """
+
+    def __init__(self, file_path: Path, cache_path: Path):
+        self._source = open_archive(file_path)
+        self._cache_path = cache_path
+        self._partial_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.partial")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._partial = open(self._partial_path, 'wb')
+        except OSError:
+            self._partial = None
+        self._complete = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._source.read(len(buffer))
+        if data:
+            if self._partial is not None:
+                try:
+                    self._partial.write(data)
+                except OSError:
+                    # Disk full or similar: give up on the cache, not the read
+                    self._discard_partial()
+            buffer[:len(data)] = data
+        else:
+            self._complete = True
+        return len(data)
+
+    def _discard_partial(self) -> None:
+        """Close and remove the partial cache file, ignoring errors"""
+        partial, self._partial = self._partial, None
+        try:
+            partial.close()
+        except OSError:
+            pass
+        try:
+            self._partial_path.unlink()
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._source.close()
+            if self._partial is not None:
+                if self._complete:
+                    try:
+                        self._partial.close()
+                        os.replace(self._partial_path, self._cache_path)
+                    except OSError:
+                        self._discard_partial()
+                else:
+                    self._discard_partial()
+        finally:
+            super().close()
+
+
+def open_csv_cached(file_path: Union[str, Path], mode: str = 'rt',
+                    cache: Optional[bool] = None) -> IO:
+    """
+    Open a .csv.bz2 file, reading its decompressed cache when one exists
+    and otherwise decompressing through open_archive
+    Accepts the same 'rt' / 'rb' modes as bz2.open. Without a fresh cache,
+    cache=True writes one while reading, cache=False never does, and the
+    default writes one only for archives up to CACHE_MAX_BYTES
+    """
+    file_path = Path(file_path)
+    cache_path = cache_path_for(file_path)
+
+    source_stat = os.stat(file_path)
+    try:
+        fresh = os.stat(cache_path).st_mtime_ns >= source_stat.st_mtime_ns
+    except OSError:
+        fresh = False
+
+    if cache is None:
+        cache = source_stat.st_size <= CACHE_MAX_BYTES
+
+    if fresh:
+        binary = open(cache_path, 'rb')
+    elif cache:
+        binary = io.BufferedReader(_CachingReader(file_path, cache_path), buffer_size=1 << 20)
+    else:
+        binary = open_archive(file_path)
+
+    if 'b' in mode:
+        return binary
+    return io.TextIOWrapper(binary, encoding='utf-8')
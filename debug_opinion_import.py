@@ -14,7 +14,7 @@ from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import OpinionType
 
 # Import necessary functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import OpinionCSVParser, parse_opinion_row
 
 def debug_opinion_import():
     """Debug the opinion import process step by step"""
@@ -17,7 +17,7 @@ from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import OpinionType
 
 # Import the parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import parse_opinion_row
 
 class EfficientOpinionParser:
     """Efficient parser that reconstructs CSV rows from multi-line HTML content"""
@@ -7,20 +7,22 @@ Now with resume capability and progress UI!
 
 import sys
 import csv
-import bz2
+import re
 import tempfile
 import io
 import argparse
 import threading
+from contextlib import nullcontext
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from datetime import date, datetime
+from typing import IO, Dict, Any, List, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.storage import CourtFinderStorage
+from courtfinder.storage import BatchWriter, CourtFinderStorage
 from courtfinder.models import Court, Docket, OpinionCluster, Opinion, Citation, Person, OpinionType
+from csv_cache import open_csv_cached
 from import_checkpoint import ImportCheckpoint
 from import_progress import ImportProgress
 try:
@@ -29,6 +31,11 @@ except ImportError:
     ImportUI = None
 from import_ui_rich import ImportUIRich
 
+# Layouts of FreeLaw dates and timestamps that fromisoformat reads exactly as
+# the strptime formats in FreeLawCSVParser do
+_ISO_DATE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+_ISO_DATETIME = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}(?: [0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{6})?)?')
+
 class FreeLawCSVParser:
     """Parser that handles the actual FreeLaw bulk CSV format"""
     
@@ -71,6 +78,11 @@ class FreeLawCSVParser:
         
         return FreeLawCSVParser.clean_value(value)
     
+    @staticmethod
+    def parse_code(value: str) -> str:
+        """Parse a low-cardinality string (state, gender, court id), interned so rows share one object"""
+        return sys.intern(FreeLawCSVParser.parse_string(value))
+    
     @staticmethod
     def parse_float(value: str) -> Optional[float]:
         """Parse float value"""
@@ -96,6 +108,13 @@ class FreeLawCSVParser:
         if not value:
             return None
         
+        # date.fromisoformat is C code; strptime is pure Python
+        if _ISO_DATE.fullmatch(value):
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                return None
+        
         try:
             return datetime.strptime(value, '%Y-%m-%d').date()
         except ValueError:
@@ -119,6 +138,14 @@ class FreeLawCSVParser:
             elif value.endswith('Z'):
                 value = value[:-1]
             
+            # The usual fixed-width layouts go through C-implemented
+            # fromisoformat; anything else falls back to strptime below
+            if _ISO_DATETIME.fullmatch(value):
+                try:
+                    return datetime.fromisoformat(value)
+                except ValueError:
+                    pass
+            
             # Try different datetime formats
             formats = [
                 '%Y-%m-%d %H:%M:%S.%f',
@@ -136,6 +163,10 @@ class FreeLawCSVParser:
         except Exception:
             return None
 
+# Whole-field patterns for is_valid_opinion_row; \s* stands in for str.strip()
+_BACKTICKED_NUMBER = re.compile(r'\s*`\d+`\s*')
+_BACKTICKED_TYPE_CODE = re.compile(r'\s*`[^<].*`\s*', re.DOTALL)
+
 class OpinionCSVParser:
     """
     Specialized CSV parser for opinions that handles HTML content properly
@@ -146,7 +177,7 @@ class OpinionCSVParser:
     def parse_opinion_csv(file_path: Path, limit: Optional[int] = None) -> List[Dict[str, str]]:
         """
         Parse opinion CSV file with proper HTML handling
-        Uses efficient line-by-line processing
+        Finds record boundaries with str.find instead of reading line by line
         
         Args:
             file_path: Path to the opinion CSV file
@@ -158,61 +189,91 @@ class OpinionCSVParser:
         valid_rows = []
         total_processed = 0
         
-        with bz2.open(file_path, 'rt', encoding='utf-8') as f:
+        with open_csv_cached(file_path) as f:
             # Get header
             header_line = f.readline().strip()
             expected_columns = header_line.split(',')
             
             print(f"  📝 CSV has {len(expected_columns)} columns")
             
-            # Process file efficiently
-            current_row_parts = []
-            in_record = False
+            # Records start at a line beginning with a backtick and run up to
+            # the next one, so jump between "\n`" boundaries with str.find
+            # rather than looping over every line of the HTML in between
             line_count = 0
+            records = OpinionCSVParser.iter_record_texts(f)
+            next(records)  # Anything before the first record start
             
-            for line in f:
-                line_count += 1
-                line = line.rstrip('\n\r')
-                
-                # Stop if we've processed enough
-                if limit and total_processed >= limit:
-                    break
+            for record_text in records:
+                lines_before = line_count
+                # The newline before the next record is not part of this one
+                line_count += record_text.count('\n') + (not record_text.endswith('\n'))
                 
-                # Check if this is the start of a new record
-                if line.startswith('`'):
-                    # Process previous record if exists
-                    if in_record and current_row_parts:
-                        complete_row = ''.join(current_row_parts)
-                        parsed_row = OpinionCSVParser.parse_csv_row(complete_row, expected_columns)
-                        if parsed_row and OpinionCSVParser.is_valid_opinion_row(parsed_row):
-                            valid_rows.append(parsed_row)
-                            total_processed += 1
-                            
-                            if total_processed % 10 == 0:
-                                print(f"  ✅ Found {total_processed} valid opinions so far...")
+                # A record's lines are joined without their line breaks
+                complete_row = record_text.replace('\n', '')
+                parsed_row = OpinionCSVParser.parse_csv_row(complete_row, expected_columns)
+                if parsed_row and OpinionCSVParser.is_valid_opinion_row(parsed_row):
+                    valid_rows.append(parsed_row)
+                    total_processed += 1
                     
-                    # Start new record
-                    current_row_parts = [line]
-                    in_record = True
+                    if total_processed % 10 == 0:
+                        print(f"  ✅ Found {total_processed} valid opinions so far...")
                     
-                elif in_record:
-                    # Continuation of current record
-                    current_row_parts.append(line)
+                    # Stop if we've processed enough
+                    if limit and total_processed >= limit:
+                        break
                 
                 # Progress update
-                if line_count % 100000 == 0:
+                if line_count // 100000 > lines_before // 100000:
                     print(f"  📊 Processed {line_count} lines, found {total_processed} valid opinions")
-            
-            # Process final record
-            if in_record and current_row_parts:
-                complete_row = ''.join(current_row_parts)
-                parsed_row = OpinionCSVParser.parse_csv_row(complete_row, expected_columns)
-                if parsed_row and OpinionCSVParser.is_valid_opinion_row(parsed_row):
-                    valid_rows.append(parsed_row)
-                    total_processed += 1
         
         return valid_rows
     
+    @staticmethod
+    def iter_record_texts(f, chunk_size: int = 1 << 20):
+        """
+        Split a text stream at every newline that is followed by a backtick
+        
+        FreeLaw opinion records start on a line beginning with a backtick and
+        may span many lines of HTML, so this is the record splitter for any
+        reader of the opinion CSVs. The newline before the next record is not
+        part of the yielded text; callers that want one row join the lines
+        with record_text.replace('\n', '').
+        
+        Args:
+            f: Text stream opened with universal newlines, positioned after
+                the header line
+            chunk_size: Number of characters read per call to f.read
+            
+        Yields:
+            The text before the first record start (usually empty), then the
+            text of each record with its inner line breaks kept
+        """
+        parts = []
+        carry = '\n'  # The first line can start a record too
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            data = carry + chunk
+            carry = ''
+            start = 0
+            while True:
+                boundary = data.find('\n`', start)
+                if boundary < 0:
+                    break
+                parts.append(data[start:boundary])
+                yield ''.join(parts)
+                parts = []
+                start = boundary + 1
+            # Hold back a trailing newline in case the next chunk opens a record
+            if data.endswith('\n'):
+                parts.append(data[start:-1])
+                carry = '\n'
+            else:
+                parts.append(data[start:])
+        parts.append(carry)
+        yield ''.join(parts)
+    
     @staticmethod
     def parse_csv_row(row_line: str, expected_columns: List[str]) -> Optional[Dict[str, str]]:
         """
@@ -257,46 +318,27 @@ class OpinionCSVParser:
         Returns:
             True if this looks like a valid opinion row
         """
-        # Check for required fields
-        opinion_id = row_dict.get('id', '').strip()
-        if not opinion_id:
+        # Opinion IDs should be numeric and wrapped in backticks
+        if not _BACKTICKED_NUMBER.fullmatch(row_dict.get('id', '')):
             return False
         
-        # Opinion IDs should be wrapped in backticks and be numeric
-        if not (opinion_id.startswith('`') and opinion_id.endswith('`')):
-            return False
-            
-        # Remove backticks and check if it's a valid integer
-        clean_id = opinion_id[1:-1]
-        if not clean_id.isdigit():
+        # Check if we have a reasonable type field: a backticked code, not HTML
+        if not _BACKTICKED_TYPE_CODE.fullmatch(row_dict.get('type', '')):
             return False
         
-        # Check if we have a reasonable type field
-        opinion_type = row_dict.get('type', '').strip()
-        if opinion_type and opinion_type.startswith('`') and opinion_type.endswith('`'):
-            clean_type = opinion_type[1:-1]
-            # Should be a valid opinion type code
-            if clean_type and not clean_type.startswith('<'):  # Not HTML
-                # Additional validation: check cluster_id
-                cluster_id = row_dict.get('cluster_id', '').strip()
-                
-                # cluster_id should either be empty or a valid integer in backticks
-                if cluster_id == '':
-                    return True  # Empty cluster_id is acceptable
-                
-                if cluster_id.startswith('`') and cluster_id.endswith('`'):
-                    clean_cluster_id = cluster_id[1:-1]
-                    if clean_cluster_id.isdigit():
-                        return True  # Valid cluster_id
-                
-                # If cluster_id doesn't look like a number, this row is probably corrupted
-                if '<' in cluster_id or '>' in cluster_id or len(cluster_id) > 50:
-                    return False
-                
-                # Accept it anyway if other fields look good
-                return True
+        # Additional validation: check cluster_id
+        cluster_id = row_dict.get('cluster_id', '').strip()
         
-        return False
+        # cluster_id should either be empty or a valid integer in backticks
+        if not cluster_id or _BACKTICKED_NUMBER.fullmatch(cluster_id):
+            return True
+        
+        # If cluster_id doesn't look like a number, this row is probably corrupted
+        if '<' in cluster_id or '>' in cluster_id or len(cluster_id) > 50:
+            return False
+        
+        # Accept it anyway if other fields look good
+        return True
     
     @staticmethod
     def parse_date(value: str) -> Optional[datetime]:
@@ -308,6 +350,13 @@ class OpinionCSVParser:
         if not value:
             return None
         
+        # date.fromisoformat is C code; strptime is pure Python
+        if _ISO_DATE.fullmatch(value):
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                return None
+        
         try:
             return datetime.strptime(value, '%Y-%m-%d').date()
         except ValueError:
@@ -331,6 +380,14 @@ class OpinionCSVParser:
             elif value.endswith('Z'):
                 value = value[:-1]
             
+            # The usual fixed-width layouts go through C-implemented
+            # fromisoformat; anything else falls back to strptime below
+            if _ISO_DATETIME.fullmatch(value):
+                try:
+                    return datetime.fromisoformat(value)
+                except ValueError:
+                    pass
+            
             # Try different datetime formats
             formats = [
                 '%Y-%m-%d %H:%M:%S.%f',
@@ -385,10 +442,21 @@ def parse_docket_row(row: Dict[str, str]) -> Docket:
     
     # Extract and clean the required fields
     docket_id = FreeLawCSVParser.parse_integer(row.get('id', ''))
-    court_id = FreeLawCSVParser.parse_string(row.get('court_id', ''))
+    court_id = FreeLawCSVParser.parse_code(row.get('court_id', ''))
     case_name = FreeLawCSVParser.parse_string(row.get('case_name', ''))
     docket_number = FreeLawCSVParser.parse_string(row.get('docket_number', ''))
-    source = FreeLawCSVParser.parse_string(row.get('source', ''))
+    source = FreeLawCSVParser.parse_code(row.get('source', ''))
+    
+    # Reject rows the Docket model would refuse (same checks and messages)
+    # before parsing the remaining date and text fields
+    if not docket_id:
+        raise ValueError("Docket ID is required")
+    if not court_id:
+        raise ValueError("Court ID is required")
+    if not case_name:
+        raise ValueError("Case name is required")
+    if not docket_number:
+        raise ValueError("Docket number is required")
     
     # Parse date fields
     date_created = FreeLawCSVParser.parse_datetime(row.get('date_created', ''))
@@ -408,15 +476,15 @@ def parse_docket_row(row: Dict[str, str]) -> Docket:
     case_name_full = FreeLawCSVParser.parse_string(row.get('case_name_full', ''))
     slug = FreeLawCSVParser.parse_string(row.get('slug', ''))
     appeal_from_str = FreeLawCSVParser.parse_string(row.get('appeal_from_str', ''))
-    appeal_from_id = FreeLawCSVParser.parse_string(row.get('appeal_from_id', ''))
+    appeal_from_id = FreeLawCSVParser.parse_code(row.get('appeal_from_id', ''))
     assigned_to_str = FreeLawCSVParser.parse_string(row.get('assigned_to_str', ''))
     referred_to_str = FreeLawCSVParser.parse_string(row.get('referred_to_str', ''))
     panel_str = FreeLawCSVParser.parse_string(row.get('panel_str', ''))
     docket_number_core = FreeLawCSVParser.parse_string(row.get('docket_number_core', ''))
     cause = FreeLawCSVParser.parse_string(row.get('cause', ''))
     nature_of_suit = FreeLawCSVParser.parse_string(row.get('nature_of_suit', ''))
-    jury_demand = FreeLawCSVParser.parse_string(row.get('jury_demand', ''))
-    jurisdiction_type = FreeLawCSVParser.parse_string(row.get('jurisdiction_type', ''))
+    jury_demand = FreeLawCSVParser.parse_code(row.get('jury_demand', ''))
+    jurisdiction_type = FreeLawCSVParser.parse_code(row.get('jurisdiction_type', ''))
     federal_dn_case_type = FreeLawCSVParser.parse_string(row.get('federal_dn_case_type', ''))
     federal_dn_office_code = FreeLawCSVParser.parse_string(row.get('federal_dn_office_code', ''))
     federal_defendant_number = FreeLawCSVParser.parse_string(row.get('federal_defendant_number', ''))
@@ -502,6 +570,9 @@ def parse_opinion_cluster_row(row: Dict[str, str]) -> OpinionCluster:
         scdb_votes_minority=scdb_votes_minority
     )
 
+# CourtListener opinion type codes, built once rather than per row
+_OPINION_TYPES = {member.value: member for member in OpinionType}
+
 def parse_opinion_row(row: Dict[str, str]) -> Opinion:
     """Parse an opinion row from FreeLaw CSV - FIXED with HTML-aware parsing"""
     
@@ -513,6 +584,13 @@ def parse_opinion_row(row: Dict[str, str]) -> Opinion:
     if opinion_id is None:
         raise ValueError("Missing required field: id")
     
+    # Reject rows the Opinion model would refuse (same checks and messages)
+    # before parsing the text, HTML and date fields
+    if not opinion_id:
+        raise ValueError("Opinion ID is required")
+    if not cluster_id:
+        raise ValueError("Cluster ID is required")
+    
     # Parse date fields
     date_created = FreeLawCSVParser.parse_datetime(row.get('date_created', ''))
     date_modified = FreeLawCSVParser.parse_datetime(row.get('date_modified', ''))
@@ -541,29 +619,9 @@ def parse_opinion_row(row: Dict[str, str]) -> Opinion:
         opinion_type = '100unknown'
     
     # Map opinion type to enum - FIXED with all CourtListener types
-    type_mapping = {
-        '010combined': OpinionType.COMBINED,
-        '015unamimous': OpinionType.UNANIMOUS,
-        '020lead': OpinionType.LEAD,
-        '025plurality': OpinionType.PLURALITY,
-        '030concurrence': OpinionType.CONCURRENCE,
-        '035concurrenceinpart': OpinionType.CONCUR_IN_PART,
-        '040dissent': OpinionType.DISSENT,
-        '050addendum': OpinionType.ADDENDUM,
-        '060remittitur': OpinionType.REMITTUR,
-        '070rehearing': OpinionType.REHEARING,
-        '080onthemerits': OpinionType.ON_THE_MERITS,
-        '090onmotiontostrike': OpinionType.ON_MOTION_TO_STRIKE,
-        '100trialcourt': OpinionType.TRIAL_COURT,
-        '999unknown': OpinionType.UNKNOWN
-    }
-    
-    opinion_type_enum = type_mapping.get(opinion_type, OpinionType.UNKNOWN)
-    
-    # Create Opinion object with cluster_id fallback
-    if cluster_id is None:
-        cluster_id = 0  # Use 0 as placeholder for corrupted data
+    opinion_type_enum = _OPINION_TYPES.get(opinion_type, OpinionType.UNKNOWN)
     
+    # Create Opinion object
     return Opinion(
         id=opinion_id,
         cluster_id=cluster_id,
@@ -616,7 +674,7 @@ def parse_court_row(row: Dict[str, str]) -> Court:
     court_id = FreeLawCSVParser.parse_string(row.get('id', ''))
     full_name = FreeLawCSVParser.parse_string(row.get('full_name', ''))
     short_name = FreeLawCSVParser.parse_string(row.get('short_name', ''))
-    jurisdiction = FreeLawCSVParser.parse_string(row.get('jurisdiction', ''))
+    jurisdiction = FreeLawCSVParser.parse_code(row.get('jurisdiction', ''))
     position = FreeLawCSVParser.parse_float(row.get('position', ''))
     citation_string = FreeLawCSVParser.parse_string(row.get('citation_string', ''))
     
@@ -690,17 +748,17 @@ def parse_person_row(row: Dict[str, str]) -> Person:
     
     # Parse location fields
     dob_city = FreeLawCSVParser.parse_string(row.get('dob_city', ''))
-    dob_state = FreeLawCSVParser.parse_string(row.get('dob_state', ''))
+    dob_state = FreeLawCSVParser.parse_code(row.get('dob_state', ''))
     dod_city = FreeLawCSVParser.parse_string(row.get('dod_city', ''))
-    dod_state = FreeLawCSVParser.parse_string(row.get('dod_state', ''))
+    dod_state = FreeLawCSVParser.parse_code(row.get('dod_state', ''))
     
     # Parse granularity fields
-    date_granularity_dob = FreeLawCSVParser.parse_string(row.get('date_granularity_dob', ''))
-    date_granularity_dod = FreeLawCSVParser.parse_string(row.get('date_granularity_dod', ''))
+    date_granularity_dob = FreeLawCSVParser.parse_code(row.get('date_granularity_dob', ''))
+    date_granularity_dod = FreeLawCSVParser.parse_code(row.get('date_granularity_dod', ''))
     
     # Parse other fields
-    gender = FreeLawCSVParser.parse_string(row.get('gender', ''))
-    religion = FreeLawCSVParser.parse_string(row.get('religion', ''))
+    gender = FreeLawCSVParser.parse_code(row.get('gender', ''))
+    religion = FreeLawCSVParser.parse_code(row.get('religion', ''))
     ftm_total_received = FreeLawCSVParser.parse_float(row.get('ftm_total_received', ''))
     ftm_eid = FreeLawCSVParser.parse_string(row.get('ftm_eid', ''))
     has_photo = FreeLawCSVParser.parse_boolean(row.get('has_photo', ''))
@@ -735,8 +793,13 @@ def import_data_type(storage: CourtFinderStorage, file_path: Path, data_type: st
                     parser_func, save_func, limit: Optional[int] = None,
                     checkpoint: Optional[ImportCheckpoint] = None,
                     progress: Optional[ImportProgress] = None,
-                    ui: Optional[ImportUI] = None) -> Dict[str, Any]:
-    """Import a specific data type from bz2 file with checkpoint and progress support"""
+                    ui: Optional[ImportUI] = None,
+                    source: Optional[IO[str]] = None) -> Dict[str, Any]:
+    """
+    Import a specific data type from bz2 file with checkpoint and progress support
+    source is an already-decompressed text stream of file_path's leading
+    rows (header included) to read instead of opening the archive again
+    """
     
     print(f"📦 Processing {file_path.name} ({data_type})...")
     
@@ -778,7 +841,9 @@ def import_data_type(storage: CourtFinderStorage, file_path: Path, data_type: st
         progress.start_data_type(data_type, str(file_path), estimated_total, resume_from)
     
     try:
-        with bz2.open(file_path, 'rt', encoding='utf-8') as f:
+        # Reads a zstd mirror or decompressed copy when one is up to date
+        with (nullcontext(source) if source is not None
+              else open_csv_cached(file_path, cache=False)) as f:
             # Handle complex CSV with embedded HTML and quotes
             reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
             
@@ -876,19 +941,22 @@ def import_opinions_html_aware(storage: CourtFinderStorage, file_path: Path,
         if not valid_rows:
             return {'success': False, 'error': 'No valid opinion rows found'}
         
+        # Opinions are saved 1000 at a time, rewriting the indexes once per batch
+        save_opinions = BatchWriter(storage.save_opinions_bulk, batch_size=1000)
+        
         # Process each valid row with detailed error reporting
         for row_num, row in enumerate(valid_rows, 1):
             try:
                 # Parse the row using the standard parser
                 obj = parse_opinion_row(row)
                 
-                # Save to storage
-                storage.save_opinion(obj)
+                # Queue for saving
+                save_opinions(obj)
                 
                 imported_count += 1
                 
                 if imported_count % 10 == 0:
-                    print(f"  📊 Imported {imported_count} opinions...")
+                    print(f"  📊 Queued {imported_count} opinions...")
                 
             except Exception as e:
                 error_count += 1
@@ -911,6 +979,14 @@ def import_opinions_html_aware(storage: CourtFinderStorage, file_path: Path,
                         traceback.print_exc()
                 
                 continue
+        
+        # Opinions the storage failed to write count as errors, not imports
+        save_opinions.flush()
+        unsaved = save_opinions.unsaved
+        if unsaved:
+            imported_count -= unsaved
+            error_count += unsaved
+            error_details['Failed to save opinion'] = unsaved
     
     except Exception as e:
         return {
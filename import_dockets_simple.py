@@ -6,7 +6,7 @@ Uses the same approach that worked for courts
 
 import sys
 import csv
-import bz2
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -15,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from courtfinder.csv_parser import BulkCSVParser
 from courtfinder.storage import CourtFinderStorage
+from csv_cache import open_csv_cached
 
 def import_dockets_simple():
     """Simple dockets import"""
@@ -40,12 +41,13 @@ def import_dockets_simple():
     print(f"📦 Processing {dockets_file.name}...")
     
     # Create temporary CSV file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as temp_file:
         temp_path = Path(temp_file.name)
         
-        # Decompress bz2 to temporary CSV file
-        with bz2.open(dockets_file, 'rt', encoding='utf-8') as bz2_file:
-            temp_file.write(bz2_file.read())
+        # Decompress bz2 to temporary CSV file, in parallel blocks when possible
+        # and copied in chunks rather than read whole into memory
+        with open_csv_cached(dockets_file, 'rb', cache=False) as bz2_file:
+            shutil.copyfileobj(bz2_file, temp_file, 1 << 20)
     
     print(f"📄 Decompressed to temporary file")
     
@@ -6,7 +6,6 @@ Processes the file in chunks to avoid memory issues
 
 import sys
 import csv
-import bz2
 from pathlib import Path
 
 # Add src to path
@@ -14,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from courtfinder.csv_parser import DocketCSVParser
 from courtfinder.storage import CourtFinderStorage
+from csv_cache import open_csv_cached
 
 def import_dockets_streaming():
     """Stream dockets import directly from bz2 file"""
@@ -37,13 +37,13 @@ def import_dockets_streaming():
     
     print(f"📦 Processing {dockets_file.name} (streaming)...")
     
-    # Stream directly from bz2 file
+    # Stream directly from bz2 file, decompressing blocks in parallel when possible
     imported_count = 0
     error_count = 0
     limit = 100  # Start with small limit
     
     try:
-        with bz2.open(dockets_file, 'rt', encoding='utf-8') as f:
+        with open_csv_cached(dockets_file, cache=False) as f:
             reader = csv.DictReader(f)
             
             for row_num, row in enumerate(reader, 1):
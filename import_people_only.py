@@ -8,7 +8,7 @@ sys.path.insert(0, str(Path.cwd() / 'src'))
 from courtfinder.storage import CourtFinderStorage
 
 # Import parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import import_data_type, parse_person_row
 
 # Create storage
 storage = CourtFinderStorage('real_data')
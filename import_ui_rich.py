@@ -24,6 +24,7 @@ class ImportUIRich:
         self.progress = progress_tracker
         self.console = Console()
         self._stop_event = threading.Event()
+        self._refresh_event = threading.Event()
         self._ui_thread = None
         self._errors = deque(maxlen=2)  # Keep only last 2 errors
         self._error_count = 0
@@ -68,6 +69,7 @@ class ImportUIRich:
             error_missing_other_task = progress_bar.add_task("[red]Other Errors %", total=20)  # Percentage of total records
             
             # Update loop
+            forced = False
             while not self._stop_event.is_set():
                 # Get overall stats
                 overall = self.progress.get_overall_progress()
@@ -145,14 +147,26 @@ class ImportUIRich:
                     progress_bar.update(error_missing_other_task, completed=min(other_percent, 20),
                                       description=f"[red]Other: {other_percent:.1f}% ({other_errors}/{self._total_processed})")
                 
-                time.sleep(0.5)
+                # A forced tick paints now that the bars hold the latest counts
+                if forced:
+                    progress_bar.refresh()
+                
+                # Wait for the next tick, or until force_refresh()/stop() wakes us
+                forced = self._refresh_event.wait(0.5)
+                if forced:
+                    self._refresh_event.clear()
     
     def stop(self):
         """Stop the UI"""
         self._stop_event.set()
+        self._refresh_event.set()
         if self._ui_thread:
             self._ui_thread.join(timeout=1)
     
+    def force_refresh(self):
+        """Wake the UI thread so it repaints with the current counts now"""
+        self._refresh_event.set()
+    
     def add_error(self, error_msg: str):
         """Add an error and categorize it for progress bars"""
         self._error_count += 1
@@ -15,7 +15,7 @@ from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import OpinionType
 
 # Import the parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import parse_opinion_row
 
 def minimal_test():
     """Test with one manually reconstructed opinion record"""
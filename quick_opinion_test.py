@@ -13,7 +13,7 @@ from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import OpinionType
 
 # Import just the parsing functions we need
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import OpinionCSVParser, parse_opinion_row
 
 def quick_test():
     """Quick test - just try to import 5 opinions"""
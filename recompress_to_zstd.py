@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Re-encode downloaded FreeLaw .csv.bz2 files as .csv.zst mirrors
+bz2 decoding is the bottleneck of every import and check script; once a
+mirror exists (and is newer than its .bz2), csv_cache reads it instead
+Requires the zstd command line tool
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from csv_cache import ZSTD_WINDOW_LOG, open_bz2, zstd_path_for
+
+def recompress(file_path: Path, level: int) -> bool:
+    """Write the zstd mirror of one archive; returns False on failure"""
+    mirror_path = zstd_path_for(file_path)
+    partial_path = mirror_path.with_name(mirror_path.name + ".partial")
+
+    cmd = ["zstd", f"-{level}", f"--long={ZSTD_WINDOW_LOG}", "-T0", "-q", "-f",
+           "-o", str(partial_path)]
+    if level > 19:
+        cmd.insert(1, "--ultra")
+
+    try:
+        with open_bz2(file_path) as source:
+            process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+            try:
+                shutil.copyfileobj(source, process.stdin, 1 << 20)
+            finally:
+                process.stdin.close()
+                returncode = process.wait()
+        if returncode != 0:
+            raise OSError(f"zstd exited with status {returncode}")
+        os.replace(partial_path, mirror_path)
+    except (OSError, EOFError) as e:
+        print(f"❌ {file_path.name}: {e}")
+        partial_path.unlink(missing_ok=True)
+        return False
+
+    print(f"✅ {mirror_path.name}: {file_path.stat().st_size:,} -> {mirror_path.stat().st_size:,} bytes")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-encode FreeLaw .csv.bz2 downloads as .csv.zst')
+    parser.add_argument('--dir', default='downloads',
+                       help='Directory with the .csv.bz2 files (default: downloads)')
+    parser.add_argument('--level', type=int, default=19,
+                       help='zstd compression level (default: 19)')
+    parser.add_argument('--force', action='store_true',
+                       help='Re-encode even when an up-to-date mirror exists')
+    args = parser.parse_args()
+
+    if shutil.which("zstd") is None:
+        print("❌ The zstd command line tool is not installed")
+        return 1
+
+    failed = 0
+    for file_path in sorted(Path(args.dir).glob("*.csv.bz2")):
+        mirror_path = zstd_path_for(file_path)
+        if (not args.force and mirror_path.exists()
+                and mirror_path.stat().st_mtime_ns >= file_path.stat().st_mtime_ns):
+            print(f"⏭️  {mirror_path.name} is up to date")
+            continue
+
+        print(f"📦 Re-encoding {file_path.name}...")
+        if not recompress(file_path, args.level):
+            failed += 1
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
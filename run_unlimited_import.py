@@ -35,7 +35,7 @@ def run_unlimited_import():
     start_time = time.time()
     
     # Import the main function
-    exec(open('import_ALL_freelaw_data_FIXED.py').read())
+    from import_ALL_freelaw_data_FIXED import main
     
     # Run the main import
     success = main()
@@ -13,7 +13,7 @@ from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import OpinionType
 
 # Import necessary functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import parse_opinion_row
 
 def simple_test():
     """Simple test - manually create an opinion row and test import"""
@@ -40,7 +40,11 @@ class OpinionType(Enum):
     UNKNOWN = "999unknown"
 
 
-@dataclass
+# Value -> member, so from_dict does one dict lookup per opinion
+_OPINION_TYPES = {member.value: member for member in OpinionType}
+
+
+@dataclass(slots=True)
 class Court:
     """
     Court model based on CourtListener Courts CSV structure
@@ -99,7 +103,7 @@ class Court:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Docket:
     """
     Docket model based on CourtListener Dockets CSV structure
@@ -228,7 +232,7 @@ class Docket:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OpinionCluster:
     """
     Opinion Cluster model based on CourtListener Opinion Clusters CSV structure
@@ -364,7 +368,7 @@ class OpinionCluster:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Opinion:
     """
     Opinion model based on CourtListener Opinions CSV structure
@@ -440,7 +444,7 @@ class Opinion:
             cluster_id=data['cluster_id'],
             date_created=datetime.fromisoformat(data['date_created']),
             date_modified=datetime.fromisoformat(data['date_modified']),
-            type=OpinionType(data['type']),
+            type=_OPINION_TYPES.get(data['type']) or OpinionType(data['type']),
             sha1=data.get('sha1'),
             page_count=data.get('page_count'),
             download_url=data.get('download_url'),
@@ -504,7 +508,7 @@ class Citation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """
     Person model based on CourtListener People CSV structure
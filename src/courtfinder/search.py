@@ -6,6 +6,8 @@ with filtering, sorting, and full-text search
 """
 
 import re
+from collections import defaultdict
+from functools import partial
 from typing import List, Dict, Any, Optional, Union, Callable, Set
 from dataclasses import dataclass, field
 from datetime import datetime, date
@@ -56,7 +58,7 @@ class SearchFilter:
             
             # Handle None values
             if field_value is None:
-                return self.value is None and self.operator == SearchOperator.EQUALS
+                return self.value is None and self.operator is SearchOperator.EQUALS
             
             # Convert to string for string operations
             if isinstance(field_value, str) and not self.case_sensitive:
@@ -64,37 +66,12 @@ class SearchFilter:
                 if isinstance(self.value, str):
                     self.value = self.value.lower()
             
-            # Apply operator
-            if self.operator == SearchOperator.EQUALS:
-                return field_value == self.value
-            elif self.operator == SearchOperator.CONTAINS:
-                return str(self.value) in str(field_value)
-            elif self.operator == SearchOperator.STARTS_WITH:
-                return str(field_value).startswith(str(self.value))
-            elif self.operator == SearchOperator.ENDS_WITH:
-                return str(field_value).endswith(str(self.value))
-            elif self.operator == SearchOperator.GREATER_THAN:
-                return field_value > self.value
-            elif self.operator == SearchOperator.LESS_THAN:
-                return field_value < self.value
-            elif self.operator == SearchOperator.GREATER_EQUAL:
-                return field_value >= self.value
-            elif self.operator == SearchOperator.LESS_EQUAL:
-                return field_value <= self.value
-            elif self.operator == SearchOperator.BETWEEN:
-                return self.value[0] <= field_value <= self.value[1]
-            elif self.operator == SearchOperator.IN:
-                return field_value in self.value
-            elif self.operator == SearchOperator.NOT_IN:
-                return field_value not in self.value
-            elif self.operator == SearchOperator.REGEX:
-                pattern = re.compile(str(self.value), re.IGNORECASE if not self.case_sensitive else 0)
-                return bool(pattern.search(str(field_value)))
-            elif self.operator == SearchOperator.FUZZY:
-                # Simple fuzzy matching using edit distance
-                return self._fuzzy_match(str(field_value), str(self.value))
-            
-            return False
+            # Apply operator: one dict lookup instead of a chain of enum
+            # member comparisons, each of which looks the member up on the class
+            test = _FILTER_TESTS.get(self.operator)
+            if test is None:
+                return False
+            return test(self, field_value)
             
         except Exception:
             return False
@@ -124,6 +101,32 @@ class SearchFilter:
         return d[len(text)][len(pattern)] <= max_distance
 
 
+def _regex_test(search_filter: SearchFilter, field_value: Any) -> bool:
+    """Search the field value for the filter's pattern"""
+    pattern = re.compile(str(search_filter.value),
+                         re.IGNORECASE if not search_filter.case_sensitive else 0)
+    return bool(pattern.search(str(field_value)))
+
+
+# SearchFilter.matches tests per operator, given the filter and a non-None field value
+_FILTER_TESTS: Dict[SearchOperator, Callable[[SearchFilter, Any], bool]] = {
+    SearchOperator.EQUALS: lambda f, field_value: field_value == f.value,
+    SearchOperator.CONTAINS: lambda f, field_value: str(f.value) in str(field_value),
+    SearchOperator.STARTS_WITH: lambda f, field_value: str(field_value).startswith(str(f.value)),
+    SearchOperator.ENDS_WITH: lambda f, field_value: str(field_value).endswith(str(f.value)),
+    SearchOperator.GREATER_THAN: lambda f, field_value: field_value > f.value,
+    SearchOperator.LESS_THAN: lambda f, field_value: field_value < f.value,
+    SearchOperator.GREATER_EQUAL: lambda f, field_value: field_value >= f.value,
+    SearchOperator.LESS_EQUAL: lambda f, field_value: field_value <= f.value,
+    SearchOperator.BETWEEN: lambda f, field_value: f.value[0] <= field_value <= f.value[1],
+    SearchOperator.IN: lambda f, field_value: field_value in f.value,
+    SearchOperator.NOT_IN: lambda f, field_value: field_value not in f.value,
+    SearchOperator.REGEX: _regex_test,
+    # Simple fuzzy matching using edit distance
+    SearchOperator.FUZZY: lambda f, field_value: f._fuzzy_match(str(field_value), str(f.value)),
+}
+
+
 @dataclass
 class SortCriteria:
     """Sort criteria for search results"""
@@ -208,6 +211,70 @@ class SearchResult:
         return self.query.offset + len(self.results) < self.filtered_count
 
 
+def _trigrams(text: str) -> Set[str]:
+    """Distinct three-character substrings of already case-folded text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _field_text(field_name: str, obj: Any) -> Optional[str]:
+    """Field value as the string CONTAINS filters compare against"""
+    value = getattr(obj, field_name, None)
+    return None if value is None else str(value)
+
+
+class _TextSnapshot:
+    """
+    Objects of one storage held in memory, with trigram postings built on demand
+
+    Postings only narrow the candidates: every survivor is still checked by the
+    query's own filters, so substring semantics are unchanged. Text is
+    case-folded, which is a per-character mapping, so any substring match (case
+    sensitive or not) also matches after folding.
+    """
+
+    def __init__(self, objects: List[Any], total_count: int):
+        self.objects = objects
+        self.total_count = total_count
+        self._postings: Dict[Any, Dict[str, Set[int]]] = {}
+
+    def _postings_for(self, key: Any, text_of: Callable[[Any], Optional[str]]) -> Dict[str, Set[int]]:
+        postings = self._postings.get(key)
+        if postings is None:
+            postings = defaultdict(set)
+            for position, obj in enumerate(self.objects):
+                text = text_of(obj)
+                if text:
+                    for gram in _trigrams(text.casefold()):
+                        postings[gram].add(position)
+            self._postings[key] = postings
+        return postings
+
+    def candidates(self, query: 'SearchQuery', text_extractor: Callable[[Any], str]) -> List[Any]:
+        """Objects that can still match the query, in storage order"""
+        needles = [(('field', f.field), partial(_field_text, f.field), str(f.value))
+                   for f in query.filters
+                   if f.operator == SearchOperator.CONTAINS and f.value is not None]
+        if query.full_text_query:
+            needles.extend((('text',), text_extractor, term)
+                           for term in query.full_text_query.lower().split())
+
+        positions: Optional[Set[int]] = None
+        for key, text_of, needle in needles:
+            grams = _trigrams(needle.casefold())
+            if not grams:
+                continue
+            postings = self._postings_for(key, text_of)
+            for gram in sorted(grams, key=lambda g: len(postings.get(g, ()))):
+                hits = postings.get(gram, set())
+                positions = set(hits) if positions is None else positions & hits
+                if not positions:
+                    return []
+
+        if positions is None:
+            return self.objects
+        return [self.objects[position] for position in sorted(positions)]
+
+
 class CourtFinderSearch:
     """
     Main search engine for CourtFinder data
@@ -231,6 +298,30 @@ class CourtFinderSearch:
             Citation: self._extract_citation_text,
             Person: self._extract_person_text
         }
+        
+        # In-memory snapshots taken by build_text_index(), keyed by storage name
+        self._snapshots: Dict[str, _TextSnapshot] = {}
+    
+    def build_text_index(self) -> None:
+        """
+        Load every stored object once and answer later searches from memory
+        
+        Substring filters and full-text terms are narrowed with trigram
+        postings built the first time each field is searched. The snapshot does
+        not see later saves; call this again after importing, or
+        clear_text_index() to go back to reading storage on every search.
+        """
+        self._snapshots = {}
+        for storage_attr in ('courts', 'dockets', 'opinion_clusters',
+                             'opinions', 'citations', 'people'):
+            storage = getattr(self.storage, storage_attr)
+            all_ids = storage.list_all_ids()
+            objects = [obj for obj in map(storage.load, all_ids) if obj is not None]
+            self._snapshots[storage_attr] = _TextSnapshot(objects, len(all_ids))
+    
+    def clear_text_index(self) -> None:
+        """Drop the snapshots taken by build_text_index()"""
+        self._snapshots = {}
     
     def _extract_court_text(self, court: Court) -> str:
         """Extract searchable text from court"""
@@ -307,19 +398,25 @@ class CourtFinderSearch:
         """Search a specific storage"""
         start_time = datetime.now()
         
-        # Get storage instance
-        storage = getattr(self.storage, storage_attr)
+        text_extractor = self.text_extractors.get(model_class, lambda x: "")
+        snapshot = self._snapshots.get(storage_attr)
         
-        # Get all IDs
-        all_ids = storage.list_all_ids()
-        total_count = len(all_ids)
+        if snapshot is not None:
+            total_count = snapshot.total_count
+            objects = snapshot.candidates(query, text_extractor)
+        else:
+            # Get storage instance
+            storage = getattr(self.storage, storage_attr)
+            
+            # Get all IDs
+            all_ids = storage.list_all_ids()
+            total_count = len(all_ids)
+            objects = map(storage.load, all_ids)
         
         # Load and filter objects
         filtered_objects = []
-        text_extractor = self.text_extractors.get(model_class, lambda x: "")
         
-        for obj_id in all_ids:
-            obj = storage.load(obj_id)
+        for obj in objects:
             if obj is None:
                 continue
             
@@ -7,18 +7,37 @@ Uses JSON files for storing CourtListener data with efficient indexing
 import json
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional, TypeVar, Generic, Type, Union
+from typing import List, Dict, Any, Optional, TypeVar, Generic, Type, Union, Iterable, Callable
 from datetime import datetime, date
 from dataclasses import asdict
 import gzip
+import queue
 import threading
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library codec
+    orjson = None
 
 from .models import Court, Docket, OpinionCluster, Opinion, Citation, Person
 
 T = TypeVar('T')
 
 
+def _dumps(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 class StorageError(Exception):
     """Base exception for storage operations"""
     pass
@@ -62,8 +81,8 @@ class FileStorage(Generic[T]):
         index_file = self.index_path / filename
         if index_file.exists():
             try:
-                with open(index_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(index_file, 'rb') as f:
+                    return _loads(f.read())
             except (json.JSONDecodeError, IOError):
                 pass
         return default
@@ -71,8 +90,8 @@ class FileStorage(Generic[T]):
     def _save_index(self, filename: str, index: dict):
         """Save index to file"""
         index_file = self.index_path / filename
-        with open(index_file, 'w', encoding='utf-8') as f:
-            json.dump(index, f, ensure_ascii=False, indent=2)
+        with open(index_file, 'wb') as f:
+            f.write(_dumps(index))
     
     def _get_file_path(self, item_id: Union[int, str]) -> Path:
         """Get file path for an item"""
@@ -95,23 +114,23 @@ class FileStorage(Generic[T]):
     
     def _save_data(self, file_path: Path, data: dict):
         """Save data to file with optional compression"""
-        json_data = json.dumps(data, ensure_ascii=False, indent=2)
+        json_data = _dumps(data)
         
         if self.use_compression:
-            with gzip.open(file_path, 'wt', encoding='utf-8') as f:
+            with gzip.open(file_path, 'wb') as f:
                 f.write(json_data)
         else:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(file_path, 'wb') as f:
                 f.write(json_data)
     
     def _load_data(self, file_path: Path) -> dict:
         """Load data from file with optional compression"""
         if self.use_compression:
-            with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-                return json.load(f)
+            with gzip.open(file_path, 'rb') as f:
+                return _loads(f.read())
         else:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return _loads(f.read())
     
     def _update_indexes(self, item_id: Union[int, str], item: T):
         """Update indexes for an item"""
@@ -299,6 +318,107 @@ class FileStorage(Generic[T]):
         }
 
 
+class BatchWriter(Generic[T]):
+    """
+    Buffer items handed over one at a time and save them in batches
+    Drop-in for a per-item save callback; call flush() once the last item is in,
+    or finish() to also settle an import result with what the sink saved
+    
+    With max_pending, full batches are saved on a writer thread while the
+    caller keeps producing, and at most max_pending batches wait for it;
+    call close() when done to stop the thread
+    """
+    
+    def __init__(self, sink: Callable[[List[T]], int], batch_size: int = 100,
+                 max_pending: int = 0):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.buffer: List[T] = []
+        self.queued_count = 0
+        self.saved_count = 0
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        # saved_count as of the last flush()
+        self._flushed_count = 0
+        if max_pending:
+            self._queue = queue.Queue(maxsize=max_pending)
+            self._writer = threading.Thread(target=self._drain, name="BatchWriter", daemon=True)
+            self._writer.start()
+    
+    def __call__(self, item: T) -> bool:
+        self.buffer.append(item)
+        self.queued_count += 1
+        if len(self.buffer) >= self.batch_size:
+            if self._queue is None:
+                self.flush()
+            else:
+                self._queue.put(self.buffer)
+                self.buffer = []
+        return True
+    
+    def _drain(self) -> None:
+        """Writer thread: save queued batches until the None sentinel"""
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                if self._error is None:
+                    self.saved_count += self.sink(batch)
+            except BaseException as e:
+                # Reported to the caller by the next flush()
+                self._error = e
+            finally:
+                self._queue.task_done()
+    
+    def flush(self) -> int:
+        """Save buffered items and return how many the sink saved since the last flush"""
+        if self._queue is None:
+            if not self.buffer:
+                return 0
+            saved = self.sink(self.buffer)
+            self.buffer = []
+            self.saved_count += saved
+            return saved
+        
+        # Wait for the writer thread to save everything handed to it
+        if self.buffer:
+            self._queue.put(self.buffer)
+            self.buffer = []
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        saved = self.saved_count - self._flushed_count
+        self._flushed_count = self.saved_count
+        return saved
+    
+    @property
+    def unsaved(self) -> int:
+        """Items handed over that the sink has not saved, counting still-buffered ones"""
+        return self.queued_count - self.saved_count
+    
+    def finish(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Flush, then count items the sink failed to save as errors, not imports,
+        in a result with imported_count and error_count
+        """
+        self.flush()
+        unsaved = self.unsaved
+        if unsaved:
+            result['imported_count'] -= unsaved
+            result['error_count'] += unsaved
+        return result
+    
+    def close(self) -> None:
+        """Stop the writer thread, dropping nothing already handed to it"""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+
 class CourtFinderStorage:
     """
     Main storage coordinator for all CourtFinder data
@@ -320,18 +440,34 @@ class CourtFinderStorage:
         """Save court to storage"""
         return self.courts.save(court)
     
+    def save_courts_bulk(self, courts: Iterable[Court]) -> int:
+        """Save many courts with one index update"""
+        return self.courts.save_batch(list(courts))
+    
     def save_docket(self, docket: Docket) -> bool:
         """Save docket to storage"""
         return self.dockets.save(docket)
     
+    def save_dockets_bulk(self, dockets: Iterable[Docket]) -> int:
+        """Save many dockets with one index update"""
+        return self.dockets.save_batch(list(dockets))
+    
     def save_opinion_cluster(self, cluster: OpinionCluster) -> bool:
         """Save opinion cluster to storage"""
         return self.opinion_clusters.save(cluster)
     
+    def save_opinion_clusters_bulk(self, clusters: Iterable[OpinionCluster]) -> int:
+        """Save many opinion clusters with one index update"""
+        return self.opinion_clusters.save_batch(list(clusters))
+    
     def save_opinion(self, opinion: Opinion) -> bool:
         """Save opinion to storage"""
         return self.opinions.save(opinion)
     
+    def save_opinions_bulk(self, opinions: Iterable[Opinion]) -> int:
+        """Save many opinions with one index update"""
+        return self.opinions.save_batch(list(opinions))
+    
     def save_citation(self, citation: Citation) -> bool:
         """Save citation to storage"""
         # For citations, use a composite key
@@ -340,10 +476,21 @@ class CourtFinderStorage:
         citation.id = citation_id
         return self.citations.save(citation)
     
+    def save_citations_bulk(self, citations: Iterable[Citation]) -> int:
+        """Save many citations with one index update"""
+        citations = list(citations)
+        for citation in citations:
+            citation.id = f"{citation.citing_opinion_id}_{citation.cited_opinion_id}"
+        return self.citations.save_batch(citations)
+    
     def save_person(self, person: Person) -> bool:
         """Save person to storage"""
         return self.people.save(person)
     
+    def save_people_bulk(self, people: Iterable[Person]) -> int:
+        """Save many people with one index update"""
+        return self.people.save_batch(list(people))
+    
     def get_court(self, court_id: int) -> Optional[Court]:
         """Get court by ID"""
         return self.courts.load(court_id)
@@ -394,25 +541,38 @@ class CourtFinderStorage:
         """Search dockets by case name"""
         return self.dockets.find_by_field('case_name', case_name)
     
-    def get_storage_stats(self) -> Dict[str, Any]:
-        """Get comprehensive storage statistics"""
-        return {
-            'courts': self.courts.get_stats(),
-            'dockets': self.dockets.get_stats(),
-            'opinion_clusters': self.opinion_clusters.get_stats(),
-            'opinions': self.opinions.get_stats(),
-            'citations': self.citations.get_stats(),
-            'people': self.people.get_stats(),
-            'total_disk_usage': sum(
-                storage.get_stats()['disk_usage'] for storage in [
-                    self.courts, self.dockets, self.opinion_clusters,
-                    self.opinions, self.citations, self.people
-                ]
-            )
+    def get_storage_stats(self, only: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Get comprehensive storage statistics
+        only limits the scan to the named data types, e.g. only=['courts']
+        """
+        storages = {
+            'courts': self.courts,
+            'dockets': self.dockets,
+            'opinion_clusters': self.opinion_clusters,
+            'opinions': self.opinions,
+            'citations': self.citations,
+            'people': self.people,
         }
+        if only is not None:
+            storages = {name: storages[name] for name in only}
+        
+        stats: Dict[str, Any] = {name: storage.get_stats() for name, storage in storages.items()}
+        stats['total_disk_usage'] = sum(stat['disk_usage'] for stat in stats.values())
+        return stats
     
     def cleanup_indexes(self):
         """Clean up and rebuild all indexes"""
         for storage in [self.courts, self.dockets, self.opinion_clusters, 
                        self.opinions, self.citations, self.people]:
-            storage._save_indexes()
\ No newline at end of file
+            storage._save_indexes()
+
+
+@lru_cache(maxsize=4)
+def get_storage(base_path: str) -> CourtFinderStorage:
+    """
+    Shared CourtFinderStorage for base_path
+    Scripts that run in the same process reuse one instance (and its loaded
+    indexes) instead of rebuilding it for every check
+    """
+    return CourtFinderStorage(base_path)
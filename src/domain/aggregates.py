@@ -4,14 +4,21 @@ Domain Aggregates for CourtFinder
 Updated to work with CourtListener models and new data structures
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Iterator
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Union
 from datetime import datetime
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library encoder
+    orjson = None
+
 from .value_objects import (
-    DataFile, DataRange, QueryParams, CourtIdentifier, CaseMetadata,
-    DataFileStatus, ColumnCleaningRule, DEFAULT_COLUMN_CLEANING, PROBLEMATIC_COLUMNS
+    DataFile, DataRange, QueryParams, CompiledQuery, CourtIdentifier, CaseMetadata,
+    DataFileStatus, DatasetValidationStatus, ColumnCleaningRule,
+    DEFAULT_COLUMN_CLEANING, PROBLEMATIC_COLUMNS
 )
 from .events import (
     DataDownloadRequested, DataParsingCompleted, QueryExecuted, 
@@ -42,12 +49,27 @@ class BulkDataSet:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     events: List[DomainEvent] = field(default_factory=list)
+    _path_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _status_counts: Dict[DataFileStatus, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    # Failure reasons reported by validate_for_processing
+    VALIDATION_FAILURE_REASONS = {
+        DatasetValidationStatus.EMPTY: "No data files in dataset",
+        DatasetValidationStatus.OVERSIZED: "Dataset size exceeds 1GB limit",
+        DatasetValidationStatus.ERRORS: "Dataset contains files with errors",
+        DatasetValidationStatus.INCOMPLETE: "Not all files have been downloaded",
+    }
     
     def __post_init__(self):
         """Validate bulk dataset"""
         if not self.dataset_id:
             raise ValueError("Dataset ID cannot be empty")
         
+        # Index file paths for O(1) status updates (first occurrence wins)
+        for i, data_file in enumerate(self.data_files):
+            self._path_index.setdefault(data_file.path, i)
+            self._status_counts[data_file.status] = self._status_counts.get(data_file.status, 0) + 1
+        
         # Ensure total size is calculated
         if not self.total_size and self.data_files:
             self.total_size = sum(f.size for f in self.data_files if f.size)
@@ -56,19 +78,23 @@ class BulkDataSet:
         """Add a data file to the dataset"""
         data_file = DataFile(path=file_path)
         self.data_files.append(data_file)
+        self._path_index.setdefault(file_path, len(self.data_files) - 1)
+        self._status_counts[data_file.status] = self._status_counts.get(data_file.status, 0) + 1
         self.updated_at = datetime.now()
         self._update_total_size()
     
     def update_file_status(self, file_path: str, status: DataFileStatus, 
                           error_message: Optional[str] = None) -> None:
         """Update the status of a data file"""
-        for i, data_file in enumerate(self.data_files):
-            if data_file.path == file_path:
-                self.data_files[i] = data_file.with_status(status, error_message)
-                self.updated_at = datetime.now()
-                break
-        else:
+        index = self._path_index.get(file_path)
+        if index is None:
             raise ValueError(f"Data file not found: {file_path}")
+        
+        previous = self.data_files[index]
+        self.data_files[index] = previous.with_status(status, error_message)
+        self._status_counts[previous.status] -= 1
+        self._status_counts[status] = self._status_counts.get(status, 0) + 1
+        self.updated_at = datetime.now()
     
     def get_files_by_status(self, status: DataFileStatus) -> List[DataFile]:
         """Get all files with a specific status"""
@@ -78,17 +104,17 @@ class BulkDataSet:
         """Check if all files have been downloaded"""
         if not self.data_files:
             return False
-        return all(f.status == DataFileStatus.DOWNLOADED for f in self.data_files)
+        return self._status_counts.get(DataFileStatus.DOWNLOADED, 0) == len(self.data_files)
     
     def is_parsing_complete(self) -> bool:
         """Check if all files have been parsed"""
         if not self.data_files:
             return False
-        return all(f.status == DataFileStatus.PARSED for f in self.data_files)
+        return self._status_counts.get(DataFileStatus.PARSED, 0) == len(self.data_files)
     
     def has_errors(self) -> bool:
         """Check if any files have errors"""
-        return any(f.status == DataFileStatus.ERROR for f in self.data_files)
+        return self._status_counts.get(DataFileStatus.ERROR, 0) > 0
     
     def get_error_files(self) -> List[DataFile]:
         """Get all files with errors"""
@@ -96,36 +122,32 @@ class BulkDataSet:
     
     def validate_for_processing(self) -> bool:
         """Validate dataset is ready for processing"""
+        status = self._validation_status()
+        if status is DatasetValidationStatus.OK:
+            return True
+        
+        self._add_event(DataValidationFailed(
+            aggregate_id=self.dataset_id,
+            reason=self.VALIDATION_FAILURE_REASONS[status]
+        ))
+        return False
+    
+    def _validation_status(self) -> DatasetValidationStatus:
+        """Determine processing readiness, cheapest checks first"""
         if not self.data_files:
-            self._add_event(DataValidationFailed(
-                aggregate_id=self.dataset_id,
-                reason="No data files in dataset"
-            ))
-            return False
+            return DatasetValidationStatus.EMPTY
+        
+        # Check if total size is manageable (< 1GB)
+        if self.total_size and self.total_size > 1024 * 1024 * 1024:
+            return DatasetValidationStatus.OVERSIZED
         
         if self.has_errors():
-            self._add_event(DataValidationFailed(
-                aggregate_id=self.dataset_id,
-                reason="Dataset contains files with errors"
-            ))
-            return False
+            return DatasetValidationStatus.ERRORS
         
         if not self.is_download_complete():
-            self._add_event(DataValidationFailed(
-                aggregate_id=self.dataset_id,
-                reason="Not all files have been downloaded"
-            ))
-            return False
+            return DatasetValidationStatus.INCOMPLETE
         
-        # Check if total size is manageable (< 1GB)
-        if self.total_size and self.total_size > 1024 * 1024 * 1024:
-            self._add_event(DataValidationFailed(
-                aggregate_id=self.dataset_id,
-                reason="Dataset size exceeds 1GB limit"
-            ))
-            return False
-        
-        return True
+        return DatasetValidationStatus.OK
     
     def request_download(self, url: str) -> None:
         """Request download of bulk data"""
@@ -152,9 +174,9 @@ class BulkDataSet:
         """Add domain event"""
         self.events.append(event)
     
-    def get_events(self) -> List[DomainEvent]:
-        """Get all domain events"""
-        return self.events.copy()
+    def get_events(self) -> Tuple[DomainEvent, ...]:
+        """Get an immutable snapshot of all domain events"""
+        return tuple(self.events)
     
     def clear_events(self) -> None:
         """Clear all domain events"""
@@ -184,39 +206,83 @@ class CourtRecord:
     courtlistener_docket: Optional[Any] = None  # Docket object
     courtlistener_opinions: List[Any] = field(default_factory=list)  # Opinion objects
     
+    # Set once update_column_data has cleaned columns 12-18
+    _columns_cleaned: bool = field(default=False, init=False, repr=False, compare=False)
+    # (source data, text) for searchable_text
+    _searchable_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Flattened court/case fields for matches_query, rebuilt if the value objects are replaced
+    _court_data: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _court_data_source: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # attribute name -> (datetime, isoformat string), refreshed when the datetime is replaced
+    _iso_cache: Dict[str, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate court record"""
         if not self.record_id:
             raise ValueError("Record ID cannot be empty")
+        
+        self._build_court_data()
+    
+    def _build_court_data(self) -> None:
+        """Flatten court identifier and case metadata into a queryable dict"""
+        court_identifier = self.court_identifier
+        case_metadata = self.case_metadata
+        self._court_data = {
+            'jurisdiction': court_identifier.jurisdiction,
+            'court_name': court_identifier.court_name,
+            'court_code': court_identifier.court_code or '',
+            'case_number': case_metadata.case_number,
+            'filing_date': case_metadata.filing_date or '',
+            'parties': case_metadata.parties or '',
+            'case_type': case_metadata.case_type or '',
+            'status': case_metadata.status or ''
+        }
+        self._court_data_source = (court_identifier, case_metadata)
     
     def update_raw_data(self, data: Dict[str, Any]) -> None:
         """Update raw data"""
         self.raw_data = data
         self.updated_at = datetime.now()
     
-    def update_column_data(self, columns: List[str]) -> None:
-        """Update column data with cleaning for problematic columns"""
-        self.column_data = columns.copy()
+    def update_column_data(self, columns: List[str], take_ownership: bool = False) -> None:
+        """
+        Update column data with cleaning for problematic columns
+        
+        The record stores and cleans a copy of ``columns``; callers handing
+        over a list they no longer use can pass ``take_ownership=True`` to
+        skip the copy.
+        """
+        if not take_ownership:
+            columns = columns.copy()
+        self.column_data = columns
         self.updated_at = datetime.now()
         
         # Apply special handling for columns 12-18
         if len(columns) > PROBLEMATIC_COLUMNS.end_column:
-            cleaned_columns = columns.copy()
-            for i in range(PROBLEMATIC_COLUMNS.start_column, 
-                          min(PROBLEMATIC_COLUMNS.end_column + 1, len(columns))):
-                cleaned_columns[i] = DEFAULT_COLUMN_CLEANING.apply(columns[i])
-            self.column_data = cleaned_columns
+            start = PROBLEMATIC_COLUMNS.start_column
+            end = PROBLEMATIC_COLUMNS.end_column + 1
+            clean = DEFAULT_COLUMN_CLEANING.apply
+            columns[start:end] = [clean(value) for value in columns[start:end]]
+            self._columns_cleaned = True
+        else:
+            self._columns_cleaned = False
     
     def parse_structured_data(self, field_mapping: Dict[int, str]) -> None:
         """Parse column data into structured fields"""
         self.parsed_data = {}
         
+        columns = self.column_data
+        column_count = len(columns)
+        needs_cleaning = not self._columns_cleaned
+        start = PROBLEMATIC_COLUMNS.start_column
+        end = PROBLEMATIC_COLUMNS.end_column
+        
         for column_index, field_name in field_mapping.items():
-            if column_index < len(self.column_data):
-                value = self.column_data[column_index]
+            if column_index < column_count:
+                value = columns[column_index]
                 
                 # Apply additional cleaning if in problematic range
-                if PROBLEMATIC_COLUMNS.contains(column_index):
+                if needs_cleaning and start <= column_index <= end:
                     value = DEFAULT_COLUMN_CLEANING.apply(value)
                 
                 self.parsed_data[field_name] = value
@@ -232,29 +298,72 @@ class CourtRecord:
         """Check if record is valid"""
         return len(self.validation_errors) == 0
     
-    def matches_query(self, query: QueryParams) -> bool:
+    def matches_query(self, query: Union[QueryParams, CompiledQuery]) -> bool:
         """Check if record matches query parameters"""
+        query_field = query.field
+        
         # Check parsed data first
-        if query.matches(self.parsed_data):
+        if query_field in self.parsed_data and query.matches(self.parsed_data):
             return True
         
         # Check raw data
-        if query.matches(self.raw_data):
+        if query_field in self.raw_data and query.matches(self.raw_data):
             return True
         
+        # Searchable text is computed on demand unless stored in parsed data
+        if query_field == 'searchable_text' and query_field not in self.parsed_data:
+            return query.matches_value(self.searchable_text)
+        
         # Check specific fields
-        court_data = {
-            'jurisdiction': self.court_identifier.jurisdiction,
-            'court_name': self.court_identifier.court_name,
-            'court_code': self.court_identifier.court_code or '',
-            'case_number': self.case_metadata.case_number,
-            'filing_date': self.case_metadata.filing_date or '',
-            'parties': self.case_metadata.parties or '',
-            'case_type': self.case_metadata.case_type or '',
-            'status': self.case_metadata.status or ''
-        }
+        source = self._court_data_source
+        if source[0] is not self.court_identifier or source[1] is not self.case_metadata:
+            self._build_court_data()
         
-        return query.matches(court_data)
+        return query.matches(self._court_data)
+    
+    def iter_field_values(self) -> Iterator[Tuple[str, Any]]:
+        """Yield every (field, value) pair matches_query can match against"""
+        source = self._court_data_source
+        if source[0] is not self.court_identifier or source[1] is not self.case_metadata:
+            self._build_court_data()
+        
+        yield from self.parsed_data.items()
+        yield from self.raw_data.items()
+        yield from self._court_data.items()
+        if 'searchable_text' not in self.parsed_data:
+            yield 'searchable_text', self.searchable_text
+    
+    def field_values(self, field_name: str) -> Tuple[Any, ...]:
+        """Values of one field matches_query can match against, in the same order"""
+        values = []
+        if field_name in self.parsed_data:
+            values.append(self.parsed_data[field_name])
+        if field_name in self.raw_data:
+            values.append(self.raw_data[field_name])
+        if field_name == 'searchable_text':
+            if field_name not in self.parsed_data:
+                values.append(self.searchable_text)
+            return tuple(values)
+        
+        source = self._court_data_source
+        if source[0] is not self.court_identifier or source[1] is not self.case_metadata:
+            self._build_court_data()
+        if field_name in self._court_data:
+            values.append(self._court_data[field_name])
+        return tuple(values)
+    
+    @property
+    def searchable_text(self) -> str:
+        """
+        Searchable text, cached against the data it is built from
+        Comparing the key is cheap (unchanged items compare by identity), and
+        any edit, in place or by assignment, misses the cache
+        """
+        cache_key = (self.court_identifier, self.case_metadata,
+                     tuple(self.parsed_data.values()), tuple(self.column_data))
+        if self._searchable_cache is None or self._searchable_cache[0] != cache_key:
+            self._searchable_cache = (cache_key, self.get_searchable_text())
+        return self._searchable_cache[1]
     
     def get_searchable_text(self) -> str:
         """Get all searchable text combined"""
@@ -270,9 +379,8 @@ class CourtRecord:
         text_parts.extend(str(v) for v in self.parsed_data.values())
         
         # Add column data (excluding problematic columns that might have bad chars)
-        for i, col in enumerate(self.column_data):
-            if not PROBLEMATIC_COLUMNS.contains(i):
-                text_parts.append(col)
+        text_parts.extend(self.column_data[:PROBLEMATIC_COLUMNS.start_column])
+        text_parts.extend(self.column_data[PROBLEMATIC_COLUMNS.end_column + 1:])
         
         return ' '.join(text_parts)
     
@@ -293,9 +401,9 @@ class CourtRecord:
         """Add domain event"""
         self.events.append(event)
     
-    def get_events(self) -> List[DomainEvent]:
-        """Get all domain events"""
-        return self.events.copy()
+    def get_events(self) -> Tuple[DomainEvent, ...]:
+        """Get an immutable snapshot of all domain events"""
+        return tuple(self.events)
     
     def clear_events(self) -> None:
         """Clear all domain events"""
@@ -324,33 +432,59 @@ class CourtRecord:
     
     def get_enhanced_searchable_text(self) -> str:
         """Get enhanced searchable text including CourtListener data"""
-        text_parts = [self.get_searchable_text()]
+        text_parts = [self.searchable_text]
+        append = text_parts.append
         
         # Add CourtListener court text
-        if self.courtlistener_court and hasattr(self.courtlistener_court, 'full_name'):
-            text_parts.extend([
-                self.courtlistener_court.full_name,
-                self.courtlistener_court.jurisdiction,
-                getattr(self.courtlistener_court, 'citation_string', '')
-            ])
+        court = self.courtlistener_court
+        if court:
+            try:
+                full_name = court.full_name
+            except AttributeError:
+                pass
+            else:
+                append(full_name)
+                append(court.jurisdiction)
+                append(getattr(court, 'citation_string', ''))
         
         # Add CourtListener docket text
-        if self.courtlistener_docket and hasattr(self.courtlistener_docket, 'case_name'):
-            text_parts.extend([
-                self.courtlistener_docket.case_name,
-                self.courtlistener_docket.docket_number,
-                getattr(self.courtlistener_docket, 'case_name_full', '')
-            ])
-        
-        # Add CourtListener opinion text
+        docket = self.courtlistener_docket
+        if docket:
+            try:
+                case_name = docket.case_name
+            except AttributeError:
+                pass
+            else:
+                append(case_name)
+                append(docket.docket_number)
+                append(getattr(docket, 'case_name_full', ''))
+        
+        # Add CourtListener opinion text (first 1000 chars, no copy when shorter)
         for opinion in self.courtlistener_opinions:
-            if hasattr(opinion, 'plain_text') and opinion.plain_text:
-                text_parts.append(opinion.plain_text[:1000])  # First 1000 chars
+            try:
+                plain_text = opinion.plain_text
+            except AttributeError:
+                continue
+            if plain_text:
+                append(plain_text if len(plain_text) <= 1000 else plain_text[:1000])
         
-        return ' '.join(filter(None, text_parts))
+        return ' '.join([part for part in text_parts if part])
+    
+    def _isoformat(self, name: str) -> str:
+        """Get the ISO string for a datetime attribute, cached until it changes"""
+        value = getattr(self, name)
+        cached = self._iso_cache.get(name)
+        if cached is None or cached[0] is not value:
+            cached = (value, value.isoformat())
+            self._iso_cache[name] = cached
+        return cached[1]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage"""
+        return self._storage_dict(self._isoformat('created_at'), self._isoformat('updated_at'))
+    
+    def _storage_dict(self, created_at: Any, updated_at: Any) -> Dict[str, Any]:
+        """Build the storage dictionary around already-converted timestamps"""
         return {
             'record_id': self.record_id,
             'court_identifier': {
@@ -369,10 +503,18 @@ class CourtRecord:
             'parsed_data': self.parsed_data,
             'column_data': self.column_data,
             'validation_errors': self.validation_errors,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_at,
+            'updated_at': updated_at
         }
     
+    def to_orjson_bytes(self) -> bytes:
+        """Serialize to JSON bytes, using orjson when it is installed"""
+        if orjson is not None:
+            # orjson writes datetimes in the same ISO form as to_dict, natively
+            return orjson.dumps(self._storage_dict(self.created_at, self.updated_at))
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':'),
+                          default=str).encode('utf-8')
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CourtRecord':
         """Create from dictionary"""
@@ -383,6 +525,14 @@ class CourtRecord:
             court_code=court_id_data.get('court_code')
         )
         
+        # Accept datetimes directly so in-process round trips skip parsing
+        created_at = data['created_at']
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        updated_at = data['updated_at']
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at)
+        
         case_data = data['case_metadata']
         case_metadata = CaseMetadata(
             case_number=case_data['case_number'],
@@ -400,6 +550,106 @@ class CourtRecord:
             parsed_data=data.get('parsed_data', {}),
             column_data=data.get('column_data', []),
             validation_errors=data.get('validation_errors', []),
-            created_at=datetime.fromisoformat(data['created_at']),
-            updated_at=datetime.fromisoformat(data['updated_at'])
-        )
\ No newline at end of file
+            created_at=created_at,
+            updated_at=updated_at
+        )
+
+
+@dataclass
+class BulkRecordColumns:
+    """
+    Columnar batch of parsed court records
+    Stores one list per field instead of one CourtRecord per row;
+    records are only built when a row is requested
+    """
+    # Field order of the values passed to append
+    RECORD_FIELDS = (
+        'record_id', 'jurisdiction', 'court_name', 'court_code', 'case_number',
+        'filing_date', 'parties', 'case_type', 'status'
+    )
+    
+    field_mapping: Dict[int, str]
+    record_id: List[str] = field(default_factory=list)
+    jurisdiction: List[str] = field(default_factory=list)
+    court_name: List[str] = field(default_factory=list)
+    court_code: List[Optional[str]] = field(default_factory=list)
+    case_number: List[str] = field(default_factory=list)
+    filing_date: List[Optional[str]] = field(default_factory=list)
+    parties: List[Optional[str]] = field(default_factory=list)
+    case_type: List[Optional[str]] = field(default_factory=list)
+    status: List[Optional[str]] = field(default_factory=list)
+    column_data: List[List[str]] = field(default_factory=list)
+    # Derived per-row fields (one list each) merged into parsed_data by row()
+    computed_fields: Dict[str, List[Any]] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.record_id)
+    
+    def append(self, columns: List[str], values: tuple) -> None:
+        """Append one row given its columns and RECORD_FIELDS values"""
+        for name, value in zip(self.RECORD_FIELDS, values):
+            getattr(self, name).append(value)
+        self.column_data.append(columns)
+    
+    def row(self, index: int) -> CourtRecord:
+        """Build the CourtRecord for a row"""
+        record = CourtRecord(
+            record_id=self.record_id[index],
+            court_identifier=CourtIdentifier(
+                jurisdiction=self.jurisdiction[index],
+                court_name=self.court_name[index],
+                court_code=self.court_code[index]
+            ),
+            case_metadata=CaseMetadata(
+                case_number=self.case_number[index],
+                filing_date=self.filing_date[index],
+                parties=self.parties[index],
+                case_type=self.case_type[index],
+                status=self.status[index]
+            ),
+            column_data=self.column_data[index]
+        )
+        record.parse_structured_data(self.field_mapping)
+        for name, values in self.computed_fields.items():
+            record.parsed_data[name] = values[index]
+        return record
+    
+    def matching_rows(self, query: Union[QueryParams, CompiledQuery]) -> List[int]:
+        """
+        Get indices of rows matching a query, scanning only the columns
+        CourtRecord.matches_query would consult for the query field
+        """
+        matches_value = query.matches_value
+        matched = set()
+        
+        # Structured data mapped from the raw columns
+        for column_index, field_name in self.field_mapping.items():
+            if field_name == query.field:
+                matched.update(
+                    i for i, columns in enumerate(self.column_data)
+                    if column_index < len(columns) and matches_value(columns[column_index])
+                )
+        
+        # Derived fields live in parsed_data on the built records
+        if query.field in self.computed_fields:
+            matched.update(
+                i for i, value in enumerate(self.computed_fields[query.field])
+                if matches_value(value)
+            )
+        
+        # Court identifier and case metadata fields (None compares as '')
+        if query.field in self.RECORD_FIELDS and query.field != 'record_id':
+            matched.update(
+                i for i, value in enumerate(getattr(self, query.field))
+                if matches_value(value or '')
+            )
+        
+        # Searchable text combines the whole row, so build it per record
+        # unless the mapping stores it as a column
+        if query.field == 'searchable_text' and query.field not in self.field_mapping.values():
+            matched.update(
+                i for i in range(len(self))
+                if matches_value(self.row(i).searchable_text)
+            )
+        
+        return sorted(matched)
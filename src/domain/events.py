@@ -1,148 +1,126 @@
 """
 Domain Events for CourtFinder
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, Optional
-from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, List, Optional
+from abc import ABC, abstractmethod, update_abstractmethods
+from collections import defaultdict
+import operator
 
 
-@dataclass
+@dataclass(frozen=True)
 class DomainEvent(ABC):
     """Base class for all domain events"""
+    # Event type identifier, set by each subclass
+    event_type: ClassVar[str] = ""
+    
     aggregate_id: str
-    occurred_at: datetime = None
+    occurred_at: datetime = field(default=None, kw_only=True)
+    _serialized: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         if self.occurred_at is None:
             object.__setattr__(self, 'occurred_at', datetime.now())
     
-    @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
-        """Convert event to dictionary"""
-        pass
+        """
+        Convert event to dictionary
+        Built once (events are frozen); each call gets its own copy
+        """
+        serialized = self._serialized
+        if serialized is None:
+            serialized = self._build_dict()
+            object.__setattr__(self, '_serialized', serialized)
+        return dict(serialized)
     
-    @property
     @abstractmethod
-    def event_type(self) -> str:
-        """Get event type identifier"""
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the dictionary representation of the event"""
         pass
 
 
-@dataclass
+def _compiled_to_dict(cls):
+    """
+    Generate a specialized _build_dict for an event class from its fields
+    Keys are event_type, aggregate_id, the class's own fields, then occurred_at
+    """
+    own_fields = [
+        f.name for f in fields(cls)
+        if f.name not in ('aggregate_id', 'occurred_at') and not f.name.startswith('_')
+    ]
+    items = [f"'event_type': {cls.event_type!r}", "'aggregate_id': self.aggregate_id"]
+    items.extend(f"{name!r}: self.{name}" for name in own_fields)
+    items.append("'occurred_at': self.occurred_at.isoformat()")
+    
+    namespace: Dict[str, Any] = {}
+    exec(f"def _build_dict(self):\n    return {{{', '.join(items)}}}\n", {}, namespace)
+    build_dict = namespace['_build_dict']
+    build_dict.__qualname__ = f"{cls.__qualname__}._build_dict"
+    
+    cls._build_dict = build_dict
+    update_abstractmethods(cls)
+    return cls
+
+
+@_compiled_to_dict
+@dataclass(frozen=True)
 class DataDownloadRequested(DomainEvent):
     """Event raised when data download is requested"""
-    download_url: str
+    event_type: ClassVar[str] = "DataDownloadRequested"
     
-    @property
-    def event_type(self) -> str:
-        return "DataDownloadRequested"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'event_type': self.event_type,
-            'aggregate_id': self.aggregate_id,
-            'download_url': self.download_url,
-            'occurred_at': self.occurred_at.isoformat()
-        }
+    download_url: str
 
 
-@dataclass
+@_compiled_to_dict
+@dataclass(frozen=True)
 class DataParsingCompleted(DomainEvent):
     """Event raised when data parsing is completed"""
-    parsed_files: int
+    event_type: ClassVar[str] = "DataParsingCompleted"
     
-    @property
-    def event_type(self) -> str:
-        return "DataParsingCompleted"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'event_type': self.event_type,
-            'aggregate_id': self.aggregate_id,
-            'parsed_files': self.parsed_files,
-            'occurred_at': self.occurred_at.isoformat()
-        }
+    parsed_files: int
 
 
-@dataclass
+@_compiled_to_dict
+@dataclass(frozen=True)
 class QueryExecuted(DomainEvent):
     """Event raised when a query is executed"""
+    event_type: ClassVar[str] = "QueryExecuted"
+    
     query_field: str
     query_value: str
     matches: bool
-    
-    @property
-    def event_type(self) -> str:
-        return "QueryExecuted"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'event_type': self.event_type,
-            'aggregate_id': self.aggregate_id,
-            'query_field': self.query_field,
-            'query_value': self.query_value,
-            'matches': self.matches,
-            'occurred_at': self.occurred_at.isoformat()
-        }
 
 
-@dataclass
+@_compiled_to_dict
+@dataclass(frozen=True)
 class DataValidationFailed(DomainEvent):
     """Event raised when data validation fails"""
+    event_type: ClassVar[str] = "DataValidationFailed"
+    
     reason: str
     details: Optional[Dict[str, Any]] = None
-    
-    @property
-    def event_type(self) -> str:
-        return "DataValidationFailed"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'event_type': self.event_type,
-            'aggregate_id': self.aggregate_id,
-            'reason': self.reason,
-            'details': self.details,
-            'occurred_at': self.occurred_at.isoformat()
-        }
 
 
-@dataclass
+@_compiled_to_dict
+@dataclass(frozen=True)
 class ColumnCleaningApplied(DomainEvent):
     """Event raised when column cleaning is applied"""
+    event_type: ClassVar[str] = "ColumnCleaningApplied"
+    
     column_range: str
     cleaned_count: int
-    
-    @property
-    def event_type(self) -> str:
-        return "ColumnCleaningApplied"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'event_type': self.event_type,
-            'aggregate_id': self.aggregate_id,
-            'column_range': self.column_range,
-            'cleaned_count': self.cleaned_count,
-            'occurred_at': self.occurred_at.isoformat()
-        }
 
 
-@dataclass
+@_compiled_to_dict
+@dataclass(frozen=True)
 class RecordValidationFailed(DomainEvent):
     """Event raised when record validation fails"""
-    validation_errors: list
+    event_type: ClassVar[str] = "RecordValidationFailed"
     
-    @property
-    def event_type(self) -> str:
-        return "RecordValidationFailed"
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'event_type': self.event_type,
-            'aggregate_id': self.aggregate_id,
-            'validation_errors': self.validation_errors,
-            'occurred_at': self.occurred_at.isoformat()
-        }
+    validation_errors: list
 
 
 class EventStore:
@@ -150,25 +128,31 @@ class EventStore:
     
     def __init__(self):
         self.events: list[DomainEvent] = []
+        self._by_aggregate: Dict[str, List[DomainEvent]] = defaultdict(list)
+        self._by_type: Dict[str, List[DomainEvent]] = defaultdict(list)
     
     def append(self, event: DomainEvent) -> None:
         """Append event to store"""
         self.events.append(event)
+        self._by_aggregate[event.aggregate_id].append(event)
+        self._by_type[event.event_type].append(event)
     
     def get_events_for_aggregate(self, aggregate_id: str) -> list[DomainEvent]:
         """Get all events for a specific aggregate"""
-        return [event for event in self.events if event.aggregate_id == aggregate_id]
+        return list(self._by_aggregate.get(aggregate_id, ()))
     
     def get_events_by_type(self, event_type: str) -> list[DomainEvent]:
         """Get all events of a specific type"""
-        return [event for event in self.events if event.event_type == event_type]
+        return list(self._by_type.get(event_type, ()))
     
     def clear(self) -> None:
         """Clear all events"""
         self.events.clear()
+        self._by_aggregate.clear()
+        self._by_type.clear()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert event store to dictionary"""
         return {
-            'events': [event.to_dict() for event in self.events]
+            'events': list(map(operator.methodcaller('to_dict'), self.events))
         }
\ No newline at end of file
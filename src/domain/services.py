@@ -2,19 +2,28 @@
 Domain Services for CourtFinder
 Business logic that doesn't belong to any specific aggregate
 """
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Set, Tuple, Callable
 import re
 from datetime import datetime
-import hashlib
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain, count, islice
+import mmap
+import os
+import sys
 
-from .aggregates import BulkDataSet, CourtRecord
+from .aggregates import BulkDataSet, BulkRecordColumns, CourtRecord
 from .value_objects import (
-    DataFile, DataFileStatus, QueryParams, CourtIdentifier, CaseMetadata,
+    DataFile, DataFileStatus, QueryParams, QueryOperator, CourtIdentifier, CaseMetadata,
     DataRange, ColumnCleaningRule, PROBLEMATIC_COLUMNS, DEFAULT_COLUMN_CLEANING
 )
 from .events import ColumnCleaningApplied, RecordValidationFailed
 
 
+# Translation table deleting control characters other than \t, \n and \r
+_CONTROL_CHAR_DELETE = dict.fromkeys(i for i in range(32) if i not in (9, 10, 13))
+
+
 class DataValidationService:
     """Service for validating court data"""
     
@@ -78,68 +87,120 @@ class DataValidationService:
     @staticmethod
     def validate_column_data(columns: List[str]) -> List[str]:
         """Validate column data for common issues"""
+        # Fast path: one translate over the whole row when every column is clean
+        if None not in columns:
+            joined = ''.join(columns)
+            if len(joined.translate(_CONTROL_CHAR_DELETE)) == len(joined):
+                return []
+        
         errors = []
+        control_char_delete = _CONTROL_CHAR_DELETE
         
         for i, column in enumerate(columns):
             if column is None:
                 errors.append(f"Column {i} is None")
                 continue
             
+            # Count control characters by deleting them in C
+            control_chars = len(column) - len(column.translate(control_char_delete))
+            if not control_chars:
+                continue
+            
             # Check for null bytes
             if '\x00' in column:
                 errors.append(f"Column {i} contains null bytes")
             
             # Check for excessive control characters
-            control_chars = sum(1 for c in column if ord(c) < 32 and c not in '\n\t\r')
             if control_chars > len(column) * 0.1:  # More than 10% control chars
                 errors.append(f"Column {i} contains excessive control characters")
         
         return errors
+    
+    @staticmethod
+    def validate_column_data_batch(rows: List[List[str]]) -> List[List[str]]:
+        """Validate column data for many records, returning errors per record"""
+        try:
+            joined = ''.join(chain.from_iterable(rows))
+        except TypeError:
+            # Some column is None; validate row by row
+            joined = None
+        
+        if joined is not None and len(joined.translate(_CONTROL_CHAR_DELETE)) == len(joined):
+            return [[] for _ in rows]
+        
+        return [DataValidationService.validate_column_data(columns) for columns in rows]
 
 
 class ColumnCleaningService:
     """Service for cleaning problematic columns"""
     
+    PROBLEMATIC_INDICES = tuple(PROBLEMATIC_COLUMNS.indices())
+    
     @staticmethod
     def clean_record_columns(record: CourtRecord) -> CourtRecord:
         """Clean problematic columns in a record"""
         if not record.column_data:
             return record
         
-        cleaned_columns = record.column_data.copy()
+        columns = record.column_data
+        cleaned_columns = columns
         cleaning_applied = False
+        column_count = len(columns)
+        clean = DEFAULT_COLUMN_CLEANING.apply
         
-        for i in range(len(cleaned_columns)):
-            if PROBLEMATIC_COLUMNS.contains(i):
-                original = cleaned_columns[i]
-                cleaned = DEFAULT_COLUMN_CLEANING.apply(original)
-                
-                if cleaned != original:
-                    cleaned_columns[i] = cleaned
+        for i in ColumnCleaningService.PROBLEMATIC_INDICES:
+            if i >= column_count:
+                break
+            original = columns[i]
+            cleaned = clean(original)
+            
+            if cleaned != original:
+                # Copy on first change so clean rows allocate nothing
+                if not cleaning_applied:
+                    cleaned_columns = columns.copy()
                     cleaning_applied = True
+                cleaned_columns[i] = cleaned
         
         if cleaning_applied:
-            record.update_column_data(cleaned_columns)
-            
-            # Add event
-            record._add_event(ColumnCleaningApplied(
-                aggregate_id=record.record_id,
-                column_range=f"{PROBLEMATIC_COLUMNS.start_column}-{PROBLEMATIC_COLUMNS.end_column}",
-                cleaned_count=PROBLEMATIC_COLUMNS.size
-            ))
+            ColumnCleaningService._apply_cleaned_columns(record, cleaned_columns)
         
         return record
     
     @staticmethod
     def clean_columns_batch(records: List[CourtRecord]) -> List[CourtRecord]:
         """Clean columns for multiple records"""
-        cleaned_records = []
+        start = PROBLEMATIC_COLUMNS.start_column
+        end = PROBLEMATIC_COLUMNS.end_column + 1
         
-        for record in records:
-            cleaned_record = ColumnCleaningService.clean_record_columns(record)
-            cleaned_records.append(cleaned_record)
+        # Flatten the problematic slice of every record and clean it in one pass
+        originals = [value for record in records for value in record.column_data[start:end]]
+        cleaned = list(map(DEFAULT_COLUMN_CLEANING.apply, originals))
         
-        return cleaned_records
+        # Scatter the cleaned values back to the records that changed
+        offset = 0
+        for record in records:
+            width = max(0, min(end, len(record.column_data)) - start)
+            cleaned_slice = cleaned[offset:offset + width]
+            if cleaned_slice != originals[offset:offset + width]:
+                cleaned_columns = record.column_data.copy()
+                cleaned_columns[start:start + width] = cleaned_slice
+                ColumnCleaningService._apply_cleaned_columns(record, cleaned_columns)
+            offset += width
+        
+        return list(records)
+    
+    @staticmethod
+    def _apply_cleaned_columns(record: CourtRecord, cleaned_columns: List[str]) -> None:
+        """Store cleaned columns on a record and emit the cleaning event"""
+        # Callers pass a fresh copy, so the record can keep it
+        record.update_column_data(cleaned_columns, take_ownership=True)
+        
+        # Add event
+        record._add_event(ColumnCleaningApplied(
+            aggregate_id=record.record_id,
+            column_range=f"{PROBLEMATIC_COLUMNS.start_column}-{PROBLEMATIC_COLUMNS.end_column}",
+            cleaned_count=PROBLEMATIC_COLUMNS.size
+        ))
     
     @staticmethod
     def create_custom_cleaning_rule(
@@ -190,9 +251,11 @@ class DataParsingService:
         columns = line.split(delimiter)
         
         # Apply cleaning to problematic columns
-        for i in range(len(columns)):
-            if PROBLEMATIC_COLUMNS.contains(i):
-                columns[i] = DEFAULT_COLUMN_CLEANING.apply(columns[i])
+        start = PROBLEMATIC_COLUMNS.start_column
+        end = PROBLEMATIC_COLUMNS.end_column + 1
+        if len(columns) > start:
+            clean = DEFAULT_COLUMN_CLEANING.apply
+            columns[start:end] = [clean(value) for value in columns[start:end]]
         
         return columns
     
@@ -205,33 +268,23 @@ class DataParsingService:
         if field_mapping is None:
             field_mapping = DataParsingService.STANDARD_FIELD_MAPPING
         
-        # Extract required fields
-        record_id = columns[0] if len(columns) > 0 else str(hashlib.md5(str(columns).encode()).hexdigest())
-        
-        # Extract court identifier
-        jurisdiction = columns[8] if len(columns) > 8 else "Unknown"
-        court_name = columns[7] if len(columns) > 7 else "Unknown Court"
-        court_id = columns[6] if len(columns) > 6 else None
-        
-        court_identifier = CourtIdentifier(
-            jurisdiction=jurisdiction,
-            court_name=court_name,
-            court_code=court_id
-        )
+        return DataParsingService.get_row_parser(field_mapping)(columns)
+    
+    @staticmethod
+    def get_row_parser(field_mapping: Dict[int, str] = None) -> Callable[[List[str]], CourtRecord]:
+        """Get the compiled row parser for a field mapping (built once per mapping)"""
+        if field_mapping is None:
+            field_mapping = DataParsingService.STANDARD_FIELD_MAPPING
         
-        # Extract case metadata
-        case_number = columns[4] if len(columns) > 4 else "Unknown"
-        filing_date = columns[3] if len(columns) > 3 else None
-        case_type = columns[10] if len(columns) > 10 else None
-        status = columns[11] if len(columns) > 11 else None
+        return _cached_row_parser(tuple(field_mapping.items()))
+    
+    @staticmethod
+    def _parse_columns_generic(columns: List[str], field_mapping: Dict[int, str]) -> CourtRecord:
+        """Parse columns of any width into a CourtRecord"""
+        (record_id, jurisdiction, court_name, court_id, case_number,
+         filing_date, parties, case_type, status) = DataParsingService._extract_record_fields(columns)
         
-        # Handle parties (from problematic columns)
-        parties = None
-        if len(columns) > 12 and len(columns) > 13:
-            plaintiff = columns[12] if columns[12] else ""
-            defendant = columns[13] if columns[13] else ""
-            if plaintiff or defendant:
-                parties = f"{plaintiff} vs {defendant}".strip(" vs")
+        court_identifier = _shared_court_identifier(jurisdiction, court_name, court_id)
         
         case_metadata = CaseMetadata(
             case_number=case_number,
@@ -254,32 +307,234 @@ class DataParsingService:
         
         return record
     
+    @staticmethod
+    def _extract_record_fields(columns: List[str]) -> tuple:
+        """
+        Extract record identity, court and case fields from columns
+        Returns values in BulkRecordColumns.RECORD_FIELDS order
+        """
+        # Extract required fields
+        record_id = columns[0] if len(columns) > 0 else _fallback_record_id()
+        
+        # Extract court identifier
+        jurisdiction = _intern_value(columns[8]) if len(columns) > 8 else "Unknown"
+        court_name = columns[7] if len(columns) > 7 else "Unknown Court"
+        court_id = _intern_value(columns[6]) if len(columns) > 6 else None
+        
+        # Extract case metadata
+        case_number = columns[4] if len(columns) > 4 else "Unknown"
+        filing_date = columns[3] if len(columns) > 3 else None
+        case_type = _intern_value(columns[10]) if len(columns) > 10 else None
+        status = _intern_value(columns[11]) if len(columns) > 11 else None
+        
+        # Handle parties (from problematic columns)
+        plaintiff = columns[12] if len(columns) > 12 else ""
+        defendant = columns[13] if len(columns) > 13 else ""
+        parties = _format_parties(plaintiff, defendant)
+        
+        return (record_id, jurisdiction, court_name, court_id, case_number,
+                filing_date, parties, case_type, status)
+    
+    @staticmethod
+    def parse_raw_data_file_columnar(
+        file_path: str,
+        field_mapping: Dict[int, str] = None
+    ) -> BulkRecordColumns:
+        """Parse raw data file into a columnar batch without building records"""
+        if field_mapping is None:
+            field_mapping = DataParsingService.STANDARD_FIELD_MAPPING
+        
+        batch = BulkRecordColumns(field_mapping=field_mapping)
+        parse_line = DataParsingService.parse_raw_line
+        extract = DataParsingService._extract_record_fields
+        
+        try:
+            for line_number, line in _read_lines(file_path):
+                line = line.strip()
+                
+                if not line:
+                    continue
+                
+                columns = parse_line(line)
+                values = extract(columns)
+                # Same required fields the record and value objects enforce
+                if not (values[0] and values[1] and values[2] and values[4]):
+                    print(f"Error parsing line {line_number}: missing required record fields")
+                    continue
+                
+                batch.append(columns, values)
+        
+        except Exception as e:
+            raise ValueError(f"Failed to parse file {file_path}: {e}")
+        
+        return batch
+    
     @staticmethod
     def parse_raw_data_file(file_path: str) -> Iterator[CourtRecord]:
         """Parse raw data file into court records"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                line_number = 0
+            parse_line = DataParsingService.parse_raw_line
+            parse_columns = DataParsingService.get_row_parser()
+            
+            for line_number, line in _read_lines(file_path):
+                line = line.strip()
                 
-                for line in file:
-                    line_number += 1
-                    line = line.strip()
-                    
-                    if not line:
-                        continue
-                    
-                    try:
-                        columns = DataParsingService.parse_raw_line(line)
-                        if columns:
-                            record = DataParsingService.parse_columns_to_record(columns)
-                            yield record
-                    except Exception as e:
-                        # Log error but continue processing
-                        print(f"Error parsing line {line_number}: {e}")
-                        continue
+                if not line:
+                    continue
+                
+                try:
+                    columns = parse_line(line)
+                    if columns:
+                        record = parse_columns(columns)
+                        yield record
+                except Exception as e:
+                    # Log error but continue processing
+                    print(f"Error parsing line {line_number}: {e}")
+                    continue
         
         except Exception as e:
             raise ValueError(f"Failed to parse file {file_path}: {e}")
+    
+    @staticmethod
+    def parse_enriched_records(file_path: str) -> Iterator[CourtRecord]:
+        """
+        Parse, validate, clean and enrich records in one streaming pass
+        Pass straight to FileStorage.save_records_batch to import a file
+        without holding its records in a list between the steps
+        """
+        return map(RecordValidationService.validate_and_enrich_record,
+                   DataParsingService.parse_raw_data_file(file_path))
+
+
+# Shared instances of low-cardinality field values (jurisdiction, court code,
+# case type, status); values past the cap are kept as-is
+_INTERNED_VALUES: Dict[str, str] = {}
+_INTERNED_VALUES_LIMIT = 10000
+
+
+def _intern_value(value: str) -> str:
+    """Return the shared instance of a low-cardinality field value"""
+    interned = _INTERNED_VALUES.get(value)
+    if interned is None:
+        if len(_INTERNED_VALUES) >= _INTERNED_VALUES_LIMIT:
+            return value
+        interned = _INTERNED_VALUES.setdefault(value, sys.intern(value))
+    return interned
+
+
+# Flyweight CourtIdentifier instances; records share one per distinct court
+_shared_court_identifier = lru_cache(maxsize=16384)(CourtIdentifier)
+
+
+def _format_parties(plaintiff: str, defendant: str) -> Optional[str]:
+    """Combine plaintiff and defendant into a parties string"""
+    if plaintiff and defendant:
+        return plaintiff + " vs " + defendant
+    return plaintiff or defendant or None
+
+
+# Sequence for records parsed without an ID column
+_FALLBACK_RECORD_IDS = count(1)
+
+
+def _fallback_record_id() -> str:
+    """Assign a process-unique record ID when no ID column is present"""
+    return f"unidentified-{next(_FALLBACK_RECORD_IDS)}"
+
+
+def _build_row_parser(field_mapping: Dict[int, str]) -> Callable[[List[str]], CourtRecord]:
+    """
+    Compile a row parser specialized to a field mapping
+    Rows wide enough for every index used are parsed with constant indices;
+    shorter rows fall back to DataParsingService._parse_columns_generic
+    """
+    width = max([13, *field_mapping]) + 1
+    start = PROBLEMATIC_COLUMNS.start_column
+    end = PROBLEMATIC_COLUMNS.end_column
+    
+    parsed_items = []
+    for column_index, field_name in field_mapping.items():
+        value = f"c[{column_index}]"
+        if start <= column_index <= end:
+            value = f"_clean({value})"
+        parsed_items.append(f"{field_name!r}: {value}")
+    
+    source = f"""
+def _parse_row(c):
+    if len(c) < {width}:
+        return _generic(c, _mapping)
+    parties = _format_parties(c[12], c[13])
+    record = CourtRecord(
+        record_id=c[0],
+        court_identifier=_court_identifier(_intern(c[8]), c[7], _intern(c[6])),
+        case_metadata=CaseMetadata(case_number=c[4], filing_date=c[3], parties=parties,
+                                   case_type=_intern(c[10]), status=_intern(c[11])),
+        column_data=c
+    )
+    record.parsed_data = {{{', '.join(parsed_items)}}}
+    return record
+"""
+    namespace = {
+        'CourtRecord': CourtRecord,
+        '_court_identifier': _shared_court_identifier,
+        'CaseMetadata': CaseMetadata,
+        '_clean': DEFAULT_COLUMN_CLEANING.apply,
+        '_intern': _intern_value,
+        '_format_parties': _format_parties,
+        '_generic': DataParsingService._parse_columns_generic,
+        '_mapping': field_mapping,
+    }
+    exec(source, namespace)
+    return namespace['_parse_row']
+
+
+@lru_cache(maxsize=64)
+def _cached_row_parser(mapping_items: Tuple[Tuple[int, str], ...]) -> Callable[[List[str]], CourtRecord]:
+    """Row parser per distinct mapping contents, so equal mappings share one build"""
+    return _build_row_parser(dict(mapping_items))
+
+
+# Compile the standard mapping's parser at import so the first parsed row
+# does not pay for code generation
+DataParsingService.get_row_parser()
+
+
+def _read_lines(file_path: str, block_size: int = 1 << 22) -> Iterator[Tuple[int, str]]:
+    """
+    Yield numbered lines of a UTF-8 file from a read-only memory map
+    Lines break on \\n, \\r and \\r\\n as with text-mode universal newlines;
+    undecodable bytes are dropped
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped)
+            line_number = 0
+            position = 0
+            
+            while position < size:
+                # Cut each block after its last line break so no line spans blocks
+                window = block_size
+                while True:
+                    limit = min(position + window, size)
+                    if limit == size:
+                        end = size
+                        break
+                    end = max(mapped.rfind(b'\n', position, limit),
+                              mapped.rfind(b'\r', position, limit)) + 1
+                    if end > position:
+                        # Keep a \\r\\n pair together
+                        if mapped[end - 1] == 13 and end < size and mapped[end] == 10:
+                            end += 1
+                        break
+                    window *= 2
+                
+                for raw_line in mapped[position:end].splitlines():
+                    line_number += 1
+                    yield line_number, raw_line.decode('utf-8', errors='ignore')
+                position = end
 
 
 class QueryService:
@@ -288,8 +543,6 @@ class QueryService:
     @staticmethod
     def build_query(field: str, value: str, operator: str = "contains") -> QueryParams:
         """Build query parameters"""
-        from .value_objects import QueryOperator
-        
         op_mapping = {
             "equals": QueryOperator.EQUALS,
             "contains": QueryOperator.CONTAINS,
@@ -313,18 +566,20 @@ class QueryService:
         limit: Optional[int] = None
     ) -> List[CourtRecord]:
         """Execute search on records"""
-        results = []
-        count = 0
+        compiled = query.compile()
+        matched = (record for record in records if record.matches_query(compiled))
         
-        for record in records:
-            if limit and count >= limit:
-                break
-            
-            if record.matches_query(query):
-                results.append(record)
-                count += 1
-        
-        return results
+        return list(islice(matched, limit)) if limit else list(matched)
+    
+    @staticmethod
+    def execute_columnar_search(
+        batch: BulkRecordColumns,
+        query: QueryParams,
+        limit: Optional[int] = None
+    ) -> List[CourtRecord]:
+        """Execute search on a columnar batch, building only matching records"""
+        rows = batch.matching_rows(query.compile())
+        return [batch.row(i) for i in islice(rows, limit or None)]
     
     @staticmethod
     def build_text_search_query(search_text: str) -> QueryParams:
@@ -337,6 +592,85 @@ class QueryService:
         )
 
 
+class InvertedIndex:
+    """
+    Token index over record fields for answering CONTAINS queries
+    Posting sets narrow the records to scan; candidates are verified with
+    matches_query. Records must not change after being added.
+    """
+    
+    _TOKEN_PATTERN = re.compile(r'\w+')
+    
+    def __init__(self, records: Iterable[CourtRecord] = ()):
+        self.records: List[CourtRecord] = []
+        # field -> lowercased token -> record positions
+        self._postings: Dict[str, Dict[str, Set[int]]] = defaultdict(lambda: defaultdict(set))
+        
+        for record in records:
+            self.add(record)
+    
+    def add(self, record: CourtRecord) -> None:
+        """Add a record to the index"""
+        position = len(self.records)
+        self.records.append(record)
+        
+        find_tokens = self._TOKEN_PATTERN.findall
+        for field_name, value in record.iter_field_values():
+            field_postings = self._postings[field_name]
+            for token in find_tokens(str(value).lower()):
+                field_postings[token].add(position)
+    
+    def search(self, query: QueryParams, limit: Optional[int] = None) -> List[CourtRecord]:
+        """Search indexed records, scanning only candidates for CONTAINS queries"""
+        compiled = query.compile()
+        candidates = self._candidates(query)
+        
+        if candidates is None:
+            pool = iter(self.records)
+        else:
+            pool = (self.records[i] for i in sorted(candidates))
+        
+        matched = (record for record in pool if record.matches_query(compiled))
+        return list(islice(matched, limit)) if limit else list(matched)
+    
+    def _candidates(self, query: QueryParams) -> Optional[Set[int]]:
+        """Get positions that can match a query, or None when a full scan is needed"""
+        if query.operator != QueryOperator.CONTAINS:
+            return None
+        
+        value = query.value.lower()
+        words = list(self._TOKEN_PATTERN.finditer(value))
+        if not words:
+            return None
+        
+        field_postings = self._postings.get(query.field)
+        if field_postings is None:
+            return set()
+        
+        candidates = None
+        for word_match in words:
+            word = word_match.group()
+            open_start = word_match.start() == 0
+            open_end = word_match.end() == len(value)
+            
+            # Words cut off by the ends of the query may be part of longer tokens
+            if open_start and open_end:
+                tokens = [token for token in field_postings if word in token]
+            elif open_start:
+                tokens = [token for token in field_postings if token.endswith(word)]
+            elif open_end:
+                tokens = [token for token in field_postings if token.startswith(word)]
+            else:
+                tokens = [word] if word in field_postings else []
+            
+            positions = set().union(*(field_postings[token] for token in tokens))
+            candidates = positions if candidates is None else candidates & positions
+            if not candidates:
+                break
+        
+        return candidates
+
+
 class RecordValidationService:
     """Service for validating and enriching court records"""
     
@@ -362,16 +696,25 @@ class RecordValidationService:
         
         return record
     
+    @staticmethod
+    def enrich_batch(batch: BulkRecordColumns) -> BulkRecordColumns:
+        """
+        Compute the _enrich_record fields for a whole columnar batch
+        One pass per field over its column, stored as batch computed fields
+        """
+        batch.computed_fields['has_parties'] = list(map(bool, batch.parties))
+        batch.computed_fields['has_filing_date'] = list(map(bool, batch.filing_date))
+        batch.computed_fields['column_count'] = list(map(len, batch.column_data))
+        return batch
+    
     @staticmethod
     def _enrich_record(record: CourtRecord) -> CourtRecord:
         """Enrich record with additional computed fields"""
-        # Add searchable text
-        searchable_text = record.get_searchable_text()
-        record.parsed_data['searchable_text'] = searchable_text
+        # searchable_text is computed lazily by the record when queried
         
         # Add computed fields
         record.parsed_data['has_parties'] = bool(record.case_metadata.parties)
         record.parsed_data['has_filing_date'] = bool(record.case_metadata.filing_date)
         record.parsed_data['column_count'] = len(record.column_data)
         
-        return record
\ No newline at end of file
+        return record
@@ -252,12 +252,19 @@ class TestDataFactory:
         return "\n".join(lines)
     
     @staticmethod
-    def write_test_data_file(file_path: str) -> None:
-        """Write test data to file"""
-        content = TestDataFactory.create_test_file_content()
+    def write_test_data_file(file_path: str, copies: int = 1) -> None:
+        """Write test data to file, optionally repeating the sample lines"""
+        if copies == 1:
+            payload = _TEST_PAYLOAD
+        else:
+            payload = bytearray()
+            for _ in range(copies - 1):
+                payload.extend(_TEST_PAYLOAD)
+                payload.extend(b"\n")
+            payload.extend(_TEST_PAYLOAD)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with open(file_path, 'wb') as f:
+            f.write(payload)
     
     @staticmethod
     def create_dataset_with_problems() -> BulkDataSet:
@@ -293,6 +300,10 @@ class TestDataFactory:
         return dataset
 
 
+# Encoded test file content, built once for write_test_data_file
+_TEST_PAYLOAD = TestDataFactory.create_test_file_content().encode('utf-8')
+
+
 # Sample field mappings for different data formats
 SAMPLE_FIELD_MAPPINGS = {
     "standard": {
@@ -1,11 +1,14 @@
 """
 Value Objects for CourtFinder domain model
 """
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any, Callable, NamedTuple
 from pathlib import Path
 from enum import Enum
+from functools import lru_cache
 import os
+import re
+import sys
 
 
 class DataFileStatus(Enum):
@@ -18,6 +21,15 @@ class DataFileStatus(Enum):
     ERROR = "error"
 
 
+class DatasetValidationStatus(Enum):
+    """Outcome of validating a dataset for processing"""
+    OK = "ok"
+    EMPTY = "empty"
+    OVERSIZED = "oversized"
+    ERRORS = "errors"
+    INCOMPLETE = "incomplete"
+
+
 class QueryOperator(Enum):
     """Query operators for search"""
     EQUALS = "equals"
@@ -27,35 +39,67 @@ class QueryOperator(Enum):
     REGEX = "regex"
 
 
-@dataclass(frozen=True)
+def _cache_hash(cls):
+    """
+    Memoize a frozen dataclass's generated __hash__ in its _hash field
+    The cached value is dropped when pickling, since string hashes differ
+    between processes
+    """
+    compute_hash = cls.__hash__
+    get_state = cls.__getstate__
+    hash_index = [f.name for f in fields(cls)].index('_hash')
+    
+    def __hash__(self):
+        value = self._hash
+        if value is None:
+            value = compute_hash(self)
+            object.__setattr__(self, '_hash', value)
+        return value
+    
+    def __getstate__(self):
+        state = list(get_state(self))
+        state[hash_index] = None
+        return state
+    
+    cls.__hash__ = __hash__
+    cls.__getstate__ = __getstate__
+    return cls
+
+
+@_cache_hash
+@dataclass(frozen=True, slots=True)
 class DataFile:
     """Value object representing a data file"""
     path: str
     size: Optional[int] = None
     status: DataFileStatus = DataFileStatus.PENDING
     error_message: Optional[str] = None
+    _path_obj: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate data file"""
         if not self.path:
             raise ValueError("Data file path cannot be empty")
         
-        # Convert to Path object for validation
-        path_obj = Path(self.path)
+        object.__setattr__(self, '_path_obj', Path(self.path))
         
-        # If file exists, get its size
-        if path_obj.exists():
-            object.__setattr__(self, 'size', path_obj.stat().st_size)
+        # If file exists, get its size (one stat covers both)
+        try:
+            stat_result = os.stat(self.path)
+        except OSError:
+            return
+        object.__setattr__(self, 'size', stat_result.st_size)
     
     @property
     def exists(self) -> bool:
         """Check if file exists"""
-        return Path(self.path).exists()
+        return os.path.exists(self.path)
     
     @property
     def filename(self) -> str:
         """Get filename without path"""
-        return Path(self.path).name
+        return self._path_obj.name
     
     def with_status(self, status: DataFileStatus, error_message: Optional[str] = None) -> 'DataFile':
         """Create new DataFile with updated status"""
@@ -67,11 +111,15 @@ class DataFile:
         )
 
 
-@dataclass(frozen=True)
+@_cache_hash
+@dataclass(frozen=True, slots=True)
 class DataRange:
     """Value object representing a range of data columns"""
     start_column: int
     end_column: int
+    # Number of columns in the range, materialized once the range is validated
+    size: int = field(default=0, init=False, repr=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate data range"""
@@ -81,29 +129,33 @@ class DataRange:
             raise ValueError("End column must be non-negative")
         if self.start_column > self.end_column:
             raise ValueError("Start column must be less than or equal to end column")
-    
-    @property
-    def size(self) -> int:
-        """Get the size of the range"""
-        return self.end_column - self.start_column + 1
+        object.__setattr__(self, 'size', self.end_column - self.start_column + 1)
     
     def contains(self, column: int) -> bool:
         """Check if column is within range"""
         return self.start_column <= column <= self.end_column
     
+    def indices(self) -> range:
+        """Get the column indices covered by the range"""
+        return range(self.start_column, self.end_column + 1)
+    
     def overlaps_with(self, other: 'DataRange') -> bool:
         """Check if this range overlaps with another"""
         return (self.start_column <= other.end_column and 
                 self.end_column >= other.start_column)
 
 
-@dataclass(frozen=True)
+@_cache_hash
+@dataclass(frozen=True, slots=True)
 class QueryParams:
     """Value object representing search query parameters"""
     field: str
     value: str
     operator: QueryOperator = QueryOperator.CONTAINS
     case_sensitive: bool = False
+    _query_value: str = field(default="", init=False, repr=False, compare=False)
+    _predicate: Optional[Callable[[Any], bool]] = field(default=None, init=False, repr=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate query parameters"""
@@ -111,41 +163,120 @@ class QueryParams:
             raise ValueError("Query field cannot be empty")
         if not self.value:
             raise ValueError("Query value cannot be empty")
+        
+        # Field names are dict keys everywhere they are matched; interning
+        # lets lookups against literal keys short-circuit on identity
+        object.__setattr__(self, 'field', sys.intern(self.field))
+        
+        # Value compared against field values, case-folded once
+        object.__setattr__(
+            self, '_query_value', self.value if self.case_sensitive else self.value.lower()
+        )
+        
+        # Operator dispatch happens once here rather than on every match
+        object.__setattr__(self, '_predicate', self._build_predicate())
     
     def matches(self, data: Dict[str, Any]) -> bool:
         """Check if data matches this query"""
         if self.field not in data:
             return False
         
-        field_value = str(data[self.field])
-        query_value = self.value
+        return self._predicate(data[self.field])
+    
+    def matches_value(self, value: Any) -> bool:
+        """Check if a single field value matches this query"""
+        return self._predicate(value)
+    
+    def compile(self) -> 'CompiledQuery':
+        """Resolve operator, case folding and regex once for repeated matching"""
+        return CompiledQuery(field=self.field, value=self.value, predicate=self._predicate)
+    
+    def _build_predicate(self) -> Callable[[Any], bool]:
+        """Resolve the operator into a single field-value predicate"""
+        query_value = self._query_value
         
-        if not self.case_sensitive:
-            field_value = field_value.lower()
-            query_value = query_value.lower()
+        # Case-sensitive predicates test str(value) directly, one call per match
+        if self.case_sensitive:
+            if self.operator == QueryOperator.EQUALS:
+                return lambda value: str(value) == query_value
+            if self.operator == QueryOperator.CONTAINS:
+                return lambda value: query_value in str(value)
+            if self.operator == QueryOperator.STARTS_WITH:
+                return lambda value: str(value).startswith(query_value)
+            if self.operator == QueryOperator.ENDS_WITH:
+                return lambda value: str(value).endswith(query_value)
+            if self.operator == QueryOperator.REGEX:
+                search = _compile_pattern(self.value, False).search
+                return lambda value: search(str(value)) is not None
+            return lambda value: False
         
         if self.operator == QueryOperator.EQUALS:
-            return field_value == query_value
+            test = query_value.__eq__
         elif self.operator == QueryOperator.CONTAINS:
-            return query_value in field_value
+            test = lambda field_value: query_value in field_value
         elif self.operator == QueryOperator.STARTS_WITH:
-            return field_value.startswith(query_value)
+            test = lambda field_value: field_value.startswith(query_value)
         elif self.operator == QueryOperator.ENDS_WITH:
-            return field_value.endswith(query_value)
+            test = lambda field_value: field_value.endswith(query_value)
         elif self.operator == QueryOperator.REGEX:
-            import re
-            pattern = re.compile(query_value, re.IGNORECASE if not self.case_sensitive else 0)
-            return bool(pattern.search(field_value))
+            search = _compile_pattern(self.value, not self.case_sensitive).search
+            test = lambda field_value: search(field_value) is not None
+        else:
+            test = lambda field_value: False
         
-        return False
+        # Lowering never changes the length of ASCII text, so ASCII values of
+        # the wrong length are rejected without allocating a lowered copy
+        query_length = len(query_value)
+        if self.operator == QueryOperator.EQUALS:
+            def predicate(value: Any) -> bool:
+                field_value = str(value)
+                if len(field_value) != query_length and field_value.isascii():
+                    return False
+                return test(field_value.lower())
+        elif self.operator == QueryOperator.REGEX:
+            predicate = lambda value: test(str(value).lower())
+        else:
+            def predicate(value: Any) -> bool:
+                field_value = str(value)
+                if len(field_value) < query_length and field_value.isascii():
+                    return False
+                return test(field_value.lower())
+        return predicate
+    
+    def __reduce__(self):
+        # Rebuild through __init__; the predicate closure cannot be pickled
+        return (type(self), (self.field, self.value, self.operator, self.case_sensitive))
+
 
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str, ignore_case: bool) -> 're.Pattern':
+    """Compile a query regex once per pattern and case mode"""
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
 
-@dataclass(frozen=True)
+
+class CompiledQuery(NamedTuple):
+    """QueryParams with its matching predicate resolved ahead of time"""
+    field: str
+    value: str
+    predicate: Callable[[Any], bool]
+    
+    def matches(self, data: Dict[str, Any]) -> bool:
+        """Check if data matches this query"""
+        return self.field in data and self.predicate(data[self.field])
+    
+    def matches_value(self, value: Any) -> bool:
+        """Check if a single field value matches this query"""
+        return self.predicate(value)
+
+
+@_cache_hash
+@dataclass(frozen=True, slots=True)
 class CourtIdentifier:
     """Value object representing a court identifier"""
     jurisdiction: str
     court_name: str
     court_code: Optional[str] = None
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate court identifier"""
@@ -164,7 +295,8 @@ class CourtIdentifier:
         return self.full_name
 
 
-@dataclass(frozen=True)
+@_cache_hash
+@dataclass(frozen=True, slots=True)
 class CaseMetadata:
     """Value object representing case metadata"""
     case_number: str
@@ -172,6 +304,7 @@ class CaseMetadata:
     parties: Optional[str] = None
     case_type: Optional[str] = None
     status: Optional[str] = None
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate case metadata"""
@@ -186,7 +319,14 @@ class CaseMetadata:
 # Special handling for problematic columns 12-18
 PROBLEMATIC_COLUMNS = DataRange(12, 18)
 
-@dataclass(frozen=True)
+# Translation table deleting control characters other than tab and newline
+_CONTROL_CHARS = dict.fromkeys(c for c in range(32) if c not in (9, 10))
+
+_SURROGATES = re.compile('[\ud800-\udfff]')
+
+
+@_cache_hash
+@dataclass(frozen=True, slots=True)
 class ColumnCleaningRule:
     """Value object for column cleaning rules"""
     column_range: DataRange
@@ -194,6 +334,7 @@ class ColumnCleaningRule:
     trim_whitespace: bool = True
     remove_control_chars: bool = True
     encoding_fix: bool = True
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def apply(self, text: str) -> str:
         """Apply cleaning rules to text"""
@@ -202,17 +343,20 @@ class ColumnCleaningRule:
         
         result = str(text)
         
-        if self.remove_null_bytes:
-            result = result.replace('\x00', '')
+        if result.isprintable():
+            # Most values are: no control characters, null bytes or lone
+            # surrogates (none are printable), so only the trim can apply
+            return result.strip() if self.trim_whitespace else result
         
         if self.remove_control_chars:
-            # Remove control characters except newlines and tabs
-            result = ''.join(char for char in result 
-                           if ord(char) >= 32 or char in '\n\t')
+            # Remove control characters (null bytes included) except newlines and tabs
+            result = result.translate(_CONTROL_CHARS)
+        elif self.remove_null_bytes:
+            result = result.replace('\x00', '')
         
-        if self.encoding_fix:
-            # Try to fix common encoding issues
-            result = result.encode('utf-8', errors='ignore').decode('utf-8')
+        if self.encoding_fix and not result.isascii():
+            # Drop lone surrogates, the only code points UTF-8 cannot encode
+            result = _SURROGATES.sub('', result)
         
         if self.trim_whitespace:
             result = result.strip()
@@ -1,18 +1,35 @@
 """
 File-based storage system for CourtFinder
-Uses JSON files for data persistence
+Uses JSON files for data persistence; court records are packed into
+append-only shard files
 """
+import atexit
 import json
+import mmap
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Iterator
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Set, Tuple
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
 import shutil
+import struct
 import threading
+import time
+import weakref
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library codec
+    orjson = None
+
 from ..domain.aggregates import BulkDataSet, CourtRecord
-from ..domain.value_objects import DataFile, DataFileStatus, QueryParams
+from ..domain.value_objects import DataFile, DataFileStatus, QueryParams, QueryOperator, CompiledQuery
 from ..domain.events import DomainEvent, EventStore
 
 
@@ -31,11 +48,251 @@ class StorageCorruptedError(FileStorageError):
     pass
 
 
+def _dumps(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class _FieldValueIndex:
+    """
+    Values one query field can match in each stored record, keyed by blob
+    location, with locations grouped by exact and by case-folded value so
+    EQUALS lookups in either case mode are a dict lookup
+    A location's blob never changes until its shard is rewritten, which
+    makes the index stale, so entries only need adding and removing. Record
+    index changes are queued in pending and applied by the next search
+    
+    An index holds an entry for every stored record, roughly 300 to 400
+    bytes each (about 70 MB per field at 200k records), and is kept until a
+    shard is rewritten or the record index is reloaded
+    """
+    
+    def __init__(self, field: str):
+        self.field = field
+        self.values: Dict[Tuple[int, int, int], Tuple[str, ...]] = {}
+        self.by_value: Dict[str, Set[Tuple[int, int, int]]] = {}
+        self.by_folded: Dict[str, Set[Tuple[int, int, int]]] = {}
+        # (replaced location, new location, field values if known) per change
+        self.pending: List[Tuple[Optional[Tuple[int, int, int]], Optional[Tuple[int, int, int]],
+                                 Optional[Tuple[Any, ...]]]] = []
+        self.stale = False
+    
+    def add(self, location: Tuple[int, int, int], values: Tuple[Any, ...]) -> None:
+        keys = tuple(set(map(str, values)))
+        self.values[location] = keys
+        for key in keys:
+            self.by_value.setdefault(key, set()).add(location)
+        for key in set(key.lower() for key in keys):
+            self.by_folded.setdefault(key, set()).add(location)
+    
+    def remove(self, location: Tuple[int, int, int]) -> None:
+        keys = self.values.pop(location, ())
+        for groups, group_keys in ((self.by_value, keys), (self.by_folded, set(key.lower() for key in keys))):
+            for key in group_keys:
+                locations = groups[key]
+                locations.discard(location)
+                if not locations:
+                    del groups[key]
+    
+    def lookup(self, query: QueryParams) -> Set[Tuple[int, int, int]]:
+        """Locations whose values EQUALS-match the query"""
+        if query.case_sensitive:
+            return self.by_value.get(str(query.value), set())
+        return self.by_folded.get(query.value.lower(), set())
+
+
+class _RecordShard:
+    """
+    Append-only file of framed record blobs
+    Each frame is a header (blob length, record ID length), the UTF-8 record ID
+    and the blob; a zero-length blob marks the record as deleted
+    """
+    
+    HEADER = struct.Struct('<IH')
+    
+    def __init__(self, shard_id: int, path: Path):
+        self.shard_id = shard_id
+        self.path = path
+        self.is_new = False
+        self._file = None
+        self._map = None
+        # Inode of the indexed file and the end of its last indexed frame
+        self.inode: Optional[int] = None
+        self.scanned = 0
+        # End of the file while it is open for appending
+        self.end = 0
+        # Bytes held by overwritten records and tombstones
+        self.dead_bytes = 0
+    
+    @classmethod
+    def frame_size(cls, record_id: str, length: int) -> int:
+        """Bytes taken by the frame of a record ID and blob length"""
+        return cls.HEADER.size + len(record_id.encode('utf-8')) + length
+    
+    @classmethod
+    def encode_frame(cls, key: bytes, blob: bytes) -> bytes:
+        """Build a complete frame so it can be written with one call"""
+        return b''.join((cls.HEADER.pack(len(blob), len(key)), key, blob))
+    
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+    
+    def open(self) -> None:
+        """
+        Open the shard for appending, noting whether it starts out empty
+        The shard must be indexed up to date first: a frame torn by an
+        interrupted write is cut off here, so appends do not land behind it
+        """
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+            self.end = self._file.seek(0, os.SEEK_END)
+            self.is_new = self.end == 0
+            self.inode = os.fstat(self._file.fileno()).st_ino
+            if self.end > self.scanned:
+                self._file.truncate(self.scanned)
+                self.end = self.scanned
+    
+    def flush(self) -> None:
+        """Hand buffered appends to the operating system"""
+        if self._file is not None:
+            self._file.flush()
+    
+    def close(self, sync: bool = False) -> None:
+        """Flush and close the shard, optionally forcing it to disk"""
+        if self._file is not None:
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+    
+    def append(self, record_id: str, blob: bytes) -> Tuple[int, int]:
+        """
+        Append a frame and return the offset and length of its blob
+        The end offset is tracked rather than sought, since seeking flushes the
+        write buffer and would cost a write call per record in a batch
+        """
+        key = record_id.encode('utf-8')
+        start = self.end
+        self.end += self._file.write(self.encode_frame(key, blob))
+        return start + self.HEADER.size + len(key), len(blob)
+    
+    def read(self, offset: int, length: int) -> bytes:
+        """Read one blob through a read-only memory map of the shard"""
+        end = offset + length
+        mapped = self._map
+        if mapped is None or len(mapped) < end:
+            # The map has a fixed size; remap once appends have grown the file
+            mapped = self._remap()
+        return mapped[offset:end]
+    
+    def _remap(self) -> mmap.mmap:
+        """Map the shard's current contents, replacing any older map"""
+        if self._file is not None:
+            self._file.flush()
+        self.unmap()
+        with open(self.path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mapped, 'madvise'):
+            # Lookups jump around the shard; skip kernel read-ahead
+            mapped.madvise(mmap.MADV_RANDOM)
+        self._map = mapped
+        return mapped
+    
+    def unmap(self) -> None:
+        """Release the shard's memory map"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+    
+    def read_many(self, locations: List[Tuple[int, int]]) -> Iterator[bytes]:
+        """Read blobs in offset order with a single open; appends must be flushed"""
+        with open(self.path, 'rb') as f:
+            for offset, length in locations:
+                f.seek(offset)
+                yield f.read(length)
+    
+    def frames(self, start: int = 0) -> Iterator[Tuple[str, int, int]]:
+        """
+        Scan frame headers from a frame boundary, yielding record ID, blob
+        offset and blob length; scanned is left at the end of the last whole frame
+        """
+        header = self.HEADER
+        with open(self.path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            position = f.seek(start)
+            self.scanned = position
+            while True:
+                head = f.read(header.size)
+                if len(head) < header.size:
+                    break
+                length, key_length = header.unpack(head)
+                key = f.read(key_length)
+                offset = position + header.size + key_length
+                if len(key) < key_length or offset + length > size:
+                    # Frame cut short by an interrupted write
+                    break
+                try:
+                    record_id = key.decode('utf-8')
+                except UnicodeDecodeError:
+                    break
+                position = f.seek(length, os.SEEK_CUR)
+                self.scanned = position
+                yield record_id, offset, length
+
+
+def _flush_at_exit(storage_ref: 'weakref.ref[FileStorage]') -> None:
+    """Sync a deferred-sync storage's pending writes at interpreter exit"""
+    storage = storage_ref()
+    if storage is not None:
+        storage.flush()
+
+
 class FileStorage:
-    """File-based storage implementation"""
+    """
+    File-based storage implementation
+    Several instances may read the same directory and pick up each other's
+    records; writes should go through one instance at a time
     
-    def __init__(self, base_path: str = "data"):
+    With deferred_sync, save_record and delete_record return before the
+    write reaches disk: shards are synced every FLUSH_INTERVAL seconds, by
+    flush() or close(), and at interpreter exit. A crash can lose writes
+    made since the last sync.
+    """
+    
+    # Court records are spread over this many shard files
+    RECORD_SHARDS = 256
+    
+    # Threads reading shards ahead during record scans
+    READ_WORKERS = 16
+    
+    # Record blobs kept in memory for repeated load_record calls
+    RECORD_CACHE_SIZE = 10000
+    
+    # Records save_records_batch writes and syncs under one hold of the lock
+    SAVE_CHUNK_SIZE = 1000
+    
+    # Seconds between background syncs of shards written with deferred_sync
+    FLUSH_INTERVAL = 0.5
+    
+    # A synced shard is rewritten once overwritten and deleted records take
+    # at least this many bytes and half of the file
+    COMPACT_MIN_BYTES = 1 << 20
+    
+    # Fields whose EQUALS searches keep a value index in memory; searches on
+    # other fields scan the shards instead
+    VALUE_INDEX_FIELDS = frozenset({'jurisdiction', 'court_id'})
+    
+    def __init__(self, base_path: str = "data", deferred_sync: bool = False):
         self.base_path = Path(base_path)
+        self.deferred_sync = deferred_sync
         self.datasets_path = self.base_path / "datasets"
         self.records_path = self.base_path / "records"
         self.events_path = self.base_path / "events"
@@ -47,6 +304,36 @@ class FileStorage:
         
         # Initialize directories
         self._ensure_directories()
+        
+        # A blob location keeps its content until its shard is rewritten,
+        # which clears this cache; cache blobs by location
+        self._read_blob = lru_cache(maxsize=self.RECORD_CACHE_SIZE)(self._read_blob_uncached)
+        
+        # record_id -> (shard number, blob offset, blob length)
+        self._shards: Dict[int, _RecordShard] = {}
+        self._record_index: Dict[str, Tuple[int, int, int]] = {}
+        
+        # Shards with appends not yet synced, and the thread that syncs them
+        self._dirty_shards: Set[_RecordShard] = set()
+        self._flusher: Optional[threading.Thread] = None
+        
+        # Record scans in progress; shards are not rewritten under them
+        self._active_scans = 0
+        
+        # Value indexes for VALUE_INDEX_FIELDS, built by their first EQUALS
+        # search; indexes being built are tracked too, so they queue changes
+        self._value_indexes: Dict[str, _FieldValueIndex] = {}
+        self._tracked_value_indexes: List[_FieldValueIndex] = []
+        
+        # Whether records/ still holds one-file-per-record JSON from before the shards
+        self._has_legacy_records = False
+        
+        self._load_record_index()
+        
+        self._exit_hook = None
+        if deferred_sync:
+            self._exit_hook = partial(_flush_at_exit, weakref.ref(self))
+            atexit.register(self._exit_hook)
     
     def _ensure_directories(self) -> None:
         """Ensure all required directories exist"""
@@ -62,6 +349,377 @@ class FileStorage:
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
     
+    def _shard(self, shard_id: int) -> _RecordShard:
+        """Get the shard object for a shard number"""
+        shard = self._shards.get(shard_id)
+        if shard is None:
+            shard = _RecordShard(shard_id, self.records_path / f"{shard_id:02x}.shard")
+            self._shards[shard_id] = shard
+        return shard
+    
+    def _shard_for(self, record_id: str) -> int:
+        """Stable shard number for a record ID"""
+        return zlib.crc32(record_id.encode('utf-8')) % self.RECORD_SHARDS
+    
+    def _release_shards(self) -> None:
+        """Close shard files and drop shard objects and their memory maps"""
+        for shard in self._shards.values():
+            shard.close()
+            shard.unmap()
+        self._shards = {}
+        self._dirty_shards.clear()
+    
+    def _load_record_index(self) -> None:
+        """
+        Rebuild the record index from shard frame headers
+        Indexing stops at a frame torn by an interrupted write, or still being
+        written by another instance; the next append cuts it off. Legacy JSON
+        records not yet in the shards are then copied in, leaving the files in place
+        """
+        self._release_shards()
+        self._record_index = {}
+        self._read_blob.cache_clear()
+        self._drop_value_indexes()
+        with os.scandir(self.records_path) as entries:
+            shard_stats = [(int(entry.name[:-6], 16), entry.stat())
+                           for entry in entries if entry.name.endswith('.shard')]
+        
+        for shard_id, stat in shard_stats:
+            shard = self._shard(shard_id)
+            shard.inode = stat.st_ino
+            self._index_frames(shard, 0)
+        
+        self._migrate_legacy_records(remove_originals=False)
+    
+    def _index_frames(self, shard: _RecordShard, start: int) -> None:
+        """Index a shard's frames from a frame boundary onwards"""
+        index = self._record_index
+        frame_size = _RecordShard.frame_size
+        value_indexes = self._tracked_value_indexes
+        for record_id, offset, length in shard.frames(start):
+            previous = index.get(record_id)
+            if previous is not None:
+                self._shard(previous[0]).dead_bytes += frame_size(record_id, previous[2])
+            if length:
+                location = index[record_id] = (shard.shard_id, offset, length)
+            else:
+                location = None
+                index.pop(record_id, None)
+                shard.dead_bytes += frame_size(record_id, 0)
+            for value_index in value_indexes:
+                value_index.pending.append((previous, location, None))
+    
+    def _drop_value_indexes(self) -> None:
+        """Discard value indexes once locations they hold may no longer be valid"""
+        for value_index in self._tracked_value_indexes:
+            value_index.stale = True
+        self._tracked_value_indexes = []
+        self._value_indexes.clear()
+    
+    def _forget_shard(self, shard: _RecordShard) -> None:
+        """Drop a shard's records from the index before it is rescanned"""
+        shard.close()
+        shard.unmap()
+        self._dirty_shards.discard(shard)
+        shard_id = shard.shard_id
+        self._record_index = {
+            record_id: location for record_id, location in self._record_index.items()
+            if location[0] != shard_id
+        }
+        shard.inode = None
+        shard.scanned = 0
+        shard.dead_bytes = 0
+        self._read_blob.cache_clear()
+        self._drop_value_indexes()
+    
+    def _refresh_shard(self, shard_id: int, stat: Optional[os.stat_result]) -> None:
+        """
+        Bring one shard's index entries up to date with its file
+        Picks up frames appended by another instance, and rescans a shard
+        another instance rewrote (new inode) or removed (stat is None)
+        """
+        shard = self._shard(shard_id)
+        if stat is None or stat.st_ino != shard.inode:
+            if shard.inode is not None:
+                self._forget_shard(shard)
+            if stat is not None:
+                shard.inode = stat.st_ino
+                self._index_frames(shard, 0)
+        elif stat.st_size > shard.scanned:
+            self._index_frames(shard, shard.scanned)
+    
+    def _refresh_shard_file(self, shard_id: int) -> None:
+        """Refresh one shard from a fresh stat of its file"""
+        try:
+            stat = os.stat(self._shard(shard_id).path)
+        except FileNotFoundError:
+            stat = None
+        self._refresh_shard(shard_id, stat)
+    
+    def _refresh_index(self) -> None:
+        """Refresh every shard from one listing of the records directory"""
+        with os.scandir(self.records_path) as entries:
+            shard_stats = {int(entry.name[:-6], 16): entry.stat()
+                           for entry in entries if entry.name.endswith('.shard')}
+        
+        for shard_id in list(self._shards):
+            if shard_id not in shard_stats:
+                self._refresh_shard(shard_id, None)
+        for shard_id, stat in shard_stats.items():
+            self._refresh_shard(shard_id, stat)
+    
+    def migrate_legacy_records(self, remove_originals: bool = False) -> int:
+        """
+        Copy records saved as one JSON file each into the shards
+        Opening the storage already does this without removing anything;
+        records already in the shards are skipped. The original files are only
+        removed when asked, and only after the shards are synced.
+        Returns the number of records migrated.
+        """
+        with self._file_lock():
+            return self._migrate_legacy_records(remove_originals)
+    
+    def _migrate_legacy_records(self, remove_originals: bool) -> int:
+        """migrate_legacy_records; call with the lock held"""
+        with os.scandir(self.records_path) as entries:
+            legacy_files = [Path(entry.path) for entry in entries if entry.name.endswith('.json')]
+        
+        touched = set()
+        migrated = []
+        copied = 0
+        try:
+            for record_file in legacy_files:
+                # Legacy files are named after their record; ones already
+                # copied are skipped without being read again
+                if record_file.stem in self._record_index:
+                    migrated.append(record_file)
+                    continue
+                try:
+                    record = CourtRecord.from_dict(self._safe_read_json(record_file))
+                except (FileStorageError, ValueError, KeyError):
+                    # Leave unreadable files where they are
+                    continue
+                if record.record_id not in self._record_index:
+                    touched.add(self._append_record(record.record_id, record.to_orjson_bytes(), record))
+                    copied += 1
+                migrated.append(record_file)
+        finally:
+            self._sync_shards(touched)
+        
+        if remove_originals:
+            for record_file in migrated:
+                record_file.unlink()
+            legacy_files = [f for f in legacy_files if f not in migrated]
+        self._has_legacy_records = bool(legacy_files)
+        return copied
+    
+    def _sync_shards(self, shards: Iterable[_RecordShard]) -> None:
+        """
+        Close shards after a batch, forcing each to disk once
+        The records directory is synced once as well if the batch created shard
+        files; shards left mostly dead by the batch are then compacted
+        """
+        shards = list(shards)
+        created = False
+        for shard in shards:
+            created = created or shard.is_new
+            shard.close(sync=True)
+            self._dirty_shards.discard(shard)
+        
+        if created:
+            self._sync_directory()
+        
+        wasteful = [shard for shard in shards
+                    if shard.dead_bytes >= self.COMPACT_MIN_BYTES
+                    and shard.dead_bytes * 2 >= shard.scanned]
+        if wasteful and not self._active_scans:
+            self._compact_shards(wasteful)
+    
+    def _sync_directory(self) -> None:
+        """Force the records directory entries to disk"""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        try:
+            directory_fd = os.open(self.records_path, os.O_RDONLY | os.O_DIRECTORY)
+        except FileNotFoundError:
+            # Storage was removed while writes were pending
+            return
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+    
+    def _compact_shards(self, shards: List[_RecordShard]) -> None:
+        """Rewrite closed shards with only their live records; call with the lock held"""
+        live: Dict[int, List[Tuple[int, int, str]]] = {shard.shard_id: [] for shard in shards}
+        for record_id, (shard_id, offset, length) in self._record_index.items():
+            if shard_id in live:
+                live[shard_id].append((offset, length, record_id))
+        
+        header_size = _RecordShard.HEADER.size
+        for shard in shards:
+            shard.close()
+            shard.unmap()
+            temp_path = shard.path.with_name(shard.path.name + '.tmp')
+            relocated = {}
+            with open(shard.path, 'rb') as source, open(temp_path, 'wb') as target:
+                for offset, length, record_id in sorted(live[shard.shard_id]):
+                    source.seek(offset)
+                    key = record_id.encode('utf-8')
+                    position = target.tell()
+                    target.write(_RecordShard.encode_frame(key, source.read(length)))
+                    relocated[record_id] = (shard.shard_id, position + header_size + len(key), length)
+                target.flush()
+                os.fsync(target.fileno())
+                size = target.tell()
+            os.replace(temp_path, shard.path)
+            
+            self._record_index.update(relocated)
+            shard.inode = os.stat(shard.path).st_ino
+            shard.scanned = size
+            shard.dead_bytes = 0
+        
+        self._read_blob.cache_clear()
+        self._drop_value_indexes()
+        self._sync_directory()
+    
+    def compact_records(self) -> None:
+        """Rewrite every shard holding overwritten or deleted records"""
+        with self._file_lock():
+            self._refresh_index()
+            self._sync_shards(list(self._dirty_shards))
+            wasteful = [shard for shard in self._shards.values() if shard.dead_bytes]
+            if wasteful and not self._active_scans:
+                self._compact_shards(wasteful)
+    
+    def _append_record(self, record_id: str, blob: bytes,
+                       record: Optional[CourtRecord] = None) -> _RecordShard:
+        """
+        Append a record blob (empty for a delete) to its shard and update the
+        index; passing the record saves value indexes decoding the blob again
+        """
+        shard_id = self._shard_for(record_id)
+        shard = self._shard(shard_id)
+        if not shard.is_open:
+            # Index anything another instance appended before writing after it
+            self._refresh_shard_file(shard_id)
+            shard.open()
+        
+        offset, length = shard.append(record_id, blob)
+        previous = self._record_index.get(record_id)
+        if previous is not None:
+            shard.dead_bytes += _RecordShard.frame_size(record_id, previous[2])
+        if length:
+            location = self._record_index[record_id] = (shard_id, offset, length)
+        else:
+            location = None
+            self._record_index.pop(record_id, None)
+            shard.dead_bytes += _RecordShard.frame_size(record_id, 0)
+        for value_index in self._tracked_value_indexes:
+            values = record.field_values(value_index.field) if record is not None and length else None
+            value_index.pending.append((previous, location, values))
+        shard.scanned = offset + length
+        return shard
+    
+    def _written(self, shard: _RecordShard) -> None:
+        """
+        Sync a shard after save_record or delete_record, or with deferred_sync
+        leave it open for the background flusher; call with the lock held
+        """
+        if not self.deferred_sync:
+            self._sync_shards([shard])
+            return
+        
+        self._dirty_shards.add(shard)
+        if self._flusher is None:
+            # Daemon, so an unclosed storage does not hold up exit;
+            # the exit hook syncs whatever is still pending
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="FileStorage-flush", daemon=True
+            )
+            self._flusher.start()
+    
+    def _flush_loop(self) -> None:
+        """Sync dirty shards every FLUSH_INTERVAL until none are left"""
+        while True:
+            time.sleep(self.FLUSH_INTERVAL)
+            with self._file_lock():
+                if not self._dirty_shards:
+                    self._flusher = None
+                    return
+                self._sync_shards(list(self._dirty_shards))
+    
+    def flush(self) -> None:
+        """Force records written by save_record and delete_record to disk"""
+        with self._file_lock():
+            self._sync_shards(list(self._dirty_shards))
+    
+    def close(self) -> None:
+        """Sync pending writes and close shard files; later calls reopen them"""
+        with self._file_lock():
+            self._sync_shards(list(self._dirty_shards))
+            for shard in self._shards.values():
+                shard.close()
+                shard.unmap()
+        if self._exit_hook is not None:
+            atexit.unregister(self._exit_hook)
+            self._exit_hook = None
+    
+    def _read_blob_uncached(self, location: Tuple[int, int, int]) -> bytes:
+        """Read the blob stored at an index location"""
+        shard_id, offset, length = location
+        return self._shard(shard_id).read(offset, length)
+    
+    def _read_record(self, location: Tuple[int, int, int]) -> CourtRecord:
+        """Read and decode the record stored at an index location"""
+        return CourtRecord.from_dict(_loads(self._read_blob(location)))
+    
+    def _iter_stored_records(self) -> Iterator[CourtRecord]:
+        """
+        Stream stored records shard by shard in file order
+        Iterates a snapshot of the index, so the lock is not held while yielding;
+        upcoming shards are read ahead on a thread pool to overlap disk I/O
+        """
+        with self._file_lock():
+            self._refresh_index()
+            for shard in self._dirty_shards:
+                shard.flush()
+            by_shard: Dict[int, List[Tuple[int, int]]] = {}
+            for shard_id, offset, length in self._record_index.values():
+                by_shard.setdefault(shard_id, []).append((offset, length))
+            shards = {shard_id: self._shard(shard_id) for shard_id in by_shard}
+            # Snapshot offsets stay valid while no shard is compacted
+            self._active_scans += 1
+        
+        def read_shard(shard_id: int) -> List[bytes]:
+            return list(shards[shard_id].read_many(sorted(by_shard[shard_id])))
+        
+        executor = ThreadPoolExecutor(max_workers=self.READ_WORKERS)
+        try:
+            pending = deque()
+            for shard_id in sorted(by_shard):
+                pending.append(executor.submit(read_shard, shard_id))
+                if len(pending) < self.READ_WORKERS:
+                    continue
+                yield from self._decode_records(pending.popleft().result())
+            while pending:
+                yield from self._decode_records(pending.popleft().result())
+        finally:
+            # Stop reading ahead when the caller stops early
+            executor.shutdown(wait=True, cancel_futures=True)
+            with self._file_lock():
+                self._active_scans -= 1
+    
+    @staticmethod
+    def _decode_records(blobs: List[bytes]) -> Iterator[CourtRecord]:
+        """Decode record blobs, skipping corrupted ones"""
+        for blob in blobs:
+            try:
+                yield CourtRecord.from_dict(_loads(blob))
+            except (ValueError, KeyError, TypeError):
+                # Skip corrupted records
+                continue
+    
     @contextmanager
     def _file_lock(self):
         """Context manager for file operations"""
@@ -73,8 +731,8 @@ class FileStorage:
         temp_path = file_path.with_suffix('.tmp')
         
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            with open(temp_path, 'wb') as f:
+                f.write(_dumps(data))
             
             # Atomic move
             temp_path.replace(file_path)
@@ -90,8 +748,8 @@ class FileStorage:
             raise DataNotFoundError(f"File not found: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return _loads(f.read())
         except json.JSONDecodeError as e:
             raise StorageCorruptedError(f"Corrupted JSON file {file_path}: {e}")
         except Exception as e:
@@ -160,77 +818,172 @@ class FileStorage:
     
     def list_datasets(self) -> List[str]:
         """List all dataset IDs"""
-        with self._file_lock():
-            return [
-                f.stem for f in self.datasets_path.glob("*.json")
-                if f.is_file()
-            ]
+        with os.scandir(self.datasets_path) as entries:
+            return [entry.name[:-5] for entry in entries if entry.name.endswith('.json')]
     
     # CourtRecord operations
     def save_record(self, record: CourtRecord) -> None:
-        """Save court record to storage"""
+        """
+        Save court record to storage
+        The record is on disk when this returns, unless the storage was
+        created with deferred_sync
+        """
+        blob = record.to_orjson_bytes()
         with self._file_lock():
-            file_path = self.records_path / f"{record.record_id}.json"
-            data = record.to_dict()
-            self._safe_write_json(file_path, data)
+            self._written(self._append_record(record.record_id, blob, record))
     
     def load_record(self, record_id: str) -> CourtRecord:
         """Load court record from storage"""
         with self._file_lock():
-            file_path = self.records_path / f"{record_id}.json"
-            data = self._safe_read_json(file_path)
-            return CourtRecord.from_dict(data)
+            self._refresh_shard_file(self._shard_for(record_id))
+            location = self._record_index.get(record_id)
+            if location is None:
+                raise DataNotFoundError(f"Record not found: {record_id}")
+            try:
+                return self._read_record(location)
+            except ValueError as e:
+                raise StorageCorruptedError(f"Corrupted record {record_id}: {e}")
     
     def delete_record(self, record_id: str) -> None:
         """Delete court record from storage"""
         with self._file_lock():
-            file_path = self.records_path / f"{record_id}.json"
-            if file_path.exists():
-                file_path.unlink()
+            if record_id in self._record_index:
+                self._written(self._append_record(record_id, b''))
+            if self._has_legacy_records:
+                # Otherwise the next open would copy the legacy record back in
+                (self.records_path / f"{record_id}.json").unlink(missing_ok=True)
     
-    def save_records_batch(self, records: List[CourtRecord]) -> None:
-        """Save multiple records efficiently"""
-        with self._file_lock():
-            for record in records:
-                self.save_record(record)
+    def save_records_batch(self, records: Iterable[CourtRecord]) -> None:
+        """
+        Save multiple records efficiently, streaming from any iterable
+        Records are drawn from the iterable outside the lock, SAVE_CHUNK_SIZE
+        at a time, so it may itself read from this storage
+        """
+        iterator = iter(records)
+        while True:
+            chunk = [(record, record.to_orjson_bytes())
+                     for record in islice(iterator, self.SAVE_CHUNK_SIZE)]
+            if not chunk:
+                return
+            with self._file_lock():
+                touched = set()
+                try:
+                    for record, blob in chunk:
+                        touched.add(self._append_record(record.record_id, blob, record))
+                finally:
+                    self._sync_shards(touched)
     
     def search_records(self, query: QueryParams, limit: Optional[int] = None) -> Iterator[CourtRecord]:
         """Search records by query parameters"""
-        with self._file_lock():
-            count = 0
-            for record_file in self.records_path.glob("*.json"):
-                if limit and count >= limit:
-                    break
+        # Resolve the predicate once for the whole scan
+        compiled = query.compile()
+        if query.operator == QueryOperator.EQUALS and query.field in self.VALUE_INDEX_FIELDS:
+            yield from self._search_value_index(query, compiled, limit)
+            return
+        
+        count = 0
+        for record in self._iter_stored_records():
+            if limit and count >= limit:
+                break
+            
+            if record.matches_query(compiled):
+                yield record
+                count += 1
+    
+    def _search_value_index(self, query: QueryParams, compiled: CompiledQuery,
+                            limit: Optional[int]) -> List[CourtRecord]:
+        """
+        Answer an EQUALS query from the field's value index, in scan order
+        The first search on a field reads every record to build the index
+        without holding the lock; later searches apply the changes queued
+        since, then look the value up and read matching records by location
+        """
+        field = query.field
+        built = None
+        while True:
+            with self._file_lock():
+                self._refresh_index()
+                for shard in self._dirty_shards:
+                    shard.flush()
+                if built is not None:
+                    self._active_scans -= 1
+                    if not built.stale:
+                        self._value_indexes.setdefault(field, built)
                 
-                try:
-                    record = CourtRecord.from_dict(self._safe_read_json(record_file))
-                    if record.matches_query(query):
-                        yield record
-                        count += 1
-                except (FileStorageError, ValueError):
-                    # Skip corrupted records
-                    continue
+                index = self._value_indexes.get(field)
+                if index is not None:
+                    if built is not None and built is not index and not built.stale:
+                        # Another search built the same index meanwhile
+                        self._tracked_value_indexes.remove(built)
+                    self._apply_value_index_changes(index)
+                    return [self._read_record(location)
+                            for location in islice(sorted(index.lookup(query)), limit or None)]
+                
+                built = _FieldValueIndex(field)
+                self._tracked_value_indexes.append(built)
+                by_shard: Dict[int, List[Tuple[int, int]]] = {}
+                for shard_id, offset, length in self._record_index.values():
+                    by_shard.setdefault(shard_id, []).append((offset, length))
+                shards = {shard_id: self._shard(shard_id) for shard_id in by_shard}
+                # Snapshot offsets stay valid while no shard is compacted
+                self._active_scans += 1
+            
+            try:
+                for shard_id in sorted(by_shard):
+                    locations = sorted(by_shard[shard_id])
+                    for (offset, length), blob in zip(locations, shards[shard_id].read_many(locations)):
+                        built.add((shard_id, offset, length), self._blob_field_values(blob, field))
+            except BaseException:
+                with self._file_lock():
+                    self._active_scans -= 1
+                    if not built.stale:
+                        self._tracked_value_indexes.remove(built)
+                raise
+    
+    @staticmethod
+    def _blob_field_values(blob: bytes, field: str) -> Tuple[Any, ...]:
+        """Values of a field in a record blob; none for a corrupted record"""
+        try:
+            return CourtRecord.from_dict(_loads(blob)).field_values(field)
+        except (ValueError, KeyError, TypeError):
+            # Corrupted records are skipped, as in a full scan
+            return ()
+    
+    def _apply_value_index_changes(self, index: _FieldValueIndex) -> None:
+        """Apply record index changes queued on a value index; call with the lock held"""
+        removed = set()
+        added: Dict[Tuple[int, int, int], Optional[Tuple[Any, ...]]] = {}
+        for previous, location, values in index.pending:
+            if previous in added:
+                del added[previous]
+            elif previous is not None:
+                removed.add(previous)
+            if location is not None:
+                added[location] = values
+        index.pending = []
+        
+        for location in removed:
+            index.remove(location)
+        for location, values in added.items():
+            if values is None:
+                values = self._blob_field_values(self._read_blob_uncached(location), index.field)
+            index.add(location, values)
     
     def get_all_records(self, limit: Optional[int] = None) -> Iterator[CourtRecord]:
         """Get all records"""
-        with self._file_lock():
-            count = 0
-            for record_file in self.records_path.glob("*.json"):
-                if limit and count >= limit:
-                    break
-                
-                try:
-                    record = CourtRecord.from_dict(self._safe_read_json(record_file))
-                    yield record
-                    count += 1
-                except (FileStorageError, ValueError):
-                    # Skip corrupted records
-                    continue
+        count = 0
+        for record in self._iter_stored_records():
+            if limit and count >= limit:
+                break
+            
+            yield record
+            count += 1
     
     def count_records(self) -> int:
         """Count total number of records"""
         with self._file_lock():
-            return len(list(self.records_path.glob("*.json")))
+            self._refresh_index()
+            return len(self._record_index)
     
     # Raw data operations
     def save_raw_data(self, dataset_id: str, data: Any) -> None:
@@ -284,6 +1037,7 @@ class FileStorage:
     # Utility operations
     def backup_data(self, backup_path: str) -> None:
         """Create backup of all data"""
+        self.flush()
         backup_path_obj = Path(backup_path)
         backup_path_obj.mkdir(parents=True, exist_ok=True)
         
@@ -299,6 +1053,8 @@ class FileStorage:
             raise FileStorageError(f"Backup path does not exist: {backup_path}")
         
         # Remove current data
+        with self._file_lock():
+            self._release_shards()
         if self.base_path.exists():
             shutil.rmtree(self.base_path)
         
@@ -307,34 +1063,52 @@ class FileStorage:
         
         # Reinitialize
         self._ensure_directories()
+        with self._file_lock():
+            self._load_record_index()
     
     def clear_all_data(self) -> None:
         """Clear all data (use with caution)"""
         with self._file_lock():
+            self._release_shards()
             if self.base_path.exists():
                 shutil.rmtree(self.base_path)
             self._ensure_directories()
+            self._load_record_index()
     
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
         with self._file_lock():
+            self._refresh_index()
+            # Buffered appends count toward disk usage
+            for shard in self._dirty_shards:
+                shard.flush()
             stats = {
-                'total_datasets': len(list(self.datasets_path.glob("*.json"))),
-                'total_records': len(list(self.records_path.glob("*.json"))),
-                'raw_data_files': len(list(self.raw_data_path.glob("*.json"))),
-                'parsed_data_files': len(list(self.parsed_data_path.glob("*.json"))),
+                'total_datasets': self._count_json_files(self.datasets_path),
+                'total_records': len(self._record_index),
+                'raw_data_files': self._count_json_files(self.raw_data_path),
+                'parsed_data_files': self._count_json_files(self.parsed_data_path),
                 'storage_path': str(self.base_path.absolute()),
                 'disk_usage': self._get_directory_size(self.base_path)
             }
             return stats
     
+    @staticmethod
+    def _count_json_files(path: Path) -> int:
+        """Count JSON files in a directory from its entries alone"""
+        with os.scandir(path) as entries:
+            return sum(1 for entry in entries if entry.name.endswith('.json'))
+    
     def _get_directory_size(self, path: Path) -> int:
         """Get total size of directory in bytes"""
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = Path(dirpath) / filename
-                total_size += filepath.stat().st_size
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total_size += entry.stat(follow_symlinks=False).st_size
         return total_size
 
 
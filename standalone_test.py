@@ -8,7 +8,7 @@ import csv
 import io
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -16,18 +16,53 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import OpinionType
 
+# Values FreeLaw uses for true booleans
+_TRUE_VALUES = frozenset(('true', 't', '1', 'yes', 'y'))
+
+# Datetime layouts tried in order once the timezone is stripped
+_DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d'
+)
+
+# FreeLaw opinion type codes
+_TYPE_MAPPING: Mapping[str, OpinionType] = {
+    '010combined': OpinionType.COMBINED,
+    '015unamimous': OpinionType.UNANIMOUS,
+    '020lead': OpinionType.LEAD,
+    '025plurality': OpinionType.PLURALITY,
+    '030concurrence': OpinionType.CONCURRENCE,
+    '035concurrenceinpart': OpinionType.CONCUR_IN_PART,
+    '040dissent': OpinionType.DISSENT,
+    '050addendum': OpinionType.ADDENDUM,
+    '060remittitur': OpinionType.REMITTUR,
+    '070rehearing': OpinionType.REHEARING,
+    '080onthemerits': OpinionType.ON_THE_MERITS,
+    '090onmotiontostrike': OpinionType.ON_MOTION_TO_STRIKE,
+    '100trialcourt': OpinionType.TRIAL_COURT,
+    '999unknown': OpinionType.UNKNOWN
+}
+
 def clean_value(value: str) -> str:
     """Remove backticks that FreeLaw wraps around all values"""
-    if isinstance(value, str) and value.startswith('`') and value.endswith('`'):
+    if isinstance(value, str) and len(value) >= 2 and value[0] == '`' and value[-1] == '`':
         return value[1:-1]  # Remove first and last backtick
     return value
 
+def _clean_strip(value: str) -> str:
+    """clean_value followed by strip, without the intermediate string"""
+    if len(value) >= 2 and value[0] == '`' and value[-1] == '`':
+        return value[1:-1].strip()
+    return value.strip()
+
 def parse_integer(value: str) -> Optional[int]:
     """Parse integer value"""
-    if not value or value.strip() == '':
+    if not value:
         return None
     
-    value = clean_value(value).strip()
+    # Blank and whitespace-only values come back empty from _clean_strip
+    value = _clean_strip(value)
     if not value:
         return None
     
@@ -38,11 +73,10 @@ def parse_integer(value: str) -> Optional[int]:
 
 def parse_boolean(value: str) -> bool:
     """Parse boolean value"""
-    if not value or value.strip() == '':
+    if not value:
         return False
     
-    value = clean_value(value).strip().lower()
-    return value in ['true', 't', '1', 'yes', 'y', 'f'] and value != 'f'
+    return _clean_strip(value).lower() in _TRUE_VALUES
 
 def parse_string(value: str) -> str:
     """Parse string value"""
@@ -53,10 +87,10 @@ def parse_string(value: str) -> str:
 
 def parse_datetime(value: str) -> Optional[datetime]:
     """Parse FreeLaw datetime format"""
-    if not value or value.strip() == '':
+    if not value:
         return None
     
-    value = clean_value(value).strip()
+    value = _clean_strip(value)
     if not value:
         return None
     
@@ -67,14 +101,23 @@ def parse_datetime(value: str) -> Optional[datetime]:
         elif value.endswith('Z'):
             value = value[:-1]
         
-        # Try different datetime formats
-        formats = [
-            '%Y-%m-%d %H:%M:%S.%f',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d'
-        ]
+        # Fast path for the dominant 'YYYY-MM-DD HH:MM:SS[.ffffff]' layout
+        length = len(value)
+        if (length >= 19 and value[4] == '-' and value[7] == '-' and value[10] == ' '
+                and value[13] == ':' and value[16] == ':'):
+            fraction = value[20:]
+            if length == 19 or (value[19] == '.' and 0 < len(fraction) <= 6 and fraction.isdigit()):
+                try:
+                    return datetime(
+                        int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                        int(fraction.ljust(6, '0')) if fraction else 0
+                    )
+                except ValueError:
+                    pass
         
-        for fmt in formats:
+        # Try different datetime formats
+        for fmt in _DATETIME_FORMATS:
             try:
                 return datetime.strptime(value, fmt)
             except ValueError:
@@ -151,24 +194,7 @@ def standalone_test():
             opinion_type = '999unknown'
         
         # Map opinion type to enum
-        type_mapping = {
-            '010combined': OpinionType.COMBINED,
-            '015unamimous': OpinionType.UNANIMOUS,
-            '020lead': OpinionType.LEAD,
-            '025plurality': OpinionType.PLURALITY,
-            '030concurrence': OpinionType.CONCURRENCE,
-            '035concurrenceinpart': OpinionType.CONCUR_IN_PART,
-            '040dissent': OpinionType.DISSENT,
-            '050addendum': OpinionType.ADDENDUM,
-            '060remittitur': OpinionType.REMITTUR,
-            '070rehearing': OpinionType.REHEARING,
-            '080onthemerits': OpinionType.ON_THE_MERITS,
-            '090onmotiontostrike': OpinionType.ON_MOTION_TO_STRIKE,
-            '100trialcourt': OpinionType.TRIAL_COURT,
-            '999unknown': OpinionType.UNKNOWN
-        }
-        
-        opinion_type_enum = type_mapping.get(opinion_type, OpinionType.UNKNOWN)
+        opinion_type_enum = _TYPE_MAPPING.get(opinion_type, OpinionType.UNKNOWN)
         
         # Create Opinion object with cluster_id fallback
         if cluster_id is None:
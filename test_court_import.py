@@ -9,29 +9,35 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.storage import CourtFinderStorage
+from courtfinder.storage import BatchWriter, get_storage
+from csv_cache import exists_nonempty
 
 # Import the parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import import_data_type, parse_court_row
 
 def test_court_import():
     """Test court import"""
     print("🔍 Testing court import...")
     
-    storage = CourtFinderStorage("real_data")
+    storage = get_storage("real_data")
     
-    # Check current court count
-    stats = storage.get_storage_stats()
-    print(f"Current courts: {stats.get('courts', {}).get('total_items', 0)}")
+    # Check current court count (courts only, no scan of the other data types)
+    stats = storage.get_storage_stats(only=['courts'])
+    courts_before = stats['courts']['total_items']
+    print(f"Current courts: {courts_before}")
     
     # Test importing courts
     file_path = Path("downloads/courts-2024-12-31.csv.bz2")
-    if not file_path.exists():
+    if not exists_nonempty(file_path):
         print("❌ Court file not found")
         return
     
     print("\n📥 Importing courts...")
-    result = import_data_type(storage, file_path, "courts", parse_court_row, storage.save_court, limit=10)
+    # Courts are saved 100 at a time, rewriting the indexes once per batch
+    save_courts = BatchWriter(storage.save_courts_bulk, batch_size=100)
+    result = import_data_type(storage, file_path, "courts", parse_court_row, save_courts, limit=10)
+    # Courts the batch save could not write count as errors, not imports
+    save_courts.finish(result)
     
     if result['success']:
         print(f"✅ Successfully imported {result['imported_count']} courts")
@@ -39,9 +45,9 @@ def test_court_import():
     else:
         print(f"❌ Failed: {result.get('error', 'Unknown error')}")
     
-    # Check final court count
-    stats = storage.get_storage_stats()
-    print(f"\nFinal courts: {stats.get('courts', {}).get('total_items', 0)}")
+    # Final count from the import result instead of a second scan
+    # (re-imported courts overwrite existing ones, so this is an upper bound)
+    print(f"\nFinal courts: at most {courts_before + result.get('imported_count', 0)}")
 
 if __name__ == "__main__":
     test_court_import()
\ No newline at end of file
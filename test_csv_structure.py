@@ -3,21 +3,27 @@
 Test to understand the CSV structure and find a better parsing approach
 """
 
-import bz2
 import csv
+import re
 from pathlib import Path
 
+from csv_cache import exists_nonempty, open_csv_cached
+
+# Leading whitespace then a backtick; matched in place instead of strip()ing
+# a copy of what can be a multi-megabyte opinion line
+_LEADING_BACKTICK = re.compile(r'\s*`')
+
 def analyze_csv_structure():
     """Analyze the CSV structure to understand the format"""
     file_path = Path("downloads/opinions-2024-12-31.csv.bz2")
     
-    if not file_path.exists():
+    if not exists_nonempty(file_path):
         print("❌ Opinion file not found")
         return
     
     print("🔍 Analyzing CSV structure...")
     
-    with bz2.open(file_path, 'rt', encoding='utf-8') as f:
+    with open_csv_cached(file_path) as f:
         # Get header
         header = f.readline().strip()
         print(f"Header: {header}")
@@ -36,14 +42,15 @@ def analyze_csv_structure():
             
             print(f"Line {line_count}: {line[:200]}...")
             
-            # Try to count commas vs backticks
+            # Try to count commas vs backticks (two str.count scans run in C and
+            # are far cheaper than a single Counter(line) pass)
             comma_count = line.count(',')
             backtick_count = line.count('`')
             
             print(f"  Commas: {comma_count}, Backticks: {backtick_count}")
             
             # Check if it starts with backtick
-            starts_with_backtick = line.strip().startswith('`')
+            starts_with_backtick = _LEADING_BACKTICK.match(line) is not None
             print(f"  Starts with backtick: {starts_with_backtick}")
             
             print()
@@ -9,17 +9,18 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.storage import CourtFinderStorage
+from courtfinder.storage import get_storage
+from csv_cache import exists_nonempty
 
 # Load the main script
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import import_opinions_html_aware
 
 # Test just the opinion import
 def test_opinion_import():
-    storage = CourtFinderStorage("real_data")
+    storage = get_storage("real_data")
     file_path = Path("downloads/opinions-2024-12-31.csv.bz2")
     
-    if file_path.exists():
+    if exists_nonempty(file_path):
         print("Testing opinion import...")
         result = import_opinions_html_aware(storage, file_path, limit=50)
         
@@ -9,19 +9,20 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.storage import CourtFinderStorage
+from courtfinder.storage import get_storage
+from csv_cache import exists_nonempty
 
 # Import the fixed functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import import_opinions_html_aware
 
 def test_fixed_import():
     """Test the fixed import process"""
     print("🔍 Testing fixed import process...")
     
-    storage = CourtFinderStorage("real_data")
+    storage = get_storage("real_data")
     file_path = Path("downloads/opinions-2024-12-31.csv.bz2")
     
-    if not file_path.exists():
+    if not exists_nonempty(file_path):
         print("❌ Opinion file not found")
         return
     
@@ -5,14 +5,20 @@ Test the updated HTML-aware opinion parser
 
 import sys
 import csv
-import bz2
-import io
+import re
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from csv_cache import open_csv_cached
+
+# Whole-field patterns for is_valid_opinion_row; \s* stands in for str.strip()
+_BACKTICKED_NUMBER = re.compile(r'\s*`\d+`\s*')
+_BACKTICKED_TYPE_CODE = re.compile(r'\s*`[^<].*`\s*', re.DOTALL)
+
 class OpinionCSVParser:
     @staticmethod
     def parse_opinion_csv(file_path: Path, limit: Optional[int] = None) -> List[Dict[str, str]]:
@@ -21,91 +27,145 @@ class OpinionCSVParser:
         total_processed = 0
         
         # Use a different approach - scan for rows that start with backtick (valid IDs)
-        with bz2.open(file_path, 'rt', encoding='utf-8') as f:
+        with open_csv_cached(file_path, 'rb') as f:
             # Get header
-            header_line = f.readline().strip()
+            header_line = f.readline().decode('utf-8').strip()
             expected_columns = header_line.split(',')
             
             print(f"  📝 CSV has {len(expected_columns)} columns")
             print(f"  📝 Expected columns: {expected_columns[:5]}...{expected_columns[-3:]}")
             
-            # Read file in chunks and look for valid opinion rows
-            line_count = 0
+            # Read file in slabs and look for valid opinion rows
+            reported = 0
             
-            for line in f:
-                line_count += 1
-                
+            for line_number, row_data in OpinionCSVParser._rows_by_line(
+                OpinionCSVParser._candidate_lines(f)
+            ):
                 # Stop if we've processed enough
                 if limit and total_processed >= limit:
                     break
                 
-                # Skip obviously corrupted lines that don't start with a backtick
-                if not line.strip().startswith('`'):
-                    continue
+                # Periodic progress update
+                if line_number // 10000 > reported:
+                    reported = line_number // 10000
+                    print(f"  📊 Scanned {reported * 10000} lines, found {total_processed} valid opinions")
                 
-                # This might be a valid opinion row, try to parse it
-                try:
-                    # Use csv.reader with proper PostgreSQL-style settings
-                    row_io = io.StringIO(line.strip())
-                    csv_reader = csv.reader(
-                        row_io,
-                        quoting=csv.QUOTE_ALL,
-                        skipinitialspace=True
-                    )
-                    
-                    row_data = next(csv_reader)
+                # Check if we have the right number of fields
+                if len(row_data) != len(expected_columns):
+                    continue
                     
-                    # Check if we have the right number of fields
-                    if len(row_data) != len(expected_columns):
-                        continue
-                        
-                    # Create dictionary
-                    row_dict = dict(zip(expected_columns, row_data))
+                # Create dictionary
+                row_dict = dict(zip(expected_columns, row_data))
+                
+                # Validate that this looks like a valid opinion row
+                if OpinionCSVParser.is_valid_opinion_row(row_dict):
+                    valid_rows.append(row_dict)
+                    total_processed += 1
                     
-                    # Validate that this looks like a valid opinion row
-                    if OpinionCSVParser.is_valid_opinion_row(row_dict):
-                        valid_rows.append(row_dict)
-                        total_processed += 1
-                        
-                        if total_processed % 10 == 0:
-                            print(f"  ✅ Found {total_processed} valid opinions so far...")
-                            
-                except (csv.Error, StopIteration, UnicodeDecodeError, IndexError):
+                    if total_processed % 10 == 0:
+                        print(f"  ✅ Found {total_processed} valid opinions so far...")
+        
+        return valid_rows
+    
+    @staticmethod
+    def _candidate_lines(f) -> Iterator[Tuple[int, str]]:
+        """Yield numbered, stripped lines that start with a backtick (possible opinion rows)"""
+        line_number = 0
+        for lines in OpinionCSVParser._line_slabs(f):
+            for raw_line in lines:
+                line_number += 1
+                
+                # Skip obviously corrupted lines that don't start with a backtick;
+                # only non-ASCII leading bytes need decoding to be sure
+                head = raw_line.lstrip()[:1]
+                if head != b'`' and not (head and head[0] >= 0x80):
+                    continue
+                
+                try:
+                    line = raw_line.decode('utf-8').strip()
+                except UnicodeDecodeError:
                     # This row is corrupted, skip it
                     continue
-                    
-                # Periodic progress update
-                if line_count % 10000 == 0:
-                    print(f"  📊 Scanned {line_count} lines, found {total_processed} valid opinions")
+                if line.startswith('`'):
+                    yield line_number, line
+    
+    @staticmethod
+    def _rows_by_line(candidates: Iterator[Tuple[int, str]]) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Parse each candidate line as its own CSV row, sharing one csv.reader
+        across lines. A reader that needs a second line for a row (an unclosed
+        quote) is cut off before it gets one; that line is re-read on its own
+        and a fresh reader takes over, so results match parsing every line
+        separately and no row can swallow the lines after it
+        """
+        candidates = iter(candidates)
+        pending = deque()
+        cut_off = exhausted = False
         
-        return valid_rows
+        def feed():
+            nonlocal cut_off, exhausted
+            for candidate in candidates:
+                pending.append(candidate)
+                yield candidate[1]
+                if pending:
+                    # The reader is still inside this line's row
+                    cut_off = True
+                    return
+            exhausted = True
+        
+        while True:
+            cut_off = False
+            # Use csv.reader with proper PostgreSQL-style settings
+            csv_reader = csv.reader(feed(), quoting=csv.QUOTE_ALL, skipinitialspace=True)
+            
+            while True:
+                try:
+                    row_data = next(csv_reader)
+                except (StopIteration, csv.Error):
+                    break
+                
+                if cut_off:
+                    break
+                yield pending.popleft()[0], row_data
+            
+            while pending:
+                line_number, line = pending.popleft()
+                try:
+                    yield line_number, next(csv.reader((line,), quoting=csv.QUOTE_ALL, skipinitialspace=True))
+                except csv.Error:
+                    # This row is corrupted, skip it
+                    continue
+            
+            if exhausted:
+                return
+    
+    @staticmethod
+    def _line_slabs(f, slab_size: int = 1 << 22) -> Iterator[List[bytes]]:
+        """Read a binary stream in large slabs and yield each slab's complete lines"""
+        tail = b''
+        while True:
+            slab = f.read(slab_size)
+            if not slab:
+                if tail:
+                    yield tail.splitlines()
+                return
+            slab = tail + slab
+            cut = slab.rfind(b'\n') + 1
+            if cut == 0:
+                tail = slab
+                continue
+            tail = slab[cut:]
+            yield slab[:cut].splitlines()
     
     @staticmethod
     def is_valid_opinion_row(row_dict: Dict[str, str]) -> bool:
         """Validate that a row dictionary represents a valid opinion record"""
-        # Check for required fields
-        opinion_id = row_dict.get('id', '').strip()
-        if not opinion_id:
+        # Opinion IDs should be numeric and wrapped in backticks
+        if not _BACKTICKED_NUMBER.fullmatch(row_dict.get('id', '')):
             return False
         
-        # Opinion IDs should be wrapped in backticks and be numeric
-        if not (opinion_id.startswith('`') and opinion_id.endswith('`')):
-            return False
-            
-        # Remove backticks and check if it's a valid integer
-        clean_id = opinion_id[1:-1]
-        if not clean_id.isdigit():
-            return False
-        
-        # Check if we have a reasonable type field
-        opinion_type = row_dict.get('type', '').strip()
-        if opinion_type and opinion_type.startswith('`') and opinion_type.endswith('`'):
-            clean_type = opinion_type[1:-1]
-            # Should be a valid opinion type code
-            if clean_type and not clean_type.startswith('<'):  # Not HTML
-                return True
-        
-        return False
+        # Check if we have a reasonable type field: a backticked code, not HTML
+        return _BACKTICKED_TYPE_CODE.fullmatch(row_dict.get('type', '')) is not None
 
 if __name__ == "__main__":
     # Test the parser
@@ -10,18 +10,17 @@ from datetime import datetime, date
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from courtfinder.models import (
-    Court, Docket, OpinionCluster, Opinion, Citation, Person,
-    PrecedentialStatus, OpinionType
-)
-from courtfinder.storage import CourtFinderStorage
-from courtfinder.search import CourtFinderSearch, SearchQuery, SearchOperator
-from courtfinder.csv_parser import BulkCSVParser
-from courtfinder.api_client import CourtListenerAPIClient
+# courtfinder modules are imported inside each test so that importing
+# this script (e.g. during collection) stays cheap.
 
 
 def test_models():
     """Test domain models"""
+    from courtfinder.models import (
+        Court, Docket, OpinionCluster, Opinion, Citation, Person,
+        PrecedentialStatus, OpinionType
+    )
+
     print("Testing domain models...")
     
     # Test Court
@@ -104,6 +103,9 @@ def test_models():
 
 def test_storage():
     """Test storage system"""
+    from courtfinder.models import Court
+    from courtfinder.storage import CourtFinderStorage
+
     print("\nTesting storage system...")
     
     # Initialize storage
@@ -137,6 +139,10 @@ def test_storage():
 
 def test_search():
     """Test search functionality"""
+    from courtfinder.models import Court
+    from courtfinder.storage import CourtFinderStorage
+    from courtfinder.search import CourtFinderSearch, SearchQuery, SearchOperator
+
     print("\nTesting search functionality...")
     
     # Initialize storage and search
@@ -188,6 +194,8 @@ def test_search():
 
 def test_csv_parser():
     """Test CSV parser"""
+    from courtfinder.csv_parser import BulkCSVParser
+
     print("\nTesting CSV parser...")
     
     parser = BulkCSVParser()
@@ -206,6 +214,8 @@ def test_csv_parser():
 
 def test_api_client():
     """Test API client (without making real requests)"""
+    from courtfinder.api_client import CourtListenerAPIClient, BulkDataDownloader
+
     print("\nTesting API client...")
     
     # Initialize client without token
@@ -218,7 +228,6 @@ def test_api_client():
     print(f"API base URL: {client.BASE_URL}")
     
     # Test bulk downloader
-    from courtfinder.api_client import BulkDataDownloader
     downloader = BulkDataDownloader("test_downloads")
     
     files = downloader.list_available_files()
@@ -9,17 +9,20 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.storage import CourtFinderStorage
+from courtfinder.storage import get_storage
 
 # Test just the basic parsing functions without the exec
 import csv
 import bz2
 from datetime import datetime
-from typing import Dict, Optional
+from itertools import islice
+from typing import Dict, List, Optional
 
 def clean_value(value: str) -> str:
     """Remove backticks that FreeLaw wraps around all values"""
-    if isinstance(value, str) and value.startswith('`') and value.endswith('`'):
+    # Slice comparisons instead of startswith/endswith: no method calls on
+    # the hot path, and callers only ever pass non-empty strings
+    if value[:1] == '`' and value[-1:] == '`':
         return value[1:-1]
     return value
 
@@ -43,6 +46,21 @@ def parse_string(value: str) -> str:
         return ''
     return clean_value(value)
 
+def clean_many(values: List[str]) -> List[str]:
+    """clean_value over a whole column"""
+    return [v[1:-1] if v[:1] == '`' and v[-1:] == '`' else v for v in values]
+
+def parse_integer_many(values: List[str]) -> List[Optional[int]]:
+    """parse_integer over a whole column"""
+    # Plain digit strings (nearly every id) go straight to int(); anything
+    # else takes the full parse_integer path, so results are identical
+    return [int(c) if c.isdecimal() else parse_integer(v)
+            for v, c in zip(values, clean_many(values))]
+
+def parse_string_many(values: List[str]) -> List[str]:
+    """parse_string over a whole column"""
+    return clean_many(values)
+
 def test_basic_docket_parsing():
     """Test basic docket parsing without the complex import system"""
     print("🔍 Testing basic docket parsing...")
@@ -54,19 +72,28 @@ def test_basic_docket_parsing():
     
     try:
         with bz2.open(file_path, 'rt', encoding='utf-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
+            # Plain rows plus header positions: only three of the docket
+            # columns are read, so skip building a dict per row
+            reader = csv.reader(f, quoting=csv.QUOTE_MINIMAL)
+            header = next(reader)
+            idx_id = header.index('id')
+            idx_ct = header.index('court_id')
+            idx_cn = header.index('case_name')
+            width = max(idx_id, idx_ct, idx_cn) + 1
+            
+            rows = list(islice(reader, 10))  # Just test first 10 rows
+            for row in rows:
+                if len(row) < width:  # Short row: missing fields read as ''
+                    row.extend([''] * (width - len(row)))
+            
+            # Parse the basic fields a column at a time
+            docket_ids = parse_integer_many([row[idx_id] for row in rows])
+            court_ids = parse_string_many([row[idx_ct] for row in rows])
+            case_names = parse_string_many([row[idx_cn] for row in rows])
             
             count = 0
-            for row in reader:
+            for docket_id, court_id, case_name in zip(docket_ids, court_ids, case_names):
                 count += 1
-                if count > 10:  # Just test first 10 rows
-                    break
-                
-                # Try to parse basic fields
-                docket_id = parse_integer(row.get('id', ''))
-                court_id = parse_string(row.get('court_id', ''))
-                case_name = parse_string(row.get('case_name', ''))
-                
                 print(f"  Row {count}: ID={docket_id}, Court={court_id}, Case={case_name[:50]}...")
                 
                 if not docket_id:
@@ -95,7 +122,7 @@ def test_storage():
     print("\n🔍 Testing storage system...")
     
     try:
-        storage = CourtFinderStorage("real_data")
+        storage = get_storage("real_data")
         stats = storage.get_storage_stats()
         
         print("✅ Storage system working")
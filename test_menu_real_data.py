@@ -9,7 +9,8 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.main import CourtFinderCLI
+from courtfinder.search import CourtFinderSearch
+from courtfinder.storage import get_storage
 from rich.console import Console
 
 def test_menu_integration():
@@ -19,13 +20,14 @@ def test_menu_integration():
     console.print("🎯 [bold green]Testing Menu Integration with Real FreeLaw Data[/bold green]")
     console.print("=" * 60)
     
-    # Test CLI initialization
-    cli = CourtFinderCLI('real_data')
+    # Open the storage and search engine the CLI wraps
+    storage = get_storage('real_data')
+    search = CourtFinderSearch(storage)
     
     # Test statistics
-    stats = cli.get_stats()
+    stats = storage.get_storage_stats()
     console.print(f"\n📊 [bold white]Real Data Statistics:[/bold white]")
-    for data_type, stat in stats['storage_stats'].items():
+    for data_type, stat in stats.items():
         if isinstance(stat, dict) and 'total_items' in stat:
             console.print(f"  {data_type}: [cyan]{stat['total_items']}[/cyan] items")
     
@@ -33,19 +35,19 @@ def test_menu_integration():
     console.print(f"\n🔍 [bold white]Testing Search Functions:[/bold white]")
     
     # Test court search (used by menu's _search_courts)
-    court_results = cli.search_courts("Supreme", limit=5)
+    court_results = search.find_court_by_name("Supreme")[:5]
     console.print(f"  Court search 'Supreme': [green]{len(court_results)}[/green] results")
     
     # Test case search (used by menu's _search_cases)
-    case_results = cli.search_cases("United States", limit=5)
+    case_results = search.find_dockets_by_case_name("United States")[:5]
     console.print(f"  Case search 'United States': [yellow]{len(case_results)}[/yellow] results")
     
     # Test opinion search (used by menu's _search_opinions)
-    opinion_results = cli.search_opinions("constitutional", limit=5)
+    opinion_results = search.find_opinions_by_text("constitutional", 5)
     console.print(f"  Opinion search 'constitutional': [yellow]{len(opinion_results)}[/yellow] results")
     
     # Test judge search (used by menu's _search_judges)
-    judge_results = cli.search_judges("Smith", limit=5)
+    judge_results = search.find_person_by_name("Smith", fuzzy=True)[:5]
     console.print(f"  Judge search 'Smith': [yellow]{len(judge_results)}[/yellow] results")
     
     console.print(f"\n✅ [bold green]Menu Integration Test Complete![/bold green]")
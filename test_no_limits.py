@@ -3,19 +3,63 @@
 Test the import with no limits to see how much data we actually have
 """
 
+import io
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from courtfinder.storage import CourtFinderStorage
+from csv_cache import open_csv_cached
 
 # Import the fixed functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import OpinionCSVParser, import_data_type, parse_citation_row
 
-def test_data_volume():
-    """Test to see how much data we actually have in each file"""
+CITATION_FILE = "citation-map-2025-07-02.csv.bz2"
+
+# Rows imported by test_small_unlimited_import
+SAMPLE_ROWS = 5000
+
+# Decompressed citation-map bytes kept from the volume check for the import
+# test; citation rows are a few dozen bytes, so this holds well over SAMPLE_ROWS
+SAMPLE_BYTES = 5 * 1024 * 1024
+
+def count_data_lines(file_path: Path, chunk_size: int = 1 << 20,
+                     keep_bytes: int = 0) -> Tuple[int, bytes]:
+    """
+    Count the lines after the header of a .csv.bz2 file
+    Counts newlines in large binary chunks; nothing is decoded or split
+    into line objects. Also returns up to keep_bytes of the decompressed
+    start of the file (header included), cut back to a whole line
+    """
+    line_count = 0
+    last = b'\n'
+    head = bytearray()
+    with open_csv_cached(file_path, 'rb') as f:
+        header = f.readline()
+        if keep_bytes:
+            head += header
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            line_count += chunk.count(b'\n')
+            last = chunk[-1:]
+            if len(head) < keep_bytes:
+                head += chunk[:keep_bytes - len(head)]
+    # An unterminated last line still counts
+    if last != b'\n':
+        line_count += 1
+    return line_count, bytes(head[:head.rfind(b'\n') + 1])
+
+def test_data_volume() -> Optional[bytes]:
+    """
+    Test to see how much data we actually have in each file
+    Returns the leading rows of the citation map for test_small_unlimited_import
+    """
     
     downloads_dir = Path("downloads")
     
@@ -23,48 +67,63 @@ def test_data_volume():
         "dockets-2024-12-31.csv.bz2",
         "opinion-clusters-2024-12-31.csv.bz2", 
         "opinions-2024-12-31.csv.bz2",
-        "citation-map-2025-07-02.csv.bz2"
+        CITATION_FILE
     ]
     
     print("🔍 CHECKING DATA VOLUME IN EACH FILE")
     print("=" * 50)
     
-    for filename in files_to_check:
-        file_path = downloads_dir / filename
+    existing = [filename for filename in files_to_check
+                if (downloads_dir / filename).exists()]
+    
+    # bz2 decoding is CPU-bound, so count each file in its own process and
+    # report the results in order as they are needed
+    with ProcessPoolExecutor(max_workers=max(1, min(4, len(existing)))) as pool:
+        line_counts = {filename: pool.submit(count_data_lines, downloads_dir / filename,
+                                             keep_bytes=SAMPLE_BYTES if filename == CITATION_FILE else 0)
+                       for filename in existing}
         
-        if not file_path.exists():
-            print(f"❌ {filename}: File not found")
-            continue
+        for filename in files_to_check:
+            file_path = downloads_dir / filename
             
-        print(f"\n📁 {filename}")
-        print("-" * 30)
-        
-        try:
-            # Count total lines in the file (excluding header)
-            import bz2
-            with bz2.open(file_path, 'rt', encoding='utf-8') as f:
-                header = f.readline()  # Skip header
-                line_count = sum(1 for line in f)
+            if filename not in line_counts:
+                print(f"❌ {filename}: File not found")
+                continue
                 
-            print(f"   📊 Total data lines: {line_count:,}")
+            print(f"\n📁 {filename}")
+            print("-" * 30)
             
-            # For opinions, also check valid records
-            if "opinions" in filename:
-                print(f"   🔍 Checking valid opinion records...")
-                valid_rows = OpinionCSVParser.parse_opinion_csv(file_path, limit=1000)  # Sample first 1000
-                print(f"   ✅ Valid records in first 1000: {len(valid_rows)}")
+            try:
+                # Count total lines in the file (excluding header)
+                line_count, _ = line_counts[filename].result()
                 
-                if len(valid_rows) > 0:
-                    # Estimate total valid records
-                    ratio = len(valid_rows) / 1000
-                    estimated_total = int(line_count * ratio)
-                    print(f"   📈 Estimated total valid opinions: {estimated_total:,}")
+                print(f"   📊 Total data lines: {line_count:,}")
                 
-        except Exception as e:
-            print(f"   ❌ Error reading file: {e}")
+                # For opinions, also check valid records
+                if "opinions" in filename:
+                    print(f"   🔍 Checking valid opinion records...")
+                    valid_rows = OpinionCSVParser.parse_opinion_csv(file_path, limit=1000)  # Sample first 1000
+                    print(f"   ✅ Valid records in first 1000: {len(valid_rows)}")
+                    
+                    if len(valid_rows) > 0:
+                        # Estimate total valid records
+                        ratio = len(valid_rows) / 1000
+                        estimated_total = int(line_count * ratio)
+                        print(f"   📈 Estimated total valid opinions: {estimated_total:,}")
+                    
+            except Exception as e:
+                print(f"   ❌ Error reading file: {e}")
+        
+        if CITATION_FILE in line_counts and line_counts[CITATION_FILE].exception() is None:
+            return line_counts[CITATION_FILE].result()[1]
+    return None
 
-def test_small_unlimited_import():
-    """Test importing a small amount with no limits to verify it works"""
+def test_small_unlimited_import(citation_sample: Optional[bytes] = None):
+    """
+    Test importing a small amount with no limits to verify it works
+    citation_sample, the decompressed start of the citation map kept by
+    test_data_volume, is imported instead of decoding the archive again
+    """
     
     print(f"\n🧪 TESTING SMALL UNLIMITED IMPORT")
     print("=" * 50)
@@ -72,13 +131,18 @@ def test_small_unlimited_import():
     storage = CourtFinderStorage("test_data")
     
     # Test with citations first (should be fastest)
-    file_path = Path("downloads/citation-map-2025-07-02.csv.bz2")
+    file_path = Path("downloads") / CITATION_FILE
     
     if file_path.exists():
         print(f"📥 Testing citation import with no limits...")
         
-        # Import first 5000 citations to test
-        result = import_data_type(storage, file_path, "citations", parse_citation_row, storage.save_citation, 5000)
+        # Import first 5000 citations to test; the sample needs the header
+        # plus more than SAMPLE_ROWS lines, or rows would be silently missing
+        source = None
+        if citation_sample is not None and citation_sample.count(b'\n') > SAMPLE_ROWS:
+            source = io.TextIOWrapper(io.BytesIO(citation_sample), encoding='utf-8')
+        result = import_data_type(storage, file_path, "citations", parse_citation_row,
+                                  storage.save_citation, SAMPLE_ROWS, source=source)
         
         if result['success']:
             print(f"✅ Successfully imported {result['imported_count']} citations")
@@ -89,5 +153,5 @@ def test_small_unlimited_import():
         print("❌ Citation file not found")
 
 if __name__ == "__main__":
-    test_data_volume()
-    test_small_unlimited_import()
\ No newline at end of file
+    citation_sample = test_data_volume()
+    test_small_unlimited_import(citation_sample)
\ No newline at end of file
@@ -14,16 +14,22 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import Opinion, OpinionType
 
+# Values parse_boolean treats as true
+_TRUE_VALUES = frozenset(['true', 't', '1', 'yes', 'y', 'f'])
+
 class FreeLawCSVParser:
     @staticmethod
     def clean_value(value: str) -> str:
-        if isinstance(value, str) and value.startswith('`') and value.endswith('`'):
+        # Slice comparisons instead of startswith/endswith; the parse_* callers
+        # only pass non-empty strings
+        if value[:1] == '`' and value[-1:] == '`':
             return value[1:-1]
         return value
     
     @staticmethod
     def parse_integer(value: str) -> Optional[int]:
-        if not value or value.strip() == '':
+        # A blank value is still blank after cleaning, so one strip covers both checks
+        if not value:
             return None
         value = FreeLawCSVParser.clean_value(value).strip()
         if not value:
@@ -46,10 +52,10 @@ class FreeLawCSVParser:
     
     @staticmethod
     def parse_boolean(value: str) -> bool:
-        if not value or value.strip() == '':
+        if not value:
             return False
         value = FreeLawCSVParser.clean_value(value).strip().lower()
-        return value in ['true', 't', '1', 'yes', 'y', 'f']
+        return value in _TRUE_VALUES
 
 def test_opinion_parser():
     """Test the opinion parser with a small sample"""
@@ -65,26 +71,27 @@ def test_opinion_parser():
     import csv
     import io
     
+    # One reader over all the rows instead of a new StringIO and DictReader per row
+    fieldnames = header.split(',')
+    csv_reader = csv.DictReader(
+        io.StringIO('\n'.join(test_data)),
+        fieldnames=fieldnames,
+        quoting=csv.QUOTE_ALL,
+        skipinitialspace=True
+    )
+    
     for i, row_data in enumerate(test_data):
         print(f"\n=== Testing Row {i+1} ===")
         print(f"Raw data: {row_data[:100]}...")
         
         try:
             # Parse using CSV
-            row_io = io.StringIO(row_data)
-            csv_reader = csv.DictReader(
-                row_io,
-                fieldnames=header.split(','),
-                quoting=csv.QUOTE_ALL,
-                skipinitialspace=True
-            )
-            
             row_dict = next(csv_reader)
             print(f"Parsed ID: {row_dict.get('id')}")
             print(f"Parsed Type: {row_dict.get('type')}")
             print(f"Parsed cluster_id: {row_dict.get('cluster_id')}")
             print(f"Dict keys: {list(row_dict.keys())}")
-            print(f"Dict length: {len(row_dict)} vs expected: {len(header.split(','))}")
+            print(f"Dict length: {len(row_dict)} vs expected: {len(fieldnames)}")
             
             # Test parsing
             opinion_id = FreeLawCSVParser.parse_integer(row_dict.get('id', ''))
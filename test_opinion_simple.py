@@ -13,7 +13,7 @@ from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import OpinionType
 
 # Import the parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import import_opinions_html_aware
 
 def test_opinion_parsing():
     """Test opinion parsing with a small sample"""
@@ -12,7 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from courtfinder.storage import CourtFinderStorage
 
 # Import the parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import import_data_type, parse_person_row
 
 def test_people_import():
     """Test people import"""
@@ -20,9 +20,9 @@ def test_people_import():
     
     storage = CourtFinderStorage("real_data")
     
-    # Check current people count
-    stats = storage.get_storage_stats()
-    print(f"Current people: {stats.get('people', {}).get('total_items', 0)}")
+    # Check current people count (kept in memory by the id index, so no
+    # storage scan is needed before or after the import)
+    print(f"Current people: {storage.people.count()}")
     
     # Test importing people
     file_path = Path("downloads/people-db-people-2024-12-31.csv.bz2")
@@ -40,8 +40,7 @@ def test_people_import():
         print(f"❌ Failed: {result.get('error', 'Unknown error')}")
     
     # Check final people count
-    stats = storage.get_storage_stats()
-    print(f"\nFinal people: {stats.get('people', {}).get('total_items', 0)}")
+    print(f"\nFinal people: {storage.people.count()}")
 
 if __name__ == "__main__":
     test_people_import()
\ No newline at end of file
@@ -9,11 +9,12 @@ sys.path.insert(0, str(Path.cwd() / 'src'))
 from courtfinder.models import Person
 from datetime import datetime, date
 from typing import Dict, Optional
-import bz2
 import csv
 
+from csv_cache import open_csv_cached
+
 # Import parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import parse_person_row
 
 # Test with sample data
 test_row = {
@@ -54,7 +55,7 @@ except Exception as e:
 print("\n📥 Testing with actual file...")
 file_path = Path('downloads/people-db-people-2024-12-31.csv.bz2')
 if file_path.exists():
-    with bz2.open(file_path, 'rt', encoding='utf-8') as f:
+    with open_csv_cached(file_path, cache=False) as f:
         reader = csv.DictReader(f)
         success_count = 0
         error_count = 0
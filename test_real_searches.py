@@ -4,28 +4,43 @@ Test real searches on actual downloaded data
 Be 100% honest about what we find vs what we don't find
 """
 
+import os
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.main import CourtFinderCLI
+from courtfinder.search import CourtFinderSearch
+from courtfinder.storage import get_storage
+
+def iter_json_files(directory):
+    """Yield paths of *.json* files under directory, reusing scandir's entries"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_json_files(entry.path)
+            elif '.json' in entry.name:
+                yield entry.path
 
 def test_search_honestly():
     print("🔍 HONEST SEARCH TESTING")
     print("=" * 50)
     
-    # Initialize CLI with test data
-    cli = CourtFinderCLI("test_data")
+    # Open the test data storage and the search engine the CLI wraps
+    storage = get_storage("test_data")
+    search = CourtFinderSearch(storage)
     
     print("First, let's see what data we actually have loaded:")
-    stats = cli.get_stats()
+    stats = storage.get_storage_stats()
     print(f"📊 Storage stats:")
-    for data_type, stat in stats['storage_stats'].items():
+    for data_type, stat in stats.items():
         if isinstance(stat, dict) and 'total_items' in stat:
             print(f"  {data_type}: {stat['total_items']} items")
     
+    # Load everything once; the searches below then run from memory
+    search.build_text_index()
+    
     print("\n" + "=" * 50)
     print("TESTING REAL SEARCHES")
     print("=" * 50)
@@ -45,7 +60,7 @@ def test_search_honestly():
     
     for search_term in searches:
         try:
-            results = cli.search_courts(search_term, limit=5)
+            results = search.find_court_by_name(search_term)[:5]
             print(f"Search '{search_term}': {len(results)} results")
             for i, result in enumerate(results[:2], 1):
                 if hasattr(result, 'full_name'):
@@ -69,7 +84,7 @@ def test_search_honestly():
     
     for search_term in case_searches:
         try:
-            results = cli.search_cases(search_term, limit=5)
+            results = search.find_dockets_by_case_name(search_term)[:5]
             print(f"Search '{search_term}': {len(results)} results")
             for i, result in enumerate(results[:2], 1):
                 if hasattr(result, 'case_name'):
@@ -92,7 +107,7 @@ def test_search_honestly():
     
     for search_term in opinion_searches:
         try:
-            results = cli.search_opinions(search_term, limit=5)
+            results = search.find_opinions_by_text(search_term, 5)
             print(f"Search '{search_term}': {len(results)} results")
             for i, result in enumerate(results[:2], 1):
                 if hasattr(result, 'case_name'):
@@ -115,7 +130,7 @@ def test_search_honestly():
     
     for search_term in judge_searches:
         try:
-            results = cli.search_judges(search_term, limit=5)
+            results = search.find_person_by_name(search_term, fuzzy=True)[:5]
             print(f"Search '{search_term}': {len(results)} results")
             for i, result in enumerate(results[:2], 1):
                 if hasattr(result, 'name'):
@@ -133,7 +148,7 @@ def test_search_honestly():
     test_data_path = Path("test_data")
     if test_data_path.exists():
         print(f"📁 Test data directory exists: {test_data_path}")
-        for file in test_data_path.glob("**/*.json*"):
+        for file in iter_json_files(test_data_path):
             print(f"  📄 {file}")
     else:
         print("❌ No test_data directory found")
@@ -142,9 +157,11 @@ def test_search_honestly():
     downloads_path = Path("downloads")
     if downloads_path.exists():
         print(f"📁 Downloads directory exists: {downloads_path}")
-        for file in downloads_path.glob("*.bz2"):
-            size = file.stat().st_size
-            print(f"  📄 {file.name} ({size:,} bytes)")
+        with os.scandir(downloads_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.bz2'):
+                    size = entry.stat(follow_symlinks=False).st_size
+                    print(f"  📄 {entry.name} ({size:,} bytes)")
     else:
         print("❌ No downloads directory found")
     
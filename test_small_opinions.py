@@ -6,6 +6,7 @@ Test with small opinion file
 import sys
 import csv
 import io
+import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -16,7 +17,30 @@ from courtfinder.storage import CourtFinderStorage
 from courtfinder.models import OpinionType
 
 # Import the parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import OpinionCSVParser, parse_opinion_row
+
+# Per-record detail; run with -v to see it
+log = logging.getLogger(__name__)
+
+def parse_record(complete_row: str, expected_columns: List[str]) -> Optional[Dict[str, str]]:
+    """Parse one joined record, reporting its field count"""
+    try:
+        row_io = io.StringIO(complete_row)
+        csv_reader = csv.reader(
+            row_io,
+            quoting=csv.QUOTE_ALL,
+            skipinitialspace=True
+        )
+        
+        row_data = next(csv_reader)
+        log.debug("  → Parsed %d fields (expected %d)", len(row_data), len(expected_columns))
+        
+        if len(row_data) == len(expected_columns):
+            return dict(zip(expected_columns, row_data))
+            
+    except Exception as e:
+        log.debug("  → Parse error: %s", e)
+    return None
 
 def parse_small_file():
     """Parse the small test file"""
@@ -35,80 +59,23 @@ def parse_small_file():
         print(f"📝 CSV has {len(expected_columns)} columns")
         print(f"📝 Columns: {expected_columns}")
         
-        # Process lines to build complete rows
-        current_row_parts = []
-        in_record = False
+        # Split into records at each line that starts with a backtick, using
+        # the importer's str.find scan instead of a per-line state machine
         valid_rows = []
+        records = OpinionCSVParser.iter_record_texts(f)
+        next(records)  # Anything before the first record start
         
-        for line_num, line in enumerate(f, 1):
-            line = line.rstrip('\n\r')
-            
-            print(f"Line {line_num}: {line[:100]}...")
-            
-            # Check if this is the start of a new record
-            if line.startswith('`'):
-                print(f"  → New record starts")
-                
-                # If we were building a record, try to parse it
-                if in_record and current_row_parts:
-                    complete_row = ''.join(current_row_parts)
-                    print(f"  → Parsing previous record: {complete_row[:100]}...")
-                    
-                    try:
-                        row_io = io.StringIO(complete_row)
-                        csv_reader = csv.reader(
-                            row_io,
-                            quoting=csv.QUOTE_ALL,
-                            skipinitialspace=True
-                        )
-                        
-                        row_data = next(csv_reader)
-                        print(f"  → Parsed {len(row_data)} fields (expected {len(expected_columns)})")
-                        
-                        if len(row_data) == len(expected_columns):
-                            row_dict = dict(zip(expected_columns, row_data))
-                            print(f"  → Opinion ID: {row_dict.get('id')}")
-                            print(f"  → Opinion Type: {row_dict.get('type')}")
-                            valid_rows.append(row_dict)
-                            
-                    except Exception as e:
-                        print(f"  → Parse error: {e}")
-                
-                # Start new record
-                current_row_parts = [line]
-                in_record = True
-                
-            elif in_record:
-                # This is a continuation of the current record
-                print(f"  → Continuation of current record")
-                current_row_parts.append(line)
-            
-            # Stop after a few lines for testing
-            if line_num > 50:
-                break
-        
-        # Process the last record
-        if in_record and current_row_parts:
-            complete_row = ''.join(current_row_parts)
-            print(f"Final record: {complete_row[:100]}...")
+        for record_num, record_text in enumerate(records, 1):
+            # The newline before the next record is not part of this one
+            record_lines = record_text.count('\n') + (not record_text.endswith('\n'))
+            complete_row = record_text.replace('\n', '')
+            log.debug("Record %d (%d lines): %s...", record_num, record_lines, complete_row[:100])
             
-            try:
-                row_io = io.StringIO(complete_row)
-                csv_reader = csv.reader(
-                    row_io,
-                    quoting=csv.QUOTE_ALL,
-                    skipinitialspace=True
-                )
-                
-                row_data = next(csv_reader)
-                print(f"Final parsed {len(row_data)} fields")
-                
-                if len(row_data) == len(expected_columns):
-                    row_dict = dict(zip(expected_columns, row_data))
-                    valid_rows.append(row_dict)
-                    
-            except Exception as e:
-                print(f"Final parse error: {e}")
+            row_dict = parse_record(complete_row, expected_columns)
+            if row_dict is not None:
+                log.debug("  → Opinion ID: %s", row_dict.get('id'))
+                log.debug("  → Opinion Type: %s", row_dict.get('type'))
+                valid_rows.append(row_dict)
         
         print(f"\n✅ Found {len(valid_rows)} valid opinion rows")
         
@@ -132,4 +99,6 @@ def parse_small_file():
                 traceback.print_exc()
 
 if __name__ == "__main__":
+    logging.basicConfig(format='%(message)s',
+                        level=logging.DEBUG if '-v' in sys.argv[1:] else logging.WARNING)
     parse_small_file()
\ No newline at end of file
@@ -9,10 +9,13 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.storage import CourtFinderStorage
+from courtfinder.storage import BatchWriter, CourtFinderStorage
 
 # Import the parsing functions
-exec(open('import_ALL_freelaw_data_FIXED.py').read())
+from import_ALL_freelaw_data_FIXED import (
+    import_data_type, import_opinions_html_aware, parse_citation_row,
+    parse_docket_row, parse_opinion_cluster_row
+)
 
 def test_working_state():
     """Test that we can import a small amount of data successfully"""
@@ -26,10 +29,14 @@ def test_working_state():
     dockets_file = Path("downloads/dockets-2024-12-31.csv.bz2")
     if dockets_file.exists():
         print("📥 Testing dockets import...")
-        result = import_data_type(storage, dockets_file, "dockets", parse_docket_row, storage.save_docket, 100)
+        # Saved in batches, rewriting the indexes once per batch
+        save = BatchWriter(storage.save_dockets_bulk, batch_size=1000)
+        result = import_data_type(storage, dockets_file, "dockets", parse_docket_row, save, 100)
+        save.finish(result)
         
         if result['success']:
-            print(f"✅ Successfully imported {result['imported_count']} dockets")
+            print(f"✅ Successfully imported {result['imported_count']} dockets "
+                  f"({result['error_count']} errors)")
         else:
             print(f"❌ Failed: {result.get('error', 'Unknown error')}")
     
@@ -37,10 +44,13 @@ def test_working_state():
     clusters_file = Path("downloads/opinion-clusters-2024-12-31.csv.bz2")
     if clusters_file.exists():
         print("📥 Testing opinion clusters import...")
-        result = import_data_type(storage, clusters_file, "opinion_clusters", parse_opinion_cluster_row, storage.save_opinion_cluster, 100)
+        save = BatchWriter(storage.save_opinion_clusters_bulk, batch_size=1000)
+        result = import_data_type(storage, clusters_file, "opinion_clusters", parse_opinion_cluster_row, save, 100)
+        save.finish(result)
         
         if result['success']:
-            print(f"✅ Successfully imported {result['imported_count']} opinion clusters")
+            print(f"✅ Successfully imported {result['imported_count']} opinion clusters "
+                  f"({result['error_count']} errors)")
         else:
             print(f"❌ Failed: {result.get('error', 'Unknown error')}")
     
@@ -48,10 +58,13 @@ def test_working_state():
     citations_file = Path("downloads/citation-map-2025-07-02.csv.bz2")
     if citations_file.exists():
         print("📥 Testing citations import...")
-        result = import_data_type(storage, citations_file, "citations", parse_citation_row, storage.save_citation, 100)
+        save = BatchWriter(storage.save_citations_bulk, batch_size=1000)
+        result = import_data_type(storage, citations_file, "citations", parse_citation_row, save, 100)
+        save.finish(result)
         
         if result['success']:
-            print(f"✅ Successfully imported {result['imported_count']} citations")
+            print(f"✅ Successfully imported {result['imported_count']} citations "
+                  f"({result['error_count']} errors)")
         else:
             print(f"❌ Failed: {result.get('error', 'Unknown error')}")
     
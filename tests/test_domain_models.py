@@ -15,10 +15,11 @@ from src.domain.value_objects import (
 )
 from src.domain.services import (
     DataValidationService, ColumnCleaningService, 
-    DataParsingService, QueryService, RecordValidationService
+    DataParsingService, QueryService, RecordValidationService, InvertedIndex
 )
+from src.domain.events import EventStore, QueryExecuted, DataParsingCompleted
 from src.domain.test_data import TestDataFactory
-from src.storage.file_storage import FileStorage
+from src.storage.file_storage import FileStorage, DataNotFoundError, _RecordShard
 
 
 class TestValueObjects:
@@ -42,6 +43,20 @@ class TestValueObjects:
         assert updated.path == original.path
         assert updated.size == original.size
     
+    def test_data_file_exists_checks_filesystem(self):
+        """Test DataFile.exists follows files created and deleted later"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "later.txt")
+            data_file = DataFile(path=path)
+            assert not data_file.exists
+            
+            with open(path, 'w') as f:
+                f.write("data")
+            assert data_file.exists
+            
+            os.remove(path)
+            assert not data_file.exists
+    
     def test_data_range_validation(self):
         """Test DataRange validation"""
         # Valid range
@@ -72,6 +87,16 @@ class TestValueObjects:
         assert query.matches(data1) == True
         assert query.matches(data2) == False
     
+    def test_compiled_query_matches_query_params(self):
+        """Test compiled queries agree with QueryParams.matches"""
+        data = [{"name": "Smith vs Johnson"}, {"name": "smith"}, {"name": 42}, {"other": "x"}]
+        for operator in QueryOperator:
+            for value, case_sensitive in [("smith", False), ("Smith", True), ("^sm", False), ("42", False)]:
+                query = QueryParams(field="name", value=value, operator=operator,
+                                    case_sensitive=case_sensitive)
+                compiled = query.compile()
+                assert [compiled.matches(d) for d in data] == [query.matches(d) for d in data]
+    
     def test_column_cleaning_rule(self):
         """Test ColumnCleaningRule"""
         rule = ColumnCleaningRule(
@@ -110,6 +135,36 @@ class TestAggregates:
         dataset.update_file_status("/test/file.txt", DataFileStatus.DOWNLOADED)
         assert dataset.data_files[0].status == DataFileStatus.DOWNLOADED
     
+    def test_searchable_text_follows_edits(self):
+        """Test cached searchable text reflects same-length and direct edits"""
+        from types import SimpleNamespace
+        
+        record = TestDataFactory.create_sample_court_records()[0]
+        record.update_column_data(TestDataFactory.create_sample_columns_clean())
+        assert "Zebra" not in record.searchable_text
+        
+        record.column_data[1] = "Zebra"  # same length, in place
+        assert "Zebra" in record.searchable_text
+        record.parsed_data = {'note': "Quagga"}  # direct assignment
+        assert "Quagga" in record.searchable_text
+        
+        opinion = SimpleNamespace(plain_text="first ruling")
+        record.add_courtlistener_opinion(opinion)
+        assert "first ruling" in record.get_enhanced_searchable_text()
+        opinion.plain_text = "later ruling"
+        assert "later ruling" in record.get_enhanced_searchable_text()
+    
+    def test_new_aggregate_lists_are_mutable(self):
+        """Test list fields of new aggregates are independent lists"""
+        record = TestDataFactory.create_sample_court_records()[0]
+        other = TestDataFactory.create_sample_court_records()[1]
+        record.validation_errors.append("direct append")
+        record.courtlistener_opinions.append(object())
+        
+        assert isinstance(BulkDataSet(dataset_id="lists").data_files, list)
+        assert other.validation_errors == []
+        assert other.courtlistener_opinions == []
+    
     def test_bulk_dataset_validation(self):
         """Test BulkDataSet validation"""
         dataset = TestDataFactory.create_sample_bulk_dataset()
@@ -139,6 +194,35 @@ class TestAggregates:
         column_12 = problematic_record.column_data[12]
         assert "\x00" not in column_12  # Null bytes should be removed
     
+    def test_update_column_data_copies_by_default(self):
+        """Test the caller's column list is left untouched unless handed over"""
+        record = TestDataFactory.create_sample_court_records()[0]
+        columns = TestDataFactory.create_sample_columns_with_problems()
+        original = list(columns)
+        
+        record.update_column_data(columns)
+        assert columns == original
+        assert record.column_data is not columns
+        
+        record.update_column_data(columns, take_ownership=True)
+        assert record.column_data is columns
+    
+    def test_court_record_serialization_round_trip(self):
+        """Test CourtRecord dictionary and JSON bytes serialization"""
+        import json
+        record = TestDataFactory.create_sample_court_records()[0]
+        
+        data = json.loads(record.to_orjson_bytes())
+        assert data == record.to_dict()
+        assert data['created_at'] == record.created_at.isoformat()
+        
+        loaded = CourtRecord.from_dict(data)
+        assert loaded.record_id == record.record_id
+        assert loaded.created_at == record.created_at
+        
+        record.updated_at = datetime(2022, 1, 1)
+        assert record.to_dict()['updated_at'] == "2022-01-01T00:00:00"
+    
     def test_court_record_query_matching(self):
         """Test CourtRecord query matching"""
         records = TestDataFactory.create_sample_court_records()
@@ -149,6 +233,48 @@ class TestAggregates:
         
         query2 = QueryParams(field="jurisdiction", value="State", operator=QueryOperator.EQUALS)
         assert record.matches_query(query2) == False
+    
+    def test_field_values_match_iter_field_values(self):
+        """Test field_values picks one field without building searchable text"""
+        record = TestDataFactory.create_sample_court_records()[0]
+        record.parsed_data['jurisdiction'] = "federal"
+        
+        for name in ('jurisdiction', 'court_id', 'case_number', 'missing'):
+            assert record.field_values(name) == tuple(
+                value for field_name, value in record.iter_field_values() if field_name == name)
+        assert record.field_values('searchable_text') == (record.searchable_text,)
+
+
+class TestEventStore:
+    """Test domain event store"""
+    
+    def test_event_store_lookup_and_serialization(self):
+        """Test EventStore type lookup and dictionary conversion"""
+        store = EventStore()
+        store.append(QueryExecuted(aggregate_id="rec_001", query_field="jurisdiction",
+                                   query_value="Federal", matches=True))
+        store.append(DataParsingCompleted(aggregate_id="dataset_001", parsed_files=2))
+        
+        assert len(store.get_events_by_type("QueryExecuted")) == 1
+        assert store.get_events_by_type("DataValidationFailed") == []
+        assert len(store.get_events_for_aggregate("dataset_001")) == 1
+        assert store.get_events_for_aggregate("missing") == []
+        
+        data = store.to_dict()
+        assert [e['event_type'] for e in data['events']] == ["QueryExecuted", "DataParsingCompleted"]
+        assert data['events'][1]['parsed_files'] == 2
+        
+        # Changing a returned dict must not leak into later serializations
+        data['events'][1]['parsed_files'] = 99
+        assert store.to_dict()['events'][1]['parsed_files'] == 2
+        
+        # Events are frozen, so the memoized dictionary cannot go stale
+        with pytest.raises(AttributeError):
+            store.events[1].parsed_files = 3
+        
+        store.clear()
+        assert store.get_events_by_type("QueryExecuted") == []
+        assert store.get_events_for_aggregate("rec_001") == []
 
 
 class TestServices:
@@ -167,6 +293,32 @@ class TestServices:
         errors = DataValidationService.validate_dataset(problematic)
         assert len(errors) > 0
     
+    def test_validate_column_data(self):
+        """Test column validation for null bytes and control characters"""
+        errors = DataValidationService.validate_column_data(
+            ["clean\ttext\r\n", "a\x00b", "\x01\x02ab", None]
+        )
+        
+        assert errors == [
+            "Column 1 contains null bytes",
+            "Column 1 contains excessive control characters",
+            "Column 2 contains excessive control characters",
+            "Column 3 is None",
+        ]
+    
+    def test_validate_column_data_batch(self):
+        """Test batch column validation matches per-record validation"""
+        rows = [
+            TestDataFactory.create_sample_columns_clean(),
+            TestDataFactory.create_sample_columns_with_problems(),
+            ["ok", None],
+        ]
+        
+        assert DataValidationService.validate_column_data_batch(rows) == [
+            DataValidationService.validate_column_data(columns) for columns in rows
+        ]
+        assert DataValidationService.validate_column_data_batch(rows[:1]) == [[]]
+    
     def test_column_cleaning_service(self):
         """Test ColumnCleaningService"""
         records = TestDataFactory.create_sample_court_records()
@@ -182,6 +334,21 @@ class TestServices:
                 assert "\x00" not in column_data
                 assert column_data.strip() == column_data  # Should be trimmed
     
+    def test_column_cleaning_batch(self):
+        """Test batch cleaning matches per-record cleaning"""
+        expected = [
+            ColumnCleaningService.clean_record_columns(record).column_data
+            for record in TestDataFactory.create_sample_court_records()
+        ]
+        
+        records = ColumnCleaningService.clean_columns_batch(
+            TestDataFactory.create_sample_court_records()
+        )
+        
+        assert [record.column_data for record in records] == expected
+        assert len(records[1].get_events()) == 1
+        assert len(records[0].get_events()) == 0
+    
     def test_data_parsing_service(self):
         """Test DataParsingService"""
         # Test line parsing
@@ -197,6 +364,48 @@ class TestServices:
         assert record.record_id == "rec_001"
         assert record.case_metadata.case_number == "3:21-cv-00123"
     
+    def test_compiled_row_parser_matches_generic(self):
+        """Test compiled row parsers agree with the generic parser"""
+        from src.domain.test_data import SAMPLE_FIELD_MAPPINGS
+        
+        rows = [
+            TestDataFactory.create_sample_columns_clean(),
+            TestDataFactory.create_sample_columns_with_problems(),
+            TestDataFactory.create_sample_columns_clean()[:15],  # falls back
+        ]
+        for mapping in SAMPLE_FIELD_MAPPINGS.values():
+            for columns in rows:
+                compiled = DataParsingService.parse_columns_to_record(list(columns), mapping)
+                generic = DataParsingService._parse_columns_generic(list(columns), mapping)
+                
+                assert compiled.parsed_data == generic.parsed_data
+                assert compiled.court_identifier == generic.court_identifier
+                assert compiled.case_metadata == generic.case_metadata
+    
+    def test_row_parser_cached_by_mapping_contents(self):
+        """Test equal field mappings share one compiled parser"""
+        from src.domain.services import _cached_row_parser
+        
+        mapping = DataParsingService.STANDARD_FIELD_MAPPING
+        parser = DataParsingService.get_row_parser(mapping)
+        for _ in range(100):
+            assert DataParsingService.get_row_parser(dict(mapping)) is parser
+        assert _cached_row_parser.cache_info().maxsize is not None
+    
+    def test_parties_formatting(self):
+        """Test parties are combined without trimming party names"""
+        columns = TestDataFactory.create_sample_columns_clean()
+        columns[12], columns[13] = "Sam Davis", "Jones"
+        assert DataParsingService.parse_columns_to_record(columns).case_metadata.parties == "Sam Davis vs Jones"
+        
+        columns[12] = ""
+        assert DataParsingService.parse_columns_to_record(columns).case_metadata.parties == "Jones"
+        
+        columns[13] = ""
+        assert DataParsingService.parse_columns_to_record(columns).case_metadata.parties is None
+        
+        assert DataParsingService.parse_columns_to_record(columns[:13] + ["Vass"]).case_metadata.parties == "Vass"
+    
     def test_query_service(self):
         """Test QueryService"""
         # Test query building
@@ -210,6 +419,25 @@ class TestServices:
         assert text_query.field == "searchable_text"
         assert text_query.value == "Smith"
     
+    def test_inverted_index_search(self):
+        """Test inverted index search agrees with a linear scan"""
+        records = [
+            RecordValidationService.validate_and_enrich_record(record)
+            for record in TestDataFactory.create_sample_court_records()
+        ]
+        index = InvertedIndex(records)
+        
+        queries = TestDataFactory.create_sample_query_params() + [
+            QueryService.build_query("court_name", "strict Court of"),
+            QueryService.build_query("searchable_text", "smith"),
+            QueryService.build_query("parties", "Doe vs R"),
+            QueryService.build_query("jurisdiction", "Fed", "starts_with"),
+            QueryService.build_query("missing_field", "x"),
+        ]
+        for query in queries:
+            expected = QueryService.execute_search(iter(records), query)
+            assert [r.record_id for r in index.search(query)] == [r.record_id for r in expected]
+    
     def test_record_validation_service(self):
         """Test RecordValidationService"""
         records = TestDataFactory.create_sample_court_records()
@@ -218,8 +446,10 @@ class TestServices:
         # Validate and enrich
         enriched = RecordValidationService.validate_and_enrich_record(record)
         
-        # Should have searchable text
-        assert "searchable_text" in enriched.parsed_data
+        # Should have searchable text, computed on demand
+        assert "searchable_text" not in enriched.parsed_data
+        assert "Smith vs Johnson" in enriched.searchable_text
+        assert enriched.matches_query(QueryService.build_text_search_query("smith vs johnson"))
         assert enriched.parsed_data["has_parties"] == True
         assert enriched.parsed_data["column_count"] == len(record.column_data)
 
@@ -229,13 +459,13 @@ class TestFileStorage:
     
     def setup_method(self):
         """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.temp_dir = self._temp.name
         self.storage = FileStorage(self.temp_dir)
     
     def teardown_method(self):
         """Cleanup test environment"""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        self._temp.cleanup()
     
     def test_dataset_storage(self):
         """Test dataset storage operations"""
@@ -282,6 +512,41 @@ class TestFileStorage:
         assert len(results) == 2
         assert all(r.court_identifier.jurisdiction == "Federal" for r in results)
     
+    def test_equals_search_index_tracks_updates(self):
+        """Test EQUALS searches see records saved or deleted after indexing"""
+        records = TestDataFactory.create_sample_court_records()
+        self.storage.save_records_batch(records)
+        query = QueryParams(field="jurisdiction", value="federal", operator=QueryOperator.EQUALS)
+        
+        scanned = [r.record_id for r in records if r.matches_query(query)]
+        assert [r.record_id for r in self.storage.search_records(query)] == sorted(
+            scanned, key=lambda rid: self.storage._record_index[rid])
+        
+        self.storage.delete_record(scanned[0])
+        results = [r.record_id for r in self.storage.search_records(query)]
+        assert scanned[0] not in results
+        assert len(results) == len(scanned) - 1
+        assert len(list(self.storage.search_records(query, limit=1))) == 1
+    
+    def test_equals_search_index_follows_other_instance(self):
+        """Test EQUALS searches in both case modes see another instance's writes"""
+        records = TestDataFactory.create_sample_court_records()
+        records[1].parsed_data['court_id'] = "Ca9"
+        self.storage.save_records_batch(records[:1])
+        other = FileStorage(self.temp_dir)
+        folded = QueryParams(field="court_id", value="CA9", operator=QueryOperator.EQUALS)
+        exact = QueryParams(field="court_id", value="Ca9", operator=QueryOperator.EQUALS,
+                            case_sensitive=True)
+        assert list(self.storage.search_records(folded)) == []
+        
+        other.save_records_batch(records[1:2])
+        assert [r.record_id for r in self.storage.search_records(folded)] == [records[1].record_id]
+        assert [r.record_id for r in self.storage.search_records(exact)] == [records[1].record_id]
+        
+        other.delete_record(records[1].record_id)
+        assert list(self.storage.search_records(folded)) == []
+        assert not self.storage._value_indexes['court_id'].pending
+    
     def test_batch_operations(self):
         """Test batch storage operations"""
         records = TestDataFactory.create_sample_court_records()
@@ -297,6 +562,137 @@ class TestFileStorage:
         all_records = list(self.storage.get_all_records())
         assert len(all_records) == len(records)
     
+    def test_batch_save_from_own_scan(self):
+        """Test re-saving get_all_records() into the same storage completes"""
+        records = TestDataFactory.create_sample_court_records()
+        self.storage.save_records_batch(records)
+        self.storage.SAVE_CHUNK_SIZE = 2
+        
+        self.storage.save_records_batch(self.storage.get_all_records())
+        
+        assert self.storage.count_records() == len(records)
+        assert FileStorage(self.temp_dir).count_records() == len(records)
+    
+    def test_sharded_records_survive_reopen(self):
+        """Test overwrites and deletes are replayed from the shards on reopen"""
+        records = TestDataFactory.create_sample_court_records()
+        self.storage.save_records_batch(records)
+        
+        records[0].case_metadata = CaseMetadata(case_number="UPDATED-1")
+        self.storage.save_record(records[0])
+        self.storage.delete_record(records[1].record_id)
+        self.storage.flush()
+        
+        reopened = FileStorage(self.temp_dir)
+        assert reopened.count_records() == len(records) - 1
+        assert reopened.load_record(records[0].record_id).case_metadata.case_number == "UPDATED-1"
+        with pytest.raises(DataNotFoundError):
+            reopened.load_record(records[1].record_id)
+    
+    def test_deferred_writes_synced_by_flush_and_close(self):
+        """Test deferred-sync writes reach disk on flush() and close()"""
+        records = TestDataFactory.create_sample_court_records()
+        storage = FileStorage(self.temp_dir, deferred_sync=True)
+        
+        storage.save_record(records[0])
+        storage.flush()
+        assert not storage._dirty_shards
+        assert FileStorage(self.temp_dir).load_record(records[0].record_id)
+        
+        storage.save_record(records[1])
+        storage.close()
+        assert not storage._dirty_shards
+        assert FileStorage(self.temp_dir).load_record(records[1].record_id)
+    
+    def test_torn_frame_is_cut_off_by_next_append(self):
+        """Test records appended after an interrupted write survive later reopens"""
+        records = TestDataFactory.create_sample_court_records()
+        self.storage.save_records_batch(records[:1])
+        shard_path = self.storage._shard(self.storage._shard_for(records[0].record_id)).path
+        with open(shard_path, 'ab') as f:
+            f.write(b'\x10\x00\x00')  # half a frame header
+        size = shard_path.stat().st_size
+        
+        reopened = FileStorage(self.temp_dir)
+        assert shard_path.stat().st_size == size
+        later = TestDataFactory.create_sample_court_records()[0]
+        later.record_id = records[0].record_id
+        later.case_metadata = CaseMetadata(case_number="AFTER-TEAR")
+        reopened.save_records_batch([later])
+        
+        again = FileStorage(self.temp_dir)
+        assert again.load_record(later.record_id).case_metadata.case_number == "AFTER-TEAR"
+    
+    def test_reader_leaves_frame_being_written(self):
+        """Test opening a shard mid-append neither cuts the frame nor hides it"""
+        record, later = TestDataFactory.create_sample_court_records()[:2]
+        later.record_id = record.record_id
+        later.case_metadata = CaseMetadata(case_number="MID-WRITE")
+        self.storage.save_records_batch([record])
+        shard_path = self.storage._shard(self.storage._shard_for(record.record_id)).path
+        frame = _RecordShard.encode_frame(record.record_id.encode('utf-8'), later.to_orjson_bytes())
+        size = shard_path.stat().st_size
+        
+        with open(shard_path, 'ab') as f:
+            f.write(frame[:len(frame) // 2])
+            f.flush()
+            reader = FileStorage(self.temp_dir)
+            assert reader.load_record(record.record_id).case_metadata.case_number != "MID-WRITE"
+            f.write(frame[len(frame) // 2:])
+        
+        assert shard_path.stat().st_size == size + len(frame)
+        assert reader.load_record(record.record_id).case_metadata.case_number == "MID-WRITE"
+    
+    def test_second_instance_sees_new_records(self):
+        """Test an open instance picks up records another instance saved"""
+        records = TestDataFactory.create_sample_court_records()
+        other = FileStorage(self.temp_dir)
+        assert other.count_records() == 0
+        
+        self.storage.save_records_batch(records)
+        assert other.count_records() == len(records)
+        assert other.load_record(records[0].record_id).record_id == records[0].record_id
+    
+    def test_compaction_drops_overwritten_records(self):
+        """Test compaction shrinks shards and keeps the latest records"""
+        record = TestDataFactory.create_sample_court_records()[0]
+        for _ in range(20):
+            self.storage.save_records_batch([record])
+        shard_path = self.storage._shard(self.storage._shard_for(record.record_id)).path
+        size_before = shard_path.stat().st_size
+        
+        self.storage.compact_records()
+        
+        assert shard_path.stat().st_size * 10 < size_before
+        assert FileStorage(self.temp_dir).load_record(record.record_id).record_id == record.record_id
+        assert self.storage.load_record(record.record_id).record_id == record.record_id
+    
+    def test_legacy_records_migrate_on_open(self):
+        """Test legacy JSON records are copied into the shards when opened"""
+        import json
+        
+        records = TestDataFactory.create_sample_court_records()
+        legacy_files = []
+        for record in records[:2]:
+            legacy_file = Path(self.temp_dir) / "records" / f"{record.record_id}.json"
+            legacy_file.write_text(json.dumps(record.to_dict()))
+            legacy_files.append(legacy_file)
+        
+        # A legacy-only directory opens with its records, files left in place
+        storage = FileStorage(self.temp_dir)
+        assert storage.count_records() == 2
+        assert storage.load_record(records[0].record_id).record_id == records[0].record_id
+        assert all(f.exists() for f in legacy_files)
+        
+        # A deleted record stays deleted on the next open
+        storage.delete_record(records[0].record_id)
+        assert not legacy_files[0].exists()
+        assert FileStorage(self.temp_dir).count_records() == 1
+        
+        assert storage.migrate_legacy_records(remove_originals=True) == 0
+        assert not legacy_files[1].exists()
+        assert FileStorage(self.temp_dir).count_records() == 1
+    
     def test_storage_stats(self):
         """Test storage statistics"""
         dataset = TestDataFactory.create_sample_bulk_dataset()
@@ -321,7 +717,8 @@ class TestIntegration:
     
     def setup_method(self):
         """Setup test environment"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.temp_dir = self._temp.name
         self.storage = FileStorage(self.temp_dir)
         self.test_file = os.path.join(self.temp_dir, "test_data.txt")
         
@@ -330,8 +727,7 @@ class TestIntegration:
     
     def teardown_method(self):
         """Cleanup test environment"""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        self._temp.cleanup()
     
     def test_complete_data_processing_workflow(self):
         """Test complete data processing workflow"""
@@ -367,6 +763,70 @@ class TestIntegration:
         assert len(results) >= 1
         assert all(r.court_identifier.jurisdiction == "Federal" for r in results)
     
+    def test_columnar_parsing_and_search(self):
+        """Test columnar batch parsing and search match the record path"""
+        batch = DataParsingService.parse_raw_data_file_columnar(self.test_file)
+        records = list(DataParsingService.parse_raw_data_file(self.test_file))
+        
+        assert len(batch) == len(records)
+        assert batch.row(1).to_dict()['parsed_data'] == records[1].parsed_data
+        
+        for query in TestDataFactory.create_sample_query_params():
+            expected = QueryService.execute_search(iter(records), query)
+            found = QueryService.execute_columnar_search(batch, query)
+            assert [r.record_id for r in found] == [r.record_id for r in expected]
+    
+    def test_columnar_text_search_matches_record_path(self):
+        """Test searchable_text queries give the same rows on both search paths"""
+        batch = DataParsingService.parse_raw_data_file_columnar(self.test_file)
+        records = list(DataParsingService.parse_raw_data_file(self.test_file))
+        query = QueryService.build_text_search_query(records[0].case_metadata.case_number)
+        
+        expected = QueryService.execute_search(iter(records), query)
+        found = QueryService.execute_columnar_search(batch, query)
+        
+        assert expected
+        assert [r.record_id for r in found] == [r.record_id for r in expected]
+    
+    def test_batch_enrichment_matches_record_path(self):
+        """Test columnar enrichment gives the fields record enrichment adds"""
+        batch = RecordValidationService.enrich_batch(
+            DataParsingService.parse_raw_data_file_columnar(self.test_file))
+        records = [RecordValidationService._enrich_record(record)
+                   for record in DataParsingService.parse_raw_data_file(self.test_file)]
+        
+        assert [batch.row(i).parsed_data for i in range(len(batch))] == [
+            r.parsed_data for r in records]
+        
+        query = QueryParams(field="column_count", value=str(len(records[0].column_data)),
+                            operator=QueryOperator.EQUALS)
+        assert [batch.row(i).record_id for i in batch.matching_rows(query)] == [
+            r.record_id for r in QueryService.execute_search(iter(records), query)]
+    
+    def test_enriched_records_stream_into_storage(self):
+        """Test the one-pass parse and enrich matches the step-by-step workflow"""
+        stepwise = [RecordValidationService.validate_and_enrich_record(record)
+                    for record in DataParsingService.parse_raw_data_file(self.test_file)]
+        
+        self.storage.save_records_batch(DataParsingService.parse_enriched_records(self.test_file))
+        stored = {r.record_id: r for r in self.storage.get_all_records()}
+        
+        assert len(stored) == len(stepwise)
+        for record in stepwise:
+            assert stored[record.record_id].parsed_data == record.parsed_data
+            assert stored[record.record_id].column_data == record.column_data
+    
+    def test_block_reader_matches_text_mode(self):
+        """Test block-wise line reading matches text-mode iteration"""
+        from src.domain.services import _read_lines
+        
+        with open(self.test_file, 'r', encoding='utf-8', errors='ignore') as f:
+            expected = [line.strip() for line in f]
+        
+        for block_size in (1, 5, 1 << 22):
+            lines = [line.strip() for _, line in _read_lines(self.test_file, block_size)]
+            assert lines == expected
+    
     def test_error_handling_workflow(self):
         """Test error handling in workflows"""
         # Test with problematic dataset
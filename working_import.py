@@ -5,16 +5,23 @@ Working import script based on the successful test
 
 import sys
 import csv
-import bz2
+import re
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from courtfinder.storage import CourtFinderStorage
+from courtfinder.storage import BatchWriter, CourtFinderStorage
 from courtfinder.models import Docket, OpinionCluster, Opinion, Citation, OpinionType
+from csv_cache import open_csv_cached
+
+# FreeLaw timestamp layouts that fromisoformat reads exactly as the
+# strptime formats in WorkingCSVParser.parse_datetime do
+_ISO_DATETIME = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}(?: [0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{6})?)?')
 
 class WorkingCSVParser:
     """Simple CSV parser that works"""
@@ -22,7 +29,15 @@ class WorkingCSVParser:
     @staticmethod
     def clean_value(value: str) -> str:
         """Remove backticks that FreeLaw wraps around all values"""
-        if isinstance(value, str) and value.startswith('`') and value.endswith('`'):
+        if isinstance(value, str) and value:
+            return WorkingCSVParser.strip_backticks(value)
+        return value
+    
+    @staticmethod
+    def strip_backticks(value: str) -> str:
+        """clean_value for a string known to be non-empty, as in the parse_* methods"""
+        # Comparing single characters is cheaper than startswith/endswith calls
+        if value[0] == '`' and value[-1] == '`':
             return value[1:-1]
         return value
     
@@ -32,7 +47,7 @@ class WorkingCSVParser:
         if not value or value.strip() == '':
             return None
         
-        value = WorkingCSVParser.clean_value(value).strip()
+        value = WorkingCSVParser.strip_backticks(value).strip()
         if not value:
             return None
         
@@ -46,7 +61,12 @@ class WorkingCSVParser:
         """Parse string value"""
         if not value:
             return ''
-        return WorkingCSVParser.clean_value(value)
+        return WorkingCSVParser.strip_backticks(value)
+    
+    @staticmethod
+    def parse_code(value: str) -> str:
+        """Parse a low-cardinality string (court id, source), interned so rows share one object"""
+        return sys.intern(WorkingCSVParser.parse_string(value))
     
     @staticmethod
     def parse_boolean(value: str) -> bool:
@@ -54,7 +74,7 @@ class WorkingCSVParser:
         if not value or value.strip() == '':
             return False
         
-        value = WorkingCSVParser.clean_value(value).strip().lower()
+        value = WorkingCSVParser.strip_backticks(value).strip().lower()
         return value in ['true', 't', '1', 'yes', 'y']
     
     @staticmethod
@@ -63,7 +83,7 @@ class WorkingCSVParser:
         if not value or value.strip() == '':
             return None
         
-        value = WorkingCSVParser.clean_value(value).strip()
+        value = WorkingCSVParser.strip_backticks(value).strip()
         if not value:
             return None
         
@@ -74,6 +94,14 @@ class WorkingCSVParser:
             elif value.endswith('Z'):
                 value = value[:-1]
             
+            # The usual fixed-width layouts go through C-implemented
+            # fromisoformat; anything else falls back to strptime below
+            if _ISO_DATETIME.fullmatch(value):
+                try:
+                    return datetime.fromisoformat(value)
+                except ValueError:
+                    pass
+            
             # Try different datetime formats
             formats = [
                 '%Y-%m-%d %H:%M:%S.%f',
@@ -91,15 +119,25 @@ class WorkingCSVParser:
         except Exception:
             return None
 
+# The docket columns parse_docket_values_working takes, in this order
+_DOCKET_COLUMNS = ('id', 'court_id', 'case_name', 'docket_number', 'source',
+                   'date_created', 'date_modified')
+
 def parse_docket_row_working(row: Dict[str, str]) -> Docket:
     """Parse a docket row - working version"""
+    return parse_docket_values_working(tuple(row.get(name, '') for name in _DOCKET_COLUMNS))
+
+def parse_docket_values_working(values: Tuple[str, ...]) -> Docket:
+    """Parse docket column values given in _DOCKET_COLUMNS order"""
     
     # Extract required fields
-    docket_id = WorkingCSVParser.parse_integer(row.get('id', ''))
-    court_id = WorkingCSVParser.parse_string(row.get('court_id', ''))
-    case_name = WorkingCSVParser.parse_string(row.get('case_name', ''))
-    docket_number = WorkingCSVParser.parse_string(row.get('docket_number', ''))
-    source = WorkingCSVParser.parse_string(row.get('source', ''))
+    (raw_id, raw_court_id, raw_case_name, raw_docket_number, raw_source,
+     raw_date_created, raw_date_modified) = values
+    docket_id = WorkingCSVParser.parse_integer(raw_id)
+    court_id = WorkingCSVParser.parse_code(raw_court_id)
+    case_name = WorkingCSVParser.parse_string(raw_case_name)
+    docket_number = WorkingCSVParser.parse_string(raw_docket_number)
+    source = WorkingCSVParser.parse_code(raw_source)
     
     # Validate required fields
     if not docket_id:
@@ -112,8 +150,8 @@ def parse_docket_row_working(row: Dict[str, str]) -> Docket:
         raise ValueError("Docket number is required")
     
     # Parse date fields
-    date_created = WorkingCSVParser.parse_datetime(row.get('date_created', ''))
-    date_modified = WorkingCSVParser.parse_datetime(row.get('date_modified', ''))
+    date_created = WorkingCSVParser.parse_datetime(raw_date_created)
+    date_modified = WorkingCSVParser.parse_datetime(raw_date_modified)
     
     # Create Docket object with minimal fields
     return Docket(
@@ -139,31 +177,48 @@ def import_dockets_working(storage: CourtFinderStorage, limit: int = 5000) -> Di
     imported_count = 0
     error_count = 0
     
+    # Dockets are saved 1000 at a time, rewriting the indexes once per batch,
+    # on a writer thread so saving one batch overlaps parsing the next
+    save_dockets = BatchWriter(storage.save_dockets_bulk, batch_size=1000, max_pending=2)
+    
     try:
-        with bz2.open(file_path, 'rt', encoding='utf-8') as f:
-            reader = csv.DictReader(f, quoting=csv.QUOTE_MINIMAL)
+        # Reads a zstd mirror or decompressed copy when one is up to date
+        with open_csv_cached(file_path, cache=False) as f:
+            reader = csv.reader(f, quoting=csv.QUOTE_MINIMAL)
+            header = next(reader, [])
+            
+            # Pick the seven columns the parser needs by position instead of
+            # building a dict per row; a column missing from the header (or
+            # a short row) reads as the '' padded onto each row
+            missing = len(header)
+            pick = itemgetter(*(header.index(name) if name in header else missing
+                                for name in _DOCKET_COLUMNS))
+            
+            # Blank lines are skipped, as csv.DictReader does
+            rows = (values for values in reader if values)
             
-            for row_num, row in enumerate(reader, 1):
-                if row_num > limit:
-                    break
-                
+            for row_num, values in enumerate(islice(rows, limit), 1):
                 try:
+                    values += [''] * (missing + 1 - len(values))
+                    
                     # Parse the row
-                    docket = parse_docket_row_working(row)
+                    docket = parse_docket_values_working(pick(values))
                     
                     # Save to storage
-                    storage.save_docket(docket)
+                    save_dockets(docket)
                     
                     imported_count += 1
                     
                     if imported_count % 100 == 0:
-                        print(f"  📊 Imported {imported_count} dockets...")
+                        print(f"  📊 Queued {imported_count} dockets...")
                     
                 except Exception as e:
                     error_count += 1
                     if error_count <= 5:
                         print(f"  ❌ Error processing row {row_num}: {e}")
                     continue
+            
+            save_dockets.flush()
     
     except Exception as e:
         return {
@@ -173,6 +228,14 @@ def import_dockets_working(storage: CourtFinderStorage, limit: int = 5000) -> Di
             'error_count': error_count
         }
     
+    finally:
+        save_dockets.close()
+    
+    # Dockets the batch save could not write count as errors, not imports
+    unsaved = save_dockets.unsaved
+    imported_count -= unsaved
+    error_count += unsaved
+    
     print(f"✅ Successfully imported {imported_count} dockets ({error_count} errors)")
     return {
         'success': True,